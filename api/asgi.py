@@ -0,0 +1,314 @@
+# api/asgi.py - ASGI entry point (non-blocking Supabase I/O)
+#
+# Serves the same /api/todos contract as api/index.py, but every Supabase call
+# is awaited on a shared, pooled keep-alive HTTP client, so one process can
+# keep hundreds of requests in flight. Run it with any ASGI server, e.g.:
+#
+#     uvicorn api.asgi:app --host 0.0.0.0 --port 8000
+#
+# It is also the push channel: /api/todos/events streams every write made
+# through this process, and an open stream costs a buffer and two pending
+# awaits rather than a thread, so one process holds thousands of them. Serve
+# the API from a single process of this app (or at least route /api/todos/*
+# writes, /changes and /events to the same one) to push every write.
+
+import asyncio
+import json
+import math
+import os
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs
+from dotenv import load_dotenv
+
+from src.application.interfaces import IAsyncTodoRepository
+from src.domain.async_use_cases import (
+    AsyncGetTodosUseCase,
+    AsyncGetTodoChangesUseCase,
+    AsyncCreateTodoUseCase,
+    AsyncUpdateTodoUseCase,
+    AsyncDeleteTodoUseCase
+)
+from src.domain.entities import Todo
+from src.domain.exceptions import BackendUnavailableError, InvalidInputError, TodoNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.event_hub import EventHub
+from src.infrastructure.repositories.async_resilient_repo import AsyncResilientTodoRepository
+from src.infrastructure.repositories.async_supabase_repo import (
+    AsyncSupabaseTodoRepository,
+    create_postgrest_client
+)
+from src.infrastructure.repositories.async_versioned_repo import AsyncVersionedTodoRepository
+from src.interface_adapters.events import TodoEventPublisher, format_sse
+from src.interface_adapters.serializers import change_set_to_json
+
+# --- 1. Configuration ---
+
+# Load .env for local running
+load_dotenv()
+
+SUPABASE_URL = os.environ.get("SUPABASE_URL")
+SUPABASE_KEY = os.environ.get("SUPABASE_KEY")
+HTTP_MAX_CONNECTIONS = int(os.environ.get("TODO_HTTP_MAX_CONNECTIONS", "100"))
+# Backend guard, same settings as api/index.py: per-call timeout (0 disables it), read retries, circuit breaker
+BACKEND_TIMEOUT_SECONDS = float(os.environ.get("TODO_BACKEND_TIMEOUT_SECONDS", "5"))
+BACKEND_READ_RETRIES = int(os.environ.get("TODO_BACKEND_READ_RETRIES", "2"))
+BREAKER_FAILURES = int(os.environ.get("TODO_BREAKER_FAILURES", "5"))
+BREAKER_RESET_SECONDS = float(os.environ.get("TODO_BREAKER_RESET_SECONDS", "30"))
+# Writes kept for delta sync; clients further behind reload the full list
+CHANGE_LOG_SIZE = int(os.environ.get("TODO_CHANGE_LOG_SIZE", "10000"))
+# Server-sent events: subscribers per process, and messages a subscriber may fall behind before being dropped
+SSE_MAX_SUBSCRIBERS = int(os.environ.get("TODO_SSE_MAX_SUBSCRIBERS", "5000"))
+SSE_BUFFER_SIZE = int(os.environ.get("TODO_SSE_BUFFER_SIZE", "64"))
+# Seconds between keep-alive comments on an idle event stream (keeps proxies from closing it)
+SSE_KEEPALIVE_SECONDS = 15
+
+
+def _todo_to_dict(todo: Todo) -> dict:
+    return {'id': todo.id, 'task': todo.task, 'is_complete': todo.is_complete}
+
+
+# --- 2. ASGI Application ---
+
+class TodoASGIApp:
+    """A dependency-free ASGI application wiring the async use cases to HTTP."""
+
+    def __init__(self, repository_factory: Callable[[], IAsyncTodoRepository],
+                 max_subscribers: int = SSE_MAX_SUBSCRIBERS, sse_buffer_size: int = SSE_BUFFER_SIZE,
+                 keepalive_seconds: float = SSE_KEEPALIVE_SECONDS, change_log_size: int = CHANGE_LOG_SIZE):
+        self._repository_factory = repository_factory
+        self.repository: Optional[AsyncVersionedTodoRepository] = None
+        self.event_hub = EventHub(max_subscribers=max_subscribers, max_buffer=sse_buffer_size)
+        self.keepalive_seconds = keepalive_seconds
+        self.change_log_size = change_log_size
+
+    def _wire(self) -> None:
+        # The repository (and its connection pool) is created once per process; every write
+        # through it is logged for delta sync and pushed to the event stream subscribers
+        self.repository = AsyncVersionedTodoRepository(self._repository_factory(), max_changes=self.change_log_size)
+        self.repository.add_change_listener(TodoEventPublisher(self.event_hub))
+        self.get_todos_uc = AsyncGetTodosUseCase(repository=self.repository)
+        self.get_changes_uc = AsyncGetTodoChangesUseCase(repository=self.repository)
+        self.create_todo_uc = AsyncCreateTodoUseCase(repository=self.repository)
+        self.update_todo_uc = AsyncUpdateTodoUseCase(repository=self.repository)
+        self.delete_todo_uc = AsyncDeleteTodoUseCase(repository=self.repository)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self._lifespan(receive, send)
+        if scope['type'] != 'http':
+            return
+
+        body = await self._read_body(receive)
+        if self.repository is None:
+            try:
+                self._wire()
+            except Exception as e:
+                # Not configured (or no lifespan to report it at startup): retried on the next request
+                print(f"Failed to wire the storage backend: {e}")
+                return await self._respond(send, 503, {"error": "Storage backend is unavailable, try again later."},
+                                           [(b'retry-after', b'30')])
+        if scope['path'] == '/api/todos/events' and scope['method'] == 'GET':
+            return await self._stream_events(receive, send)
+        headers: List[Tuple[bytes, bytes]] = []
+        try:
+            status, payload = await self._dispatch(scope, body)
+        except BackendUnavailableError as e:
+            # Temporary: tell clients when to come back instead of failing with a 500
+            status, payload = 503, {"error": str(e)}
+            headers.append((b'retry-after', str(max(1, math.ceil(e.retry_after or 0))).encode()))
+        except InvalidInputError as e:
+            # E.g. a request the storage backend rejected: the client's fault, not ours
+            status, payload = 400, {"error": str(e)}
+        except Exception as e:
+            print(f"Error handling {scope['method']} {scope['path']}: {e}")
+            status, payload = 500, {"error": "Internal server error."}
+        await self._respond(send, status, payload, headers)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    self._wire()
+                except Exception as e:
+                    # The server reports the message and exits instead of serving 503s
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                # End the event streams, so the server is not left waiting on them
+                self.event_hub.close()
+                if self.repository is not None:
+                    await self.repository.aclose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body'):
+                return b''.join(chunks)
+
+    @staticmethod
+    async def _respond(send, status: int, payload, headers: List[Tuple[bytes, bytes]] = ()) -> None:
+        if payload is None:
+            data, content_type = b'', b'application/json'
+        elif isinstance(payload, bytes):
+            data, content_type = payload, b'application/json'   # Already serialized
+        elif isinstance(payload, str):
+            data, content_type = payload.encode('utf-8'), b'text/plain; charset=utf-8'
+        else:
+            data, content_type = json.dumps(payload).encode('utf-8'), b'application/json'
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', content_type), (b'content-length', str(len(data)).encode()), *headers],
+        })
+        await send({'type': 'http.response.body', 'body': data})
+
+    async def _dispatch(self, scope, body: bytes) -> Tuple[int, object]:
+        method, path = scope['method'], scope['path']
+
+        if path == '/' and method == 'GET':
+            return 200, "Python Backend is Running (ASGI)"
+        if path == '/api/todos':
+            if method == 'GET':
+                return await self._get_todos(parse_qs(scope.get('query_string', b'').decode()))
+            if method == 'POST':
+                return await self._create_todo(body)
+            return 405, {"error": "Method not allowed."}
+        if path == '/api/todos/changes':
+            if method == 'GET':
+                return await self._get_changes(parse_qs(scope.get('query_string', b'').decode()))
+            return 405, {"error": "Method not allowed."}
+        if path == '/api/todos/events':
+            return 405, {"error": "Method not allowed."}   # GET is streamed, see __call__
+        if path.startswith('/api/todos/') and '/' not in path[len('/api/todos/'):]:
+            todo_id = path[len('/api/todos/'):]
+            if method == 'PUT':
+                return await self._update_todo(todo_id, body)
+            if method == 'DELETE':
+                return await self._delete_todo(todo_id)
+            return 405, {"error": "Method not allowed."}
+        return 404, {"error": "Not found."}
+
+    # --- Handlers (same contract as src/interface_adapters/routes.py) ---
+
+    async def _get_todos(self, query: dict):
+        raw_limit = query.get('limit', [str(DEFAULT_PAGE_SIZE)])[0]
+        if not raw_limit.isdecimal():
+            return 400, {"error": "'limit' must be a positive integer."}
+        cursor = query.get('cursor', [''])[0] or None
+        try:
+            page = await self.get_todos_uc.execute_page(limit=int(raw_limit), cursor=cursor)
+        except InvalidInputError as e:
+            return 400, {"error": str(e)}
+        return 200, {'items': [_todo_to_dict(todo) for todo in page.items], 'next_cursor': page.next_cursor}
+
+    async def _get_changes(self, query: dict):
+        raw_since = query.get('since', [None])[0]
+        if raw_since is not None and not raw_since.isdecimal():
+            return 400, {"error": "'since' must be a non-negative integer."}
+        change_set = await self.get_changes_uc.execute(since=int(raw_since) if raw_since is not None else None)
+        return 200, change_set_to_json(change_set).encode('utf-8')
+
+    async def _stream_events(self, receive, send) -> None:
+        """
+        GET /api/todos/events - the same stream as the Flask route: a `change`
+        event per write, shaped like /api/todos/changes (with the write's seq),
+        and a `dropped` event when the client fell too far behind. Waiting
+        costs no thread: the hub wakes this coroutine through the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        # Called by whichever thread publishes: skip the hop when a wakeup is already pending
+        subscription = self.event_hub.subscribe(
+            wakeup=lambda: ready.is_set() or loop.call_soon_threadsafe(ready.set)
+        )
+        if subscription is None:
+            return await self._respond(send, 503, {"error": "Too many event stream subscribers, try again later."})
+
+        # The request body was read: the next message can only be http.disconnect
+        disconnected = asyncio.ensure_future(receive())
+        try:
+            await send({
+                'type': 'http.response.start',
+                'status': 200,
+                'headers': [(b'content-type', b'text/event-stream'), (b'cache-control', b'no-cache'),
+                            (b'x-accel-buffering', b'no')],   # Tell reverse proxies not to buffer the stream
+            })
+            # Reconnect delay for EventSource, then an initial comment so the stream opens immediately
+            await send({'type': 'http.response.body', 'body': b'retry: 3000\n: connected\n\n', 'more_body': True})
+            while True:
+                woken = asyncio.ensure_future(ready.wait())
+                done, _ = await asyncio.wait((woken, disconnected), timeout=self.keepalive_seconds,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                woken.cancel()
+                if disconnected in done:
+                    return
+                ready.clear()
+                messages = subscription.drain()
+                if messages is None:
+                    chunk = format_sse('dropped', '{}')
+                elif messages:
+                    chunk = ''.join(messages)
+                elif woken in done:
+                    continue   # A wakeup for messages an earlier drain already sent
+                else:
+                    chunk = ': keep-alive\n\n'
+                await send({'type': 'http.response.body', 'body': chunk.encode('utf-8'), 'more_body': True})
+                if messages is None:
+                    break
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            subscription.close()
+            disconnected.cancel()
+
+    async def _create_todo(self, body: bytes):
+        try:
+            data = json.loads(body or b'{}')
+            new_todo = await self.create_todo_uc.execute(task=data.get('task'))
+        except (ValueError, AttributeError) as e:
+            return 400, {"error": str(e)}
+        return 201, _todo_to_dict(new_todo)
+
+    async def _update_todo(self, todo_id: str, body: bytes):
+        try:
+            is_complete = json.loads(body or b'{}').get('is_complete')
+        except (ValueError, AttributeError):
+            is_complete = None
+        if not isinstance(is_complete, bool):
+            return 400, {"error": "Missing or invalid 'is_complete' status (must be boolean)."}
+        try:
+            updated_todo = await self.update_todo_uc.execute(todo_id=todo_id, is_complete=is_complete)
+        except TodoNotFoundError as e:
+            return 404, {"error": str(e)}
+        return 200, _todo_to_dict(updated_todo)
+
+    async def _delete_todo(self, todo_id: str):
+        if await self.delete_todo_uc.execute(todo_id=todo_id):
+            return 204, None
+        return 404, {"error": f"Todo with ID {todo_id} not found or failed to delete."}
+
+
+# --- 3. Wiring ---
+
+def _create_repository() -> IAsyncTodoRepository:
+    if not (SUPABASE_URL and SUPABASE_KEY):
+        raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set to serve the API (see .env).")
+    http_client = create_postgrest_client(SUPABASE_URL, SUPABASE_KEY, max_connections=HTTP_MAX_CONNECTIONS)
+    repository: IAsyncTodoRepository = AsyncSupabaseTodoRepository(http_client=http_client)
+    if BACKEND_TIMEOUT_SECONDS > 0:
+        repository = AsyncResilientTodoRepository(
+            repository,
+            timeout_seconds=BACKEND_TIMEOUT_SECONDS,
+            read_retries=BACKEND_READ_RETRIES,
+            breaker=CircuitBreaker(failure_threshold=BREAKER_FAILURES, reset_timeout_seconds=BREAKER_RESET_SECONDS)
+        )
+    return repository
+
+app = TodoASGIApp(repository_factory=_create_repository)
@@ -1,41 +1,286 @@
 # api/index.py - The Vercel entry point
 
 import os
-from flask import Flask
-from supabase import create_client, Client
-from dotenv import load_dotenv
+import time
+from types import SimpleNamespace
+from typing import Optional
+from flask import Flask, Response, request
 
 # Import Clean Architecture Components
+# (Only light modules here: the supabase SDK and dotenv are imported on first use,
+#  so a serverless cold start only pays for Flask and our own code.)
 from src.infrastructure.repositories.supabase_repo import SupabaseTodoRepository
+from src.infrastructure.repositories.sqlite_repo import SqliteTodoRepository
+from src.infrastructure.repositories.caching_repo import CachingTodoRepository
+from src.infrastructure.repositories.versioned_repo import VersionedTodoRepository
+from src.infrastructure.repositories.instrumented_repo import InstrumentedTodoRepository
+from src.infrastructure.repositories.write_behind_repo import WriteBehindTodoRepository
+from src.infrastructure.repositories.single_flight_repo import SingleFlightTodoRepository
+from src.infrastructure.repositories.resilient_repo import ResilientTodoRepository
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.ttl_cache import TTLCache
+from src.infrastructure.search_index import TodoSearchIndex
+from src.infrastructure.event_hub import EventHub
+from src.infrastructure.dependencies import Container, Provider
+from src.infrastructure.metrics import (
+    MetricsRegistry,
+    InstrumentedUseCase,
+    SIZE_BUCKETS,
+    stats_lines,
+    track_request
+)
 # Import the new use cases
-from src.domain.use_cases import GetTodosUseCase, CreateTodoUseCase, UpdateTodoUseCase, DeleteTodoUseCase 
+from src.domain.use_cases import (
+    GetTodosUseCase,
+    CreateTodoUseCase,
+    UpdateTodoUseCase,
+    DeleteTodoUseCase,
+    BatchCreateTodosUseCase,
+    BatchUpdateTodosUseCase,
+    BatchDeleteTodosUseCase,
+    SearchTodosUseCase,
+    GetTodoChangesUseCase
+)
 from src.interface_adapters.routes import todo_routes
+from src.interface_adapters.events import TodoEventPublisher
+from src.interface_adapters.compression import ResponseCompressor
 
-# --- 1. Infrastructure Setup (Supabase Client) ---
+# --- 1. Infrastructure Setup (Storage Backend) ---
+# Built lazily on the first request that needs it, then reused by the warm instance.
 
-# Load .env for local running
-load_dotenv() 
+def create_supabase_client():
+    """
+    Creates the client used by SupabaseTodoRepository (None if not configured).
 
-SUPABASE_URL = os.environ.get("SUPABASE_URL")
-SUPABASE_KEY = os.environ.get("SUPABASE_KEY")
+    The repository only uses the table API, so we build the PostgREST client that
+    supabase.create_client would wrap, and skip importing the full SDK (auth,
+    storage, realtime, functions), which roughly doubles the import cost.
+    """
+    import httpx
+    from postgrest import SyncPostgrestClient   # Deferred: the heaviest import by far
 
-supabase_client: Client = None
-if SUPABASE_URL and SUPABASE_KEY:
-    try:
-        supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    except Exception as e:
-        print(f"Failed to initialize Supabase client: {e}")
+    supabase_url = os.environ.get("SUPABASE_URL")
+    supabase_key = os.environ.get("SUPABASE_KEY")
+    if supabase_url and supabase_key:
+        try:
+            base_url = f"{supabase_url.rstrip('/')}/rest/v1"
+            # One pooled session per process: keep-alive connections are reused across requests,
+            # and the socket timeouts end calls the resilience layer has already given up on
+            pool_size = int(os.environ.get("TODO_BACKEND_POOL_SIZE", "20"))
+            timeout_seconds = float(os.environ.get("TODO_BACKEND_TIMEOUT_SECONDS", "5")) or None
+            session = httpx.Client(
+                base_url=base_url,
+                timeout=httpx.Timeout(timeout_seconds, connect=min(timeout_seconds or 3.0, 3.0)),
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+                follow_redirects=True,
+                http2=True
+            )
+            return SyncPostgrestClient(
+                base_url,
+                headers={'apikey': supabase_key, 'Authorization': f"Bearer {supabase_key}"},
+                http_client=session
+            )
+        except Exception as e:
+            print(f"Failed to initialize Supabase client: {e}")
+    return None
+
+def create_repository():
+    """Loads configuration and creates the storage backend selected by TODO_BACKEND."""
+    from dotenv import load_dotenv              # Deferred: only needed when wiring
+
+    # Load .env for local running
+    load_dotenv()
+
+    backend = os.environ.get("TODO_BACKEND", "supabase")
+    if backend == "sqlite":
+        # Local, network-free backend (offline benchmarking, edge deployments)
+        return SqliteTodoRepository(path=os.environ.get("TODO_SQLITE_PATH", "todos.db"))
+    if backend != "supabase":
+        raise ValueError(f"Unknown TODO_BACKEND '{backend}' (expected 'supabase' or 'sqlite').")
+
+    # Inject the concrete Supabase Repository implementation
+    return SupabaseTodoRepository(supabase_client=create_supabase_client())
 
 # --- 2. Dependency Injection / Wiring ---
 
-# Inject the concrete Supabase Repository implementation
-todo_repository = SupabaseTodoRepository(supabase_client=supabase_client)
+# Process-wide metrics, exposed at /metrics and summarized per request in Server-Timing
+metrics_registry = MetricsRegistry()
+
+def build_use_cases(todo_repository) -> SimpleNamespace:
+    """Wires the repository decorators and every use case around one storage backend."""
+    # Optional in-process read cache (disabled unless a TTL is configured)
+    cache_ttl_seconds = float(os.environ.get("TODO_CACHE_TTL_SECONDS", "0"))
+    cache_max_entries = int(os.environ.get("TODO_CACHE_MAX_ENTRIES", "256"))
+    # How long a list ETag may stay valid without a local write (bounds staleness across instances)
+    etag_max_age_seconds = float(os.environ.get("TODO_ETAG_MAX_AGE_SECONDS", "10"))
+    # Coalesce status toggles and write them in bulk after this window (0 disables write-behind)
+    write_behind_window_ms = float(os.environ.get("TODO_WRITE_BEHIND_WINDOW_MS", "0"))
+    write_behind_max_pending = int(os.environ.get("TODO_WRITE_BEHIND_MAX_PENDING", "1000"))
+    # Share one backend read among concurrent identical reads
+    single_flight_enabled = os.environ.get("TODO_SINGLE_FLIGHT", "true").lower() != "false"
+    # Writes kept for delta sync; clients further behind reload the full list
+    change_log_size = int(os.environ.get("TODO_CHANGE_LOG_SIZE", "10000"))
+    # How long the search index may go without a full reload (bounds staleness across instances)
+    search_index_max_age_seconds = float(os.environ.get("TODO_SEARCH_INDEX_MAX_AGE_SECONDS", "300"))
+    # Server-sent events: subscribers per process, and messages a subscriber may fall behind before being dropped.
+    # Under WSGI every open stream holds a server thread, so keep the cap well below the thread count
+    # (gunicorn.conf.py derives it from GUNICORN_THREADS); the rest get a 503 and EventSource retries.
+    # For thousands of subscribers, serve /api/todos/events from api/asgi.py: a stream there holds no thread.
+    sse_max_subscribers = int(os.environ.get("TODO_SSE_MAX_SUBSCRIBERS", "4"))
+    sse_buffer_size = int(os.environ.get("TODO_SSE_BUFFER_SIZE", "64"))
+    # Remote backend guard: per-call timeout (0 disables the guard), read retries, hedging and circuit breaker
+    backend_timeout_seconds = float(os.environ.get("TODO_BACKEND_TIMEOUT_SECONDS", "5"))
+    backend_read_retries = int(os.environ.get("TODO_BACKEND_READ_RETRIES", "2"))
+    backend_hedge_after_ms = float(os.environ.get("TODO_BACKEND_HEDGE_AFTER_MS", "0"))
+    backend_pool_size = int(os.environ.get("TODO_BACKEND_POOL_SIZE", "20"))
+    breaker_failures = int(os.environ.get("TODO_BREAKER_FAILURES", "5"))
+    breaker_reset_seconds = float(os.environ.get("TODO_BREAKER_RESET_SECONDS", "30"))
+    # Instrumentation is cheap enough to leave on; set to "false" to remove it entirely
+    metrics_enabled = os.environ.get("TODO_METRICS_ENABLED", "true").lower() != "false"
+
+    # Only calls over the network are worth guarding (a local SQLite call has nothing to gain from it)
+    remote_backend = isinstance(todo_repository, SupabaseTodoRepository)
+
+    # Measure real backend round trips: this must be the innermost decorator
+    if metrics_enabled:
+        todo_repository = InstrumentedTodoRepository(todo_repository, metrics_registry)
+
+    # Time out, retry and circuit-break backend calls (above the instrumentation, so every attempt is a round trip)
+    if remote_backend and backend_timeout_seconds > 0:
+        todo_repository = ResilientTodoRepository(
+            todo_repository,
+            timeout_seconds=backend_timeout_seconds,
+            read_retries=backend_read_retries,
+            hedge_after_seconds=backend_hedge_after_ms / 1000 if backend_hedge_after_ms > 0 else None,
+            breaker=CircuitBreaker(failure_threshold=breaker_failures, reset_timeout_seconds=breaker_reset_seconds),
+            max_workers=backend_pool_size
+        )
+        metrics_registry.set_collector('backend_guard', lambda guard=todo_repository: stats_lines(
+            'todo_backend_guard', 'Storage backend timeouts, retries, hedges and circuit breaker',
+            guard.stats(), gauges=('open',)
+        ))
+
+    # Collapse thundering-herd reads (also covers concurrent cache misses, which sit above it)
+    if single_flight_enabled:
+        todo_repository = SingleFlightTodoRepository(todo_repository)
+        metrics_registry.set_collector('single_flight', lambda flights=todo_repository: stats_lines(
+            'todo_single_flight', 'Single-flight backend reads', flights.stats(), gauges=('in_flight',)
+        ))
+
+    # Queue status updates behind the request (needs a long-lived process, not a frozen serverless one)
+    if write_behind_window_ms > 0:
+        todo_repository = WriteBehindTodoRepository(
+            todo_repository,
+            window_seconds=write_behind_window_ms / 1000,
+            max_pending=write_behind_max_pending
+        )
+        metrics_registry.set_collector('write_behind', lambda queue=todo_repository: stats_lines(
+            'todo_write_behind', 'Write-behind status queue', queue.stats(), gauges=('pending',)
+        ))
+
+    # Decorate it with the read-through cache when enabled
+    if cache_ttl_seconds > 0:
+        todo_repository = CachingTodoRepository(
+            todo_repository,
+            TTLCache(max_entries=cache_max_entries, ttl_seconds=cache_ttl_seconds)
+        )
+        metrics_registry.set_collector('cache', lambda cache=todo_repository: stats_lines(
+            'todo_cache', 'Read-through cache events', cache.stats(), gauges=('size',)
+        ))
+
+    # Track a collection version on writes (the list endpoint's ETag) and a change log (delta sync)
+    todo_repository = VersionedTodoRepository(
+        todo_repository, max_age_seconds=etag_max_age_seconds, max_changes=change_log_size
+    )
+
+    # Text search index, loaded on the first search and kept current by the write use cases
+    search_index = TodoSearchIndex(todo_repository, max_age_seconds=search_index_max_age_seconds)
+    metrics_registry.set_collector('search_index', lambda: stats_lines(
+        'todo_search_index', 'Search index size', search_index.stats(), gauges=('documents', 'tokens')
+    ))
+
+    # Push every change log entry (with its seq) to the SSE subscribers of this process
+    event_hub = EventHub(max_subscribers=sse_max_subscribers, max_buffer=sse_buffer_size)
+    metrics_registry.set_collector('event_hub', lambda: stats_lines(
+        'todo_sse', 'Server-sent event hub', event_hub.stats(), gauges=('subscribers',)
+    ))
+    todo_repository.add_change_listener(TodoEventPublisher(event_hub))
+    listeners = [search_index]
+
+    def instrument(use_case, name: str):
+        return InstrumentedUseCase(use_case, metrics_registry, name) if metrics_enabled else use_case
+
+    # Instantiate Use Cases with the Repository (Dependency Inversion)
+    return SimpleNamespace(
+        repository=todo_repository,
+        search_index=search_index,
+        event_hub=event_hub,
+        metrics_enabled=metrics_enabled,
+        get_todos_uc=instrument(GetTodosUseCase(repository=todo_repository), 'get_todos'),
+        create_todo_uc=instrument(CreateTodoUseCase(repository=todo_repository, listeners=listeners), 'create_todo'),
+        update_todo_uc=instrument(UpdateTodoUseCase(repository=todo_repository, listeners=listeners), 'update_todo'),
+        delete_todo_uc=instrument(DeleteTodoUseCase(repository=todo_repository, listeners=listeners), 'delete_todo'),
+        search_todos_uc=instrument(SearchTodosUseCase(index=search_index), 'search_todos'),
+        get_changes_uc=instrument(GetTodoChangesUseCase(repository=todo_repository), 'get_changes'),
+        batch_create_uc=instrument(BatchCreateTodosUseCase(repository=todo_repository, listeners=listeners), 'batch_create'),
+        batch_update_uc=instrument(BatchUpdateTodosUseCase(repository=todo_repository, listeners=listeners), 'batch_update'),
+        batch_delete_uc=instrument(BatchDeleteTodosUseCase(repository=todo_repository, listeners=listeners), 'batch_delete'),
+    )
 
-# Instantiate Use Cases with the Repository (Dependency Inversion)
-get_todos_uc = GetTodosUseCase(repository=todo_repository)
-create_todo_uc = CreateTodoUseCase(repository=todo_repository)
-update_todo_uc = UpdateTodoUseCase(repository=todo_repository)
-delete_todo_uc = DeleteTodoUseCase(repository=todo_repository)
+def build_compressor() -> Optional[ResponseCompressor]:
+    """
+    The response compressor, or None when disabled. It runs after every
+    response (/ and /metrics included), so it depends on nothing but its
+    configuration: never on the repository wiring.
+    """
+    # Compress JSON/text bodies from this size up (negative disables), caching compressed lists by ETag
+    compression_min_bytes = int(os.environ.get("TODO_COMPRESSION_MIN_BYTES", "1024"))
+    compression_cache_entries = int(os.environ.get("TODO_COMPRESSION_CACHE_ENTRIES", "128"))
+    # Cached bodies need not outlive the list ETags they are keyed by
+    etag_max_age_seconds = float(os.environ.get("TODO_ETAG_MAX_AGE_SECONDS", "10"))
+    if compression_min_bytes < 0:
+        return None
+
+    compressor = ResponseCompressor(
+        min_size=compression_min_bytes,
+        cache=TTLCache(max_entries=compression_cache_entries, ttl_seconds=max(etag_max_age_seconds, 1.0))
+    )
+    metrics_registry.set_collector('compression', lambda: stats_lines(
+        'todo_compression', 'Response compression', compressor.stats()
+    ))
+    return compressor
+
+# Process-wide dependencies: the wiring is a singleton built on the first request
+# (and rebuilt after reset, e.g. in a forked worker); everything below resolves from it.
+container = Container()
+container.singleton('use_cases', lambda c: build_use_cases(create_repository()))
+container.singleton('compressor', lambda c: build_compressor())
+
+# The dependency each route handler receives as its first argument. Adding an endpoint
+# means adding its handler to the Blueprint and one line here.
+ROUTE_DEPENDENCIES = {
+    'get_todos_route': 'get_todos_uc',
+    'export_todos_route': 'get_todos_uc',
+    'get_todo_changes_route': 'get_changes_uc',
+    'todo_events_route': 'event_hub',
+    'search_todos_route': 'search_todos_uc',
+    'create_todo_route': 'create_todo_uc',
+    'update_todo_route': 'update_todo_uc',
+    'delete_todo_route': 'delete_todo_uc',
+    'batch_create_todos_route': 'batch_create_uc',
+    'batch_update_todos_route': 'batch_update_uc',
+    'batch_delete_todos_route': 'batch_delete_uc',
+}
+for _name in set(ROUTE_DEPENDENCIES.values()) | {'metrics_enabled'}:
+    container.singleton(_name, lambda c, name=_name: getattr(c.resolve('use_cases'), name))
+
+def get_use_cases() -> SimpleNamespace:
+    """Returns the process-wide use cases, building them on first use."""
+    return container.resolve('use_cases')
+
+def reset_use_cases() -> None:
+    """Drops the wiring so the next request rebuilds it (e.g. in a freshly forked worker)."""
+    container.reset()
 
 
 # --- 3. Flask App Setup ---
@@ -44,32 +289,62 @@ app = Flask(__name__)
 # Register the Blueprint from the Interface Adapters layer
 app.register_blueprint(todo_routes, url_prefix='/api')
 
-# NOTE: Since Blueprints can't directly use custom arguments in Flask's default setup,
-# we need a simple trick to inject the Use Cases into the route functions.
-# This simple setup uses Flask's g object or request context variables.
-# For simplicity in a serverless function, we'll manually wrap the route handler:
+# Blueprint handlers take their use case as the first argument: each one is bound
+# to its dependency's provider once, here, rather than looked up per request.
+
+http_request_duration = metrics_registry.histogram(
+    'http_request_duration_seconds', 'API request latency.', ('endpoint', 'method', 'status')
+)
+http_response_size = metrics_registry.histogram(
+    'http_response_size_bytes', 'API response body size (non-streamed responses).', ('endpoint',), SIZE_BUCKETS
+)
+
+def wrap_route(f, dependency: Optional[Provider] = None):
+    """Binds a route handler to the provider of its dependency, with request metrics around it."""
+    endpoint = f.__name__
+    metrics_enabled = container.provider('metrics_enabled')
+    handler = f if dependency is None else (lambda *args, **kwargs: f(dependency.get(), *args, **kwargs))
 
-def wrap_route(f):
-    """Wrapper to manually inject the correct use case instance."""
     def wrapper(*args, **kwargs):
-        if f.__name__ == 'get_todos_route':
-            return f(get_todos_uc, *args, **kwargs)
-        elif f.__name__ == 'create_todo_route':
-            return f(create_todo_uc, *args, **kwargs)
-        elif f.__name__ == 'update_todo_route': # New injection
-            return f(update_todo_uc, *args, **kwargs)
-        elif f.__name__ == 'delete_todo_route': # New injection
-            return f(delete_todo_uc, *args, **kwargs)
-        else:
-            return f(*args, **kwargs)
-    wrapper.__name__ = f.__name__ # Preserve the function name for routing
-    return wrapper
-
-# Replace the original routes with the wrapped versions
-for rule in app.url_map.iter_rules():
-    if rule.endpoint.startswith('todo_routes.'):
-        original_view = app.view_functions[rule.endpoint]
-        app.view_functions[rule.endpoint] = wrap_route(original_view)
+        if not metrics_enabled.get():
+            return handler(*args, **kwargs)
+
+        # Time the request and collect the use case / backend spans recorded inside it
+        with track_request(endpoint) as timings:
+            response = app.make_response(handler(*args, **kwargs))
+        elapsed = time.perf_counter() - timings.started
+
+        http_request_duration.observe(elapsed, endpoint, request.method, str(response.status_code))
+        if not response.is_streamed:
+            http_response_size.observe(response.content_length or 0, endpoint)
+        response.headers['Server-Timing'] = timings.server_timing(elapsed)
+        return response
+
+    def scoped_wrapper(*args, **kwargs):
+        # Request-scoped dependencies live for one request. Always opened (a context variable
+        # set and reset), so dependencies registered after the routes were bound get one too.
+        with container.scope():
+            return wrapper(*args, **kwargs)
+
+    scoped_wrapper.__name__ = endpoint # Preserve the function name for routing
+    return scoped_wrapper
+
+# Replace the original routes with the bound versions
+for endpoint, original_view in list(app.view_functions.items()):
+    if endpoint.startswith('todo_routes.'):
+        dependency = ROUTE_DEPENDENCIES.get(original_view.__name__)
+        app.view_functions[endpoint] = wrap_route(
+            original_view, container.provider(dependency) if dependency else None
+        )
+
+
+compressor_provider = container.provider('compressor')
+
+@app.after_request
+def compress_response(response):
+    """Negotiates gzip/br/zstd for large JSON and text bodies (see ResponseCompressor)."""
+    compressor = compressor_provider.get()
+    return compressor(response, request) if compressor is not None else response
 
 
 @app.route('/', methods=['GET'])
@@ -77,8 +352,15 @@ def home():
     """Simple root route check."""
     return "Python Backend is Running (Clean Architecture Applied!)"
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus scrape endpoint (text exposition format)."""
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
+
 # --- Local Testing Block ---
 if __name__ == '__main__':
     # When running locally, Flask is responsible for routing
-    print("Running locally. Access API at http://127.0.0.1:5000/api/todos")
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # (Development only: production runs gunicorn, see gunicorn.conf.py)
+    port = int(os.environ.get("PORT", "5000"))
+    print(f"Running locally. Access API at http://127.0.0.1:{port}/api/todos")
+    app.run(host='0.0.0.0', port=port, debug=True)
@@ -10,6 +10,13 @@ class TodoApp {
         this.todoList = document.getElementById('todo-list');
         this.todoForm = document.getElementById('todo-form');
         this.taskInput = document.getElementById('task-input');
+
+        // Local copy of the list (id -> todo) and the change sequence it reflects
+        this.todos = new Map();
+        this.seq = null;
+        // Pushed changes held back while a sync or reload is running (see applyPushed)
+        this.loading = 0;
+        this.heldFrames = [];
         
         if (!this.todoList || !this.todoForm || !this.taskInput) {
             console.error("DOM elements missing. Check index.html IDs.");
@@ -25,7 +32,80 @@ class TodoApp {
     init() {
         // Bind 'this' to maintain the class context
         this.todoForm.addEventListener('submit', this.handleFormSubmit.bind(this)); 
+        // Catch up on changes made elsewhere whenever the tab comes back into view
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'visible') this.syncChanges();
+        });
         this.fetchAndRenderTodos();
+        this.subscribeToChanges();
+    }
+
+    /**
+     * Listens for changes pushed by the server. The stream only carries
+     * changes made while connected, so every (re)connect starts with a sync.
+     */
+    subscribeToChanges() {
+        if (!window.EventSource) return; // Visibility syncs still keep the list fresh
+        const events = new EventSource('/api/todos/events');
+        events.addEventListener('open', () => this.syncChanges());
+        events.addEventListener('change', event => this.applyPushed(JSON.parse(event.data)));
+        // 'dropped' (we fell behind) ends the stream; EventSource reconnects on its own
+    }
+
+    /**
+     * Applies one pushed change log entry ({changes, seq, reset}). Entries
+     * arrive in seq order; one at or below our seq is already reflected in
+     * the list (a sync returned it) and is skipped. While a sync or reload is
+     * running the entry is held back, so it lands after that response
+     * instead of being overwritten by it.
+     */
+    applyPushed(frame) {
+        if (this.loading > 0) {
+            this.heldFrames.push(frame);
+            return;
+        }
+        if (frame.reset) {
+            this.fetchAndRenderTodos();
+            return;
+        }
+        if (this.seq !== null && frame.seq <= this.seq) return;
+        this.applyChanges(frame.changes);
+        // Without a position (the last load failed) the next sync must still reload
+        if (this.seq !== null) this.seq = frame.seq;
+    }
+
+    /**
+     * Runs a sync or reload with pushed changes held back, then applies the
+     * held ones that are newer than what it loaded.
+     */
+    async withPushHeld(load) {
+        this.loading++;
+        try {
+            return await load();
+        } finally {
+            this.loading--;
+            if (this.loading === 0) {
+                const frames = this.heldFrames;
+                this.heldFrames = [];
+                frames.forEach(frame => this.applyPushed(frame));
+            }
+        }
+    }
+
+    /**
+     * Applies change records (upserts and tombstones) to the local list.
+     */
+    applyChanges(changes) {
+        changes.forEach(change => {
+            if (change.deleted) {
+                this.todos.delete(change.id);
+            } else {
+                this.todos.set(change.id, change);
+            }
+        });
+        if (changes.length > 0) {
+            this.renderTodos([...this.todos.values()]);
+        }
     }
 
     /**
@@ -48,18 +128,70 @@ class TodoApp {
 
     /**
      * Fetches the current list of todos from the backend API.
+     * The list endpoint is paginated, so follow `next_cursor` until the last page.
+     * The change sequence is read first: changes racing the download are
+     * replayed afterwards (pushed or by the next sync), and applying them
+     * twice is harmless.
+     */
+    fetchAndRenderTodos() {
+        return this.withPushHeld(() => this.loadAllTodos());
+    }
+
+    async loadAllTodos() {
+        try {
+            const changesResponse = await fetch('/api/todos/changes');
+            const seq = changesResponse.ok ? (await changesResponse.json()).seq : null;
+
+            const todos = [];
+            let cursor = null;
+            do {
+                const url = cursor ? `/api/todos?cursor=${encodeURIComponent(cursor)}` : '/api/todos';
+                const response = await fetch(url);
+                if (!response.ok) {
+                    throw new Error(`HTTP error! Status: ${response.status}`);
+                }
+                const data = await response.json();
+                todos.push(...data.items);
+                cursor = data.next_cursor;
+            } while (cursor);
+
+            this.todos = new Map(todos.map(todo => [todo.id, todo]));
+            this.seq = seq;
+            this.renderTodos(todos);
+        } catch (error) {
+            console.error('Error fetching todos:', error);
+            this.todoList.innerHTML = `<li>Error: ${error.message}. Check console.</li>`;
+        }
+    }
+
+    /**
+     * Applies only what changed since the last sync (inserts, updates and
+     * deletes) to the local list, falling back to a full reload when the
+     * server cannot replay the changes from our position.
      */
-    async fetchAndRenderTodos() {
+    syncChanges() {
+        return this.withPushHeld(() => this.loadChanges());
+    }
+
+    async loadChanges() {
+        if (this.seq === null) {
+            return this.fetchAndRenderTodos();
+        }
         try {
-            const response = await fetch('/api/todos');
+            const response = await fetch(`/api/todos/changes?since=${this.seq}`);
             if (!response.ok) {
                 throw new Error(`HTTP error! Status: ${response.status}`);
             }
             const data = await response.json();
-            this.renderTodos(data);
+            if (data.reset) {
+                return this.fetchAndRenderTodos();
+            }
+
+            this.applyChanges(data.changes);
+            this.seq = data.seq;
         } catch (error) {
-            console.error('Error fetching todos:', error);
-            this.todoList.innerHTML = `<li>Error: ${error.message}. Check console.</li>`;
+            console.error('Error syncing todos:', error);
+            await this.fetchAndRenderTodos();
         }
     }
 
@@ -80,7 +212,9 @@ class TodoApp {
 
             if (response.status === 201) {
                 this.taskInput.value = '';
-                await this.fetchAndRenderTodos();
+                // Fetch only what changed since our last sync (our task included); if the
+                // server cannot replay from our position it answers with a reset and we reload once
+                await this.syncChanges();
             } else {
                  const errorData = await response.json();
                  alert(`Failed to create task: ${errorData.error || 'Server error'}`);
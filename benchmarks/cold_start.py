@@ -0,0 +1,131 @@
+# benchmarks/cold_start.py
+"""
+Cold-start benchmark for the Vercel entry point (api/index.py).
+
+Each run starts a fresh interpreter, imports the app and serves the first
+GET /api/todos against a local PostgREST stand-in, timing:
+
+  * import_ms         - `import api.index` (what every cold start pays)
+  * first_request_ms  - first list request, including lazy client/use-case wiring
+  * warm_request_ms   - a second request on the now-warm instance
+  * process_ms        - wall time of the whole child process
+
+It also reports the heaviest modules from `python -X importtime`, and exits
+non-zero when the median cold start (import + first request) exceeds the budget.
+
+    python benchmarks/cold_start.py --runs 5 --budget-ms 600
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+from fake_postgrest import FakePostgrest  # noqa: E402
+
+CHILD_SCRIPT = r'''
+import json, time
+t0 = time.perf_counter()
+import api.index as index
+t1 = time.perf_counter()
+client = index.app.test_client()
+first = client.get('/api/todos')
+t2 = time.perf_counter()
+client.get('/api/todos')
+t3 = time.perf_counter()
+print(json.dumps({
+    'import_ms': (t1 - t0) * 1000,
+    'first_request_ms': (t2 - t1) * 1000,
+    'warm_request_ms': (t3 - t2) * 1000,
+    'status': first.status_code,
+}))
+'''
+
+
+def run_child(env: dict) -> dict:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['process_ms'] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def heaviest_imports(env: dict, top: int) -> list:
+    """
+    Parses `-X importtime` output into (cumulative_ms, self_ms, module) for the
+    direct dependencies of api.index, heaviest first.
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import api.index'], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True
+    )
+    subtree = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        if depth == 0:
+            # importtime prints children before their parent: a top-level line closes a subtree
+            if name.strip() == 'api.index':
+                break
+            subtree = []
+        elif depth == 1:
+            subtree.append((int(cumulative_us) / 1000, int(self_us) / 1000, name.strip()))
+    return sorted(subtree, reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=600.0,
+                        help='maximum median import + first request time')
+    parser.add_argument('--top', type=int, default=10, help='number of heavy imports to list')
+    parser.add_argument('--json', dest='json_path', help='also write the results to this file')
+    args = parser.parse_args()
+
+    with FakePostgrest() as fake:
+        fake.seed([f"Task {i}" for i in range(100)])
+        env = dict(os.environ, SUPABASE_URL=fake.url, SUPABASE_KEY='benchmark-key', PYTHONDONTWRITEBYTECODE='0')
+
+        runs = [run_child(env) for _ in range(args.runs)]
+        imports = heaviest_imports(env, args.top)
+
+    if any(run['status'] != 200 for run in runs):
+        print(f"First request failed: {[run['status'] for run in runs]}")
+        return 2
+
+    summary = {
+        key: statistics.median(run[key] for run in runs)
+        for key in ('import_ms', 'first_request_ms', 'warm_request_ms', 'process_ms')
+    }
+    summary['cold_start_ms'] = summary['import_ms'] + summary['first_request_ms']
+
+    print(f"Median of {args.runs} runs:")
+    for key, value in summary.items():
+        print(f"  {key:<18} {value:8.1f} ms")
+    print("\nHeaviest direct imports of api.index (cumulative / self):")
+    for cumulative_ms, self_ms, name in imports:
+        print(f"  {cumulative_ms:8.1f} ms  {self_ms:7.1f} ms  {name}")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'summary': summary, 'runs': runs, 'imports': imports}, f, indent=2)
+
+    if summary['cold_start_ms'] > args.budget_ms:
+        print(f"\nFAIL: cold start {summary['cold_start_ms']:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+        return 1
+    print(f"\nOK: cold start within budget ({args.budget_ms:.1f} ms)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# benchmarks/fakes.py
+"""Fake repositories used by the benchmark suite."""
+
+import bisect
+import os
+import sys
+import time
+from typing import List, Optional, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from src.application.interfaces import ITodoRepository  # noqa: E402
+from src.domain.entities import Todo  # noqa: E402
+from src.domain.exceptions import TodoNotFoundError  # noqa: E402
+from src.infrastructure.repositories.decorator import TodoRepositoryDecorator  # noqa: E402
+
+
+class InMemoryTodoRepository(ITodoRepository):
+    """
+    Dict-backed repository with a sorted ID index, so every operation
+    (including keyset pages) costs about what an indexed database would.
+    """
+
+    def __init__(self):
+        self._todos = {}
+        self._sorted_ids: List[int] = []
+        self._next_id = 1
+
+    def get_all(self) -> Sequence[Todo]:
+        return list(self._todos.values())
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        start = 0 if after_id is None else bisect.bisect_right(self._sorted_ids, int(after_id))
+        return [self._todos[todo_id] for todo_id in self._sorted_ids[start:start + limit]]
+
+    def add(self, todo: Todo) -> Todo:
+        todo.id = str(self._next_id)
+        self._todos[self._next_id] = todo
+        self._sorted_ids.append(self._next_id)  # IDs only grow, so this stays sorted
+        self._next_id += 1
+        return todo
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        todo = self._todos.get(int(todo_id))
+        if todo is None:
+            raise TodoNotFoundError(todo_id)
+        todo.is_complete = is_complete
+        return todo
+
+    def delete(self, todo_id: str) -> bool:
+        if self._todos.pop(int(todo_id), None) is None:
+            return False
+        del self._sorted_ids[bisect.bisect_left(self._sorted_ids, int(todo_id))]
+        return True
+
+
+class LatencyTodoRepository(TodoRepositoryDecorator):
+    """Adds a fixed delay to every call, imitating a network round trip to the database."""
+
+    def __init__(self, inner: ITodoRepository, latency_seconds: float = 0.001):
+        super().__init__(inner)
+        self.latency_seconds = latency_seconds
+
+    def _wait(self):
+        time.sleep(self.latency_seconds)
+
+    def get_all(self):
+        self._wait()
+        return super().get_all()
+
+    def get_page(self, limit, after_id=None):
+        self._wait()
+        return super().get_page(limit, after_id)
+
+    def find_page(self, query, limit, after=None):
+        self._wait()
+        return super().find_page(query, limit, after)
+
+    def add(self, todo):
+        self._wait()
+        return super().add(todo)
+
+    def update_status(self, todo_id, is_complete):
+        self._wait()
+        return super().update_status(todo_id, is_complete)
+
+    def delete(self, todo_id):
+        self._wait()
+        return super().delete(todo_id)
+
+    def add_many(self, todos):
+        self._wait()
+        return super().add_many(todos)
+
+    def update_status_many(self, todo_ids, is_complete):
+        self._wait()
+        return super().update_status_many(todo_ids, is_complete)
+
+    def delete_many(self, todo_ids):
+        self._wait()
+        return super().delete_many(todo_ids)
@@ -0,0 +1,309 @@
+# benchmarks/loadtest.py
+"""
+End-to-end load test of the whole stack: HTTP server -> Flask app -> use cases
+-> SupabaseTodoRepository -> a local PostgREST stand-in (tests/fake_postgrest.py)
+that adds --latency-ms to every call, like the round trip to Supabase.
+
+The app runs in its own process, on one of:
+
+  threaded  - werkzeug's threaded WSGI server (one process, a thread per request)
+  gunicorn  - `gunicorn --config gunicorn.conf.py api.index:app`
+
+Keep-alive clients on --concurrency threads send a weighted mix of requests
+for --duration seconds (closed loop: each client waits for its answer):
+
+  list    GET /api/todos?limit=20
+  create  POST /api/todos
+  toggle  PUT /api/todos/<id>     (a random known todo)
+  delete  DELETE /api/todos/<id>  (a random known todo)
+
+The report gives throughput, p50/p90/p99/max latency and the error rate, per
+operation and overall, plus backend calls per request. A 404 on a todo that
+another client deleted meanwhile is counted as a conflict, not an error.
+The run fails (exit 1) above --max-error-rate or --max-p99-ms.
+
+    python benchmarks/loadtest.py --concurrency 32 --duration 20 --latency-ms 10
+    python benchmarks/loadtest.py --server gunicorn --mix list=50,create=20,toggle=20,delete=10
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+from benchmarks.serve_throughput import free_port, wait_until_ready  # noqa: E402
+from fake_postgrest import FakePostgrest  # noqa: E402
+
+OPERATIONS = ('list', 'create', 'toggle', 'delete')
+DEFAULT_MIX = 'list=70,create=10,toggle=15,delete=5'
+
+THREADED_SERVER = (
+    "import os; from werkzeug.serving import run_simple; import api.index as index; "
+    "run_simple('127.0.0.1', int(os.environ['PORT']), index.app, threaded=True)"
+)
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in OPERATIONS or not weight.strip().isdecimal():
+            raise argparse.ArgumentTypeError(f"Bad mix entry '{part}' (expected e.g. {DEFAULT_MIX}).")
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("The mix needs at least one non-zero weight.")
+    return mix
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+class KnownTodos:
+    """IDs the clients may toggle or delete, shared by every client thread."""
+
+    def __init__(self, ids: List[str]):
+        self._ids = list(ids)
+        self._lock = threading.Lock()
+
+    def add(self, todo_id: str) -> None:
+        with self._lock:
+            self._ids.append(todo_id)
+
+    def pick(self, rng: random.Random) -> Optional[str]:
+        with self._lock:
+            return rng.choice(self._ids) if self._ids else None
+
+    def take(self, rng: random.Random) -> Optional[str]:
+        with self._lock:
+            if not self._ids:
+                return None
+            index = rng.randrange(len(self._ids))
+            self._ids[index], self._ids[-1] = self._ids[-1], self._ids[index]
+            return self._ids.pop()
+
+
+class Recorder:
+    """Per-operation latencies and outcomes, merged from every client."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {name: [] for name in OPERATIONS}
+        self.errors: Dict[str, int] = {name: 0 for name in OPERATIONS}
+        self.conflicts: Dict[str, int] = {name: 0 for name in OPERATIONS}
+        self.statuses: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def merge(self, latencies, errors, conflicts, statuses) -> None:
+        with self._lock:
+            for name in OPERATIONS:
+                self.latencies[name].extend(latencies[name])
+                self.errors[name] += errors[name]
+                self.conflicts[name] += conflicts[name]
+            for status, count in statuses.items():
+                self.statuses[status] = self.statuses.get(status, 0) + count
+
+
+def run_client(port: int, seed: int, mix: Dict[str, int], deadline: float, think_seconds: float,
+               known: KnownTodos, recorder: Recorder) -> None:
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    latencies = {name: [] for name in OPERATIONS}
+    errors = {name: 0 for name in OPERATIONS}
+    conflicts = {name: 0 for name in OPERATIONS}
+    statuses: Dict[str, int] = {}
+    headers = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'}
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+
+    while time.perf_counter() < deadline:
+        operation = rng.choices(names, weights)[0]
+        todo_id = None
+        if operation == 'toggle':
+            todo_id = known.pick(rng)
+        elif operation == 'delete':
+            todo_id = known.take(rng)
+        if operation in ('toggle', 'delete') and todo_id is None:
+            operation = 'create'   # Nothing left to act on
+
+        if operation == 'list':
+            method, path, body = 'GET', '/api/todos?limit=20', None
+        elif operation == 'create':
+            method, path, body = 'POST', '/api/todos', json.dumps({'task': f"Load test task {rng.random():.6f}"})
+        elif operation == 'toggle':
+            method, path, body = 'PUT', f'/api/todos/{todo_id}', json.dumps({'is_complete': rng.random() < 0.5})
+        else:
+            method, path, body = 'DELETE', f'/api/todos/{todo_id}', None
+
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            payload = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            status, payload = 'connection error', b''
+        elapsed = time.perf_counter() - started
+
+        if status in (200, 201, 204):
+            latencies[operation].append(elapsed)
+            if operation == 'create':
+                known.add(json.loads(payload)['id'])
+        elif status == 404 and operation in ('toggle', 'delete'):
+            conflicts[operation] += 1   # Deleted by another client in the meantime
+        else:
+            errors[operation] += 1
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        if think_seconds:
+            time.sleep(think_seconds)
+
+    connection.close()
+    recorder.merge(latencies, errors, conflicts, statuses)
+
+
+def start_server(kind: str, port: int, env: dict) -> subprocess.Popen:
+    if kind == 'threaded':
+        command = [sys.executable, '-c', THREADED_SERVER]
+    else:
+        command = [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py',
+                   '--bind', f"127.0.0.1:{port}", 'api.index:app']
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL, start_new_session=True)
+    wait_until_ready(port, process)
+    return process
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=35)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def summarize(recorder: Recorder, elapsed: float) -> Dict[str, dict]:
+    report = {}
+    every = []
+    for name in OPERATIONS + ('total',):
+        if name == 'total':
+            latencies = sorted(every)
+            errors = sum(recorder.errors.values())
+            conflicts = sum(recorder.conflicts.values())
+        else:
+            latencies = sorted(recorder.latencies[name])
+            every.extend(latencies)
+            errors, conflicts = recorder.errors[name], recorder.conflicts[name]
+        attempts = len(latencies) + errors + conflicts
+        if not attempts:
+            continue
+        report[name] = {
+            'requests': attempts,
+            'requests_per_sec': attempts / elapsed,
+            'p50_ms': percentile(latencies, 0.50) * 1000,
+            'p90_ms': percentile(latencies, 0.90) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+            'max_ms': (latencies[-1] if latencies else 0.0) * 1000,
+            'errors': errors,
+            'conflicts': conflicts,
+            'error_rate': errors / attempts,
+        }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--server', choices=('threaded', 'gunicorn'), default='threaded')
+    parser.add_argument('--concurrency', type=int, default=16, help='client threads')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds of load')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='added to every backend call')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"default: {DEFAULT_MIX}")
+    parser.add_argument('--seed-todos', type=int, default=500, help='rows in the table before the run')
+    parser.add_argument('--think-ms', type=float, default=0.0, help='pause between a client\'s requests')
+    parser.add_argument('--seed', type=int, default=1, help='random seed (same seed, same request sequence)')
+    parser.add_argument('--max-error-rate', type=float, default=0.01)
+    parser.add_argument('--max-p99-ms', type=float, help='fail when the overall p99 exceeds this')
+    parser.add_argument('--json', dest='json_path', help='also write the report to this file')
+    args = parser.parse_args()
+
+    with FakePostgrest() as fake:
+        fake.seed([f"Seeded task {i}" for i in range(args.seed_todos)])
+        known = KnownTodos([str(row_id) for row_id in fake.rows])
+        fake.latency = args.latency_ms / 1000
+
+        port = free_port()
+        env = dict(os.environ, SUPABASE_URL=fake.url, SUPABASE_KEY='loadtest-key', TODO_BACKEND='supabase',
+                   PORT=str(port), PYTHONUNBUFFERED='1')
+        process = start_server(args.server, port, env)
+        try:
+            recorder = Recorder()
+            backend_calls_before = fake.request_count
+            started = time.perf_counter()
+            deadline = started + args.duration
+            clients = [
+                threading.Thread(target=run_client, args=(port, args.seed * 1000 + index, args.mix, deadline,
+                                                          args.think_ms / 1000, known, recorder))
+                for index in range(args.concurrency)
+            ]
+            for client in clients:
+                client.start()
+            for client in clients:
+                client.join()
+            elapsed = time.perf_counter() - started
+            backend_calls = fake.request_count - backend_calls_before
+        finally:
+            stop_server(process)
+
+    report = summarize(recorder, elapsed)
+    total = report.get('total')
+    if total is None:
+        print("No requests were sent.")
+        return 2
+
+    mix = ', '.join(f"{name} {weight}" for name, weight in args.mix.items())
+    print(f"{args.server} server, {args.concurrency} clients, {elapsed:.1f}s, "
+          f"{args.latency_ms:g} ms backend latency, mix: {mix}")
+    print(f"  {'operation':<10} {'requests':>9} {'req/s':>9} {'p50 ms':>8} {'p90 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'errors':>7} {'conflicts':>9}")
+    for name, row in report.items():
+        print(f"  {name:<10} {row['requests']:9d} {row['requests_per_sec']:9.1f} {row['p50_ms']:8.2f} "
+              f"{row['p90_ms']:8.2f} {row['p99_ms']:8.2f} {row['max_ms']:8.2f} {row['errors']:7d} "
+              f"{row['conflicts']:9d}")
+    print(f"\nError rate: {total['error_rate']:.2%}"
+          + (f" (statuses: {recorder.statuses})" if recorder.statuses else ''))
+    print(f"Backend calls per request: {backend_calls / total['requests']:.2f}")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'report': report, 'statuses': recorder.statuses, 'backend_calls': backend_calls,
+                       'config': {key: value for key, value in vars(args).items() if key != 'json_path'}},
+                      f, indent=2)
+
+    failures = []
+    if total['error_rate'] > args.max_error_rate:
+        failures.append(f"error rate {total['error_rate']:.2%} exceeds {args.max_error_rate:.2%}")
+    if args.max_p99_ms is not None and total['p99_ms'] > args.max_p99_ms:
+        failures.append(f"p99 {total['p99_ms']:.1f} ms exceeds {args.max_p99_ms:.1f} ms")
+    if failures:
+        print("\nFAIL: " + '; '.join(failures))
+        return 1
+    print("\nOK")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
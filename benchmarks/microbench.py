@@ -0,0 +1,167 @@
+# benchmarks/microbench.py
+"""
+Microbenchmarks for the use cases, repositories and Flask routes.
+
+Every case runs against each fake backend at each dataset size:
+
+  backends  memory  - InMemoryTodoRepository (pure Python, no I/O)
+            latency - the same behind a fixed 1 ms delay per repository call
+            sqlite  - SqliteTodoRepository on a shared in-memory database
+  cases     uc.get_page / uc.create / uc.update / uc.delete  (use cases directly)
+            route.list / route.create / route.update / route.delete  (Flask test client)
+
+Each result records ops/sec and p50/p99 latency. Results are saved as JSON, and
+a previous run can be given with --compare to fail on regressions.
+
+    python benchmarks/microbench.py --output bench.json
+    python benchmarks/microbench.py --compare bench.json --max-regression 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.fakes import InMemoryTodoRepository, LatencyTodoRepository  # noqa: E402
+from src.application.interfaces import ITodoRepository  # noqa: E402
+from src.domain.entities import Todo  # noqa: E402
+from src.infrastructure.repositories.sqlite_repo import SqliteTodoRepository  # noqa: E402
+import api.index as index  # noqa: E402
+
+BACKENDS: Dict[str, Callable[[], ITodoRepository]] = {
+    'memory': InMemoryTodoRepository,
+    'latency': lambda: LatencyTodoRepository(InMemoryTodoRepository(), latency_seconds=0.001),
+    'sqlite': lambda: SqliteTodoRepository(':memory:'),
+}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    position = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[position]
+
+
+def run_case(setup: Callable[[int], object], operation: Callable[[object], object],
+             iterations: int, warmup: int) -> dict:
+    """Times `operation(setup(i))` per iteration; setup is not timed."""
+    for i in range(warmup):
+        operation(setup(i))
+    timings = []
+    for i in range(warmup, warmup + iterations):
+        argument = setup(i)
+        started = time.perf_counter()
+        operation(argument)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        'iterations': iterations,
+        'ops_per_sec': iterations / sum(timings),
+        'p50_us': percentile(timings, 0.50) * 1e6,
+        'p99_us': percentile(timings, 0.99) * 1e6,
+        'mean_us': statistics.fmean(timings) * 1e6,
+    }
+
+
+def build_cases(repository: ITodoRepository, size: int) -> Dict[str, tuple]:
+    """Returns {case name: (setup, operation)} wired to one seeded repository."""
+    index.container.override('use_cases', index.build_use_cases(repository))  # Inject the fake backend into the app
+    use_cases = index.get_use_cases()
+    client = index.app.test_client()
+
+    repository.add_many([Todo(task=f"Seeded task {i}") for i in range(size)])
+    existing_ids = [todo.id for todo in repository.get_page(size)]
+
+    def fresh_id(_):
+        # Deletes need a row of their own; creating it is setup, not measured
+        return repository.add(Todo(task="To be deleted")).id
+
+    def some_id(i):
+        return existing_ids[i % len(existing_ids)]
+
+    return {
+        'uc.get_page': (lambda i: None, lambda _: use_cases.get_todos_uc.execute_page()),
+        'uc.create': (lambda i: f"Task {i}", lambda task: use_cases.create_todo_uc.execute(task=task)),
+        'uc.update': (some_id, lambda todo_id: use_cases.update_todo_uc.execute(todo_id=todo_id, is_complete=True)),
+        'uc.delete': (fresh_id, lambda todo_id: use_cases.delete_todo_uc.execute(todo_id=todo_id)),
+        'route.list': (lambda i: None, lambda _: client.get('/api/todos')),
+        'route.create': (lambda i: {'task': f"Task {i}"}, lambda body: client.post('/api/todos', json=body)),
+        'route.update': (some_id, lambda todo_id: client.put(f'/api/todos/{todo_id}', json={'is_complete': True})),
+        'route.delete': (fresh_id, lambda todo_id: client.delete(f'/api/todos/{todo_id}')),
+    }
+
+
+def compare(results: List[dict], baseline_path: str, max_regression: float) -> List[str]:
+    """Returns a description of every case that got slower than the allowed margin."""
+    with open(baseline_path) as f:
+        baseline = {(r['case'], r['backend'], r['size']): r for r in json.load(f)['results']}
+    failures = []
+    for result in results:
+        previous = baseline.get((result['case'], result['backend'], result['size']))
+        if previous is None:
+            continue
+        if result['ops_per_sec'] < previous['ops_per_sec'] * (1 - max_regression):
+            failures.append(f"{result['case']} [{result['backend']}, {result['size']}]: "
+                            f"{previous['ops_per_sec']:,.0f} -> {result['ops_per_sec']:,.0f} ops/s")
+        if result['p99_us'] > previous['p99_us'] * (1 + max_regression):
+            failures.append(f"{result['case']} [{result['backend']}, {result['size']}]: "
+                            f"p99 {previous['p99_us']:,.0f} -> {result['p99_us']:,.0f} us")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 10_000])
+    parser.add_argument('--backends', nargs='+', choices=sorted(BACKENDS), default=list(BACKENDS))
+    parser.add_argument('--cases', nargs='+', help='only run cases whose name starts with one of these')
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='baseline JSON file from a previous run')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help='allowed relative drop in ops/sec (or rise in p99) before failing')
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'case':<14} {'backend':<8} {'size':>6} {'ops/s':>11} {'p50 us':>9} {'p99 us':>9}")
+    for backend in args.backends:
+        for size in args.sizes:
+            cases = build_cases(BACKENDS[backend](), size)
+            for name, (setup, operation) in cases.items():
+                if args.cases and not any(name.startswith(prefix) for prefix in args.cases):
+                    continue
+                result = run_case(setup, operation, args.iterations, args.warmup)
+                result.update(case=name, backend=backend, size=size)
+                results.append(result)
+                print(f"{name:<14} {backend:<8} {size:>6} {result['ops_per_sec']:>11,.0f} "
+                      f"{result['p50_us']:>9,.1f} {result['p99_us']:>9,.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'meta': {
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+                    'iterations': args.iterations,
+                },
+                'results': results,
+            }, f, indent=2)
+
+    if args.compare:
+        failures = compare(results, args.compare, args.max_regression)
+        if failures:
+            print("\nRegressions:")
+            for failure in failures:
+                print(f"  {failure}")
+            return 1
+        print(f"\nNo regressions beyond {args.max_regression:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
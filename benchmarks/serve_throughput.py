@@ -0,0 +1,184 @@
+# benchmarks/serve_throughput.py
+"""
+Throughput of the two ways to serve api/index.py, over real HTTP:
+
+  dev       - `python -m api.index` (Flask's debug server, one process)
+  gunicorn  - `gunicorn --config gunicorn.conf.py api.index:app`
+              (pre-forked gthread workers; counts from gunicorn.conf.py or
+              --workers / --threads)
+
+Both serve GET /api/todos from a local PostgREST stand-in that adds
+--latency-ms to every call, imitating the round trip to Supabase. Keep-alive
+clients on --concurrency threads send requests for --duration seconds; the
+report shows requests/s, p50/p99 latency and errors per server.
+
+    python benchmarks/serve_throughput.py --concurrency 32 --duration 10
+"""
+
+import argparse
+import http.client
+import json
+import os
+import shutil
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+from fake_postgrest import FakePostgrest  # noqa: E402
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def server_command(name: str, port: int, args) -> List[str]:
+    if name == 'dev':
+        return [sys.executable, '-m', 'api.index']
+    command = [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py',
+               '--bind', f"127.0.0.1:{port}", 'api.index:app']
+    if args.workers:
+        command += ['--workers', str(args.workers)]
+    if args.threads:
+        command += ['--threads', str(args.threads)]
+    return command
+
+
+def wait_until_ready(port: int, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection.request('GET', '/')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Server did not become ready in time")
+
+
+def run_load(port: int, path: str, concurrency: int, duration: float) -> Dict[str, float]:
+    """Keep-alive clients, each sending one request at a time until the duration is up."""
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        local, failed = [], 0
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                connection.request('GET', path)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    failed += 1
+                    continue
+                local.append(time.perf_counter() - started)
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests_per_sec': len(latencies) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else 0.0,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0,
+        'requests': len(latencies),
+        'errors': errors[0],
+    }
+
+
+def bench_server(name: str, fake_url: str, args) -> Dict[str, float]:
+    port = free_port()
+    env = dict(os.environ, SUPABASE_URL=fake_url, SUPABASE_KEY='benchmark-key', TODO_BACKEND='supabase',
+               PORT=str(port), PYTHONUNBUFFERED='1')
+    process = subprocess.Popen(server_command(name, port, args), cwd=ROOT, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               start_new_session=True)
+    try:
+        wait_until_ready(port, process)
+        run_load(port, args.path, args.concurrency, min(1.0, args.duration))   # Warm up every worker
+        return run_load(port, args.path, args.concurrency, args.duration)
+    finally:
+        # SIGTERM the whole group: the debug server's reloader runs the app in a child process,
+        # and gunicorn drains its workers gracefully
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=35)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass   # Already gone
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--servers', default='dev,gunicorn', help='comma-separated: dev, gunicorn')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds of load per server')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='added to every backend call')
+    parser.add_argument('--path', default='/api/todos?limit=20')
+    parser.add_argument('--workers', type=int, help='override the gunicorn worker count')
+    parser.add_argument('--threads', type=int, help='override the gunicorn threads per worker')
+    parser.add_argument('--json', dest='json_path', help='also write the results to this file')
+    args = parser.parse_args()
+
+    servers = [name.strip() for name in args.servers.split(',') if name.strip()]
+    if 'gunicorn' in servers and shutil.which('gunicorn') is None:
+        try:
+            import gunicorn  # noqa: F401
+        except ImportError:
+            print("gunicorn is not installed (pip install -r requirements.txt)")
+            return 2
+
+    results = {}
+    with FakePostgrest() as fake:
+        fake.seed([f"Task {i}" for i in range(200)])
+        fake.latency = args.latency_ms / 1000
+        for name in servers:
+            results[name] = bench_server(name, fake.url, args)
+
+    print(f"GET {args.path}, {args.concurrency} clients, {args.duration:g}s, "
+          f"{args.latency_ms:g} ms backend latency, {os.cpu_count()} CPUs")
+    print(f"  {'server':<10} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for name, result in results.items():
+        print(f"  {name:<10} {result['requests_per_sec']:9.1f} {result['p50_ms']:9.2f} "
+              f"{result['p99_ms']:9.2f} {result['errors']:7d}")
+    if 'dev' in results and 'gunicorn' in results and results['dev']['requests_per_sec']:
+        print(f"\ngunicorn / dev throughput: "
+              f"{results['gunicorn']['requests_per_sec'] / results['dev']['requests_per_sec']:.2f}x")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+# benchmarks/todo_mapping.py
+"""
+Memory and throughput benchmark for mapping a large todo list response.
+
+Compares three ways of turning PostgREST rows into the list JSON body:
+
+  * dict-backed  - the original path: a dict-backed Todo per row, then a dict per
+                   row in the route, then json.dumps (what jsonify does)
+  * slots        - the same path with the __slots__-based Todo
+  * columnar     - TodoBatch.from_rows + serializers.todos_to_json (current path)
+
+For each it reports the best wall time over several repeats, the peak traced
+memory while mapping + serializing, and the memory and object count retained
+per row by the mapped structure (what a cache entry or in-flight page holds).
+
+    python benchmarks/todo_mapping.py --rows 100000 --repeats 5
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from src.domain.entities import Todo, TodoBatch  # noqa: E402
+from src.interface_adapters.serializers import todos_to_json  # noqa: E402
+
+
+class DictTodo:
+    """The original dict-backed Todo, kept here as the comparison baseline."""
+    def __init__(self, task, id=None, is_complete=False):
+        if not task:
+            raise ValueError("Task cannot be empty.")
+        self.id = id
+        self.task = task
+        self.is_complete = is_complete
+
+
+def make_rows(count: int) -> list:
+    return [{'id': i, 'task': f"Task number {i}", 'is_complete': i % 3 == 0} for i in range(1, count + 1)]
+
+
+def map_entities(entity_class):
+    def mapper(rows):
+        return [entity_class(id=str(row['id']), task=row['task'], is_complete=row['is_complete']) for row in rows]
+    return mapper
+
+
+def serialize_entities(todos) -> str:
+    return json.dumps(
+        [{'id': todo.id, 'task': todo.task, 'is_complete': todo.is_complete} for todo in todos],
+        separators=(',', ':')
+    )
+
+
+STRATEGIES = {
+    'dict-backed': (map_entities(DictTodo), serialize_entities),
+    'slots': (map_entities(Todo), serialize_entities),
+    'columnar': (TodoBatch.from_rows, todos_to_json),
+}
+
+
+def measure(rows: list, mapper, serializer, repeats: int) -> dict:
+    # Throughput: best of N full map + serialize passes
+    best = float('inf')
+    for _ in range(repeats):
+        started = time.perf_counter()
+        serializer(mapper(rows))
+        best = min(best, time.perf_counter() - started)
+
+    # Retained size of the mapped structure alone
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    mapped = mapper(rows)
+    retained_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained_blocks = sys.getallocatedblocks() - blocks_before
+    del mapped
+
+    # Peak while mapping and serializing
+    gc.collect()
+    tracemalloc.start()
+    serializer(mapper(rows))
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = len(rows)
+    return {
+        'best_seconds': best,
+        'rows_per_second': count / best,
+        'peak_bytes': peak_bytes,
+        'retained_bytes_per_row': retained_bytes / count,
+        'retained_objects_per_row': retained_blocks / count,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--json', dest='json_path', help='also write the results to this file')
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    # Every strategy must produce the same body
+    bodies = {name: serializer(mapper(rows[:100])) for name, (mapper, serializer) in STRATEGIES.items()}
+    assert len(set(bodies.values())) == 1, "strategies disagree on the JSON output"
+
+    results = {name: measure(rows, mapper, serializer, args.repeats)
+               for name, (mapper, serializer) in STRATEGIES.items()}
+
+    print(f"{args.rows} rows, best of {args.repeats}:")
+    print(f"  {'strategy':<12} {'rows/s':>12} {'peak MiB':>10} {'bytes/row':>10} {'objects/row':>12}")
+    for name, result in results.items():
+        print(f"  {name:<12} {result['rows_per_second']:>12,.0f} {result['peak_bytes'] / 2**20:>10.1f} "
+              f"{result['retained_bytes_per_row']:>10.1f} {result['retained_objects_per_row']:>12.2f}")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump({'rows': args.rows, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+# gunicorn.conf.py - Production server settings for the Flask app (api/index.py)
+#
+# Used by the Docker image (`gunicorn --config gunicorn.conf.py api.index:app`).
+# Vercel does not read it: there every instance is a single serverless function.
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# --- Concurrency ---
+# One pre-forked process per core for CPU parallelism (the GIL limits a process to one
+# core; more processes than cores only contend), each with a thread pool so requests
+# overlap while they wait on Supabase round trips. Keep the threads within the backend
+# connection pool (TODO_BACKEND_POOL_SIZE).
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get("GUNICORN_THREADS", "16"))
+
+# State that lives in each worker's memory, and how it behaves across workers:
+#   - list ETags: each carries its process's epoch and the current
+#     TODO_ETAG_MAX_AGE_SECONDS window, so another worker's write is seen within that window;
+#   - read cache (TODO_CACHE_TTL_SECONDS): invalidated by this worker's writes only, so
+#     other workers' writes show up when entries expire (keep the TTL short, or off);
+#   - change log behind /api/todos/changes: every seq carries its process's epoch, so a
+#     position from another worker (or from before a restart) is answered with a reset
+#     and the client reloads the list once; deltas never come from the wrong log;
+#   - SSE hub behind /api/todos/events: a stream only pushes writes made by its own
+#     worker; clients catch up on the rest with a sync when they reconnect or regain focus;
+#   - search index: other workers' writes show up at its next reload
+#     (TODO_SEARCH_INDEX_MAX_AGE_SECONDS);
+#   - /metrics and Server-Timing: each scrape sees one worker's counters.
+# WEB_CONCURRENCY=1 makes all of it exact, at the cost of one core.
+
+# Every open /api/todos/events stream holds one of those threads for as long as it is
+# connected: unless configured, let streams take at most a quarter of them, so that
+# open tabs can never starve a worker of threads for ordinary requests. That caps push at a
+# few streams per worker: route /api/todos/events to the ASGI app (api/asgi.py, e.g. under
+# uvicorn), where a waiting stream is an idle coroutine and thousands fit in one process.
+os.environ.setdefault("TODO_SSE_MAX_SUBSCRIBERS", str(max(1, threads // 4)))
+
+# Import the app once in the master; workers share its memory copy-on-write and start faster
+preload_app = True
+
+# --- Timeouts ---
+timeout = 30            # A worker silent for this long is killed and replaced
+graceful_timeout = 30   # On SIGTERM: stop accepting, let in-flight requests finish for up to this long
+keepalive = 5           # Seconds an idle keep-alive connection is held open
+
+accesslog = '-'
+errorlog = '-'
+
+
+def post_fork(server, worker):
+    """
+    Each worker builds its own wiring (Supabase client and connection pool,
+    thread pools, caches, background threads) on its first request: none of
+    that can be shared safely across fork, so drop anything the master built.
+    """
+    from api.index import reset_use_cases
+    reset_use_cases()
@@ -1,18 +1,155 @@
 # src/application/interfaces.py
 
 from abc import ABC, abstractmethod
-from typing import List
-from ..domain.entities import Todo
+from typing import List, Optional, Sequence
+from ..domain.entities import ChangeSet, Todo
+from ..domain.exceptions import TodoNotFoundError
+from ..domain.query import KeysetPosition, TodoQuery
 
 class ITodoRepository(ABC):
     """Abstract interface (contract) for any Todo data storage."""
     
     @abstractmethod
-    def get_all(self) -> List[Todo]:
-        """Retrieves all Todo items."""
+    def get_all(self) -> Sequence[Todo]:
+        """Retrieves all Todo items (a list, or a columnar TodoBatch)."""
+        pass
+
+    @abstractmethod
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        """
+        Retrieves at most `limit` Todo items ordered by ID, starting
+        strictly after `after_id` (or from the beginning when None).
+        """
         pass
         
     @abstractmethod
     def add(self, todo: Todo) -> Todo:
         """Adds a new Todo item to the storage."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        """Updates the completion status of a Todo item (raises TodoNotFoundError)."""
+        pass
+
+    @abstractmethod
+    def delete(self, todo_id: str) -> bool:
+        """Deletes a Todo item; returns False if it did not exist."""
+        pass
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        """
+        Retrieves at most `limit` Todo items matching `query`, in its sort
+        order, starting strictly after the (sort value, ID) position `after`.
+        Columns outside `query.columns()` may be left unset.
+
+        The default filters and sorts get_all() in memory; storage backends
+        should override it to push the query down.
+        """
+        return query.apply(self.get_all(), limit, after)
+
+    def get_version(self) -> Optional[str]:
+        """
+        Returns a cheap token that changes whenever the collection changes,
+        or None when the storage cannot provide one (the default).
+        """
+        return None
+
+    def get_changes(self, since: Optional[int]) -> Optional[ChangeSet]:
+        """
+        Returns the changes (latest state or tombstone per ID) made after
+        sequence number `since`, or just the current sequence when `since` is
+        None. Returns None when the storage does not track changes (the default).
+        """
+        return None
+
+    # --- Bulk operations ---
+    # The defaults below fall back to one call per item so every repository
+    # supports them; storage backends should override them with a single round trip.
+
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        """Adds several Todo items, returning them (with IDs) in input order."""
+        return [self.add(todo) for todo in todos]
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        """Sets the same status on every listed ID; returns only the Todos that existed."""
+        updated = []
+        for todo_id in todo_ids:
+            try:
+                updated.append(self.update_status(todo_id, is_complete))
+            except TodoNotFoundError:
+                pass
+        return updated
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        """Deletes every listed ID; returns the IDs that were actually deleted."""
+        return [todo_id for todo_id in todo_ids if self.delete(todo_id)]
+
+
+class ITodoListener(ABC):
+    """
+    Observer notified by the write use cases after a change has been stored,
+    so derived state (indexes, change feeds) can follow along. Every hook is
+    optional: the defaults ignore the event.
+    """
+
+    def todos_created(self, todos: List[Todo]) -> None:
+        pass
+
+    def todos_updated(self, todos: List[Todo]) -> None:
+        pass
+
+    def todos_deleted(self, todo_ids: List[str]) -> None:
+        pass
+
+
+class ITodoSearchIndex(ABC):
+    """Contract for a text index over the Todo tasks."""
+
+    @abstractmethod
+    def search(self, text: str, limit: int) -> List[Todo]:
+        """Returns up to `limit` Todos (ordered by ID) matching every word of `text` as a prefix."""
+        pass
+
+
+class IAsyncTodoRepository(ABC):
+    """
+    Asynchronous counterpart of ITodoRepository, for non-blocking I/O
+    on the ASGI serving path. Same contract, awaitable methods.
+    """
+
+    @abstractmethod
+    async def get_all(self) -> Sequence[Todo]:
+        """Retrieves all Todo items (a list, or a columnar TodoBatch)."""
+        pass
+
+    @abstractmethod
+    async def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        """Retrieves at most `limit` Todo items ordered by ID, strictly after `after_id`."""
+        pass
+
+    @abstractmethod
+    async def add(self, todo: Todo) -> Todo:
+        """Adds a new Todo item to the storage."""
+        pass
+
+    @abstractmethod
+    async def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        """Updates the completion status of a Todo item (raises TodoNotFoundError)."""
+        pass
+
+    @abstractmethod
+    async def delete(self, todo_id: str) -> bool:
+        """Deletes a Todo item; returns False if it did not exist."""
+        pass
+
+    def get_changes(self, since: Optional[int]) -> Optional[ChangeSet]:
+        """
+        Same as ITodoRepository.get_changes. Not awaited: change logs live in
+        memory. Returns None when the storage does not track changes (the default).
+        """
+        return None
+
+    async def aclose(self) -> None:
+        """Releases pooled connections; the default has nothing to release."""
+        return None
@@ -0,0 +1,63 @@
+# src/domain/async_use_cases.py
+
+from typing import Optional, Sequence
+from .entities import ChangeSet, Todo, TodoPage
+from .exceptions import InvalidInputError
+from .pagination import DEFAULT_PAGE_SIZE, check_limit, decode_cursor, build_page
+from ..application.interfaces import IAsyncTodoRepository # Dependency pointing INWARD (abstraction)
+
+# Async variants of the use cases in use_cases.py, for the ASGI serving path.
+# The business rules are identical; only the repository calls are awaited.
+
+class AsyncGetTodosUseCase:
+    """Gets Todos without blocking the event loop."""
+    def __init__(self, repository: IAsyncTodoRepository):
+        self.repository = repository
+
+    async def execute(self) -> Sequence[Todo]:
+        return await self.repository.get_all()
+
+    async def execute_page(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> TodoPage:
+        """Gets one keyset-paginated page of Todos, ordered by ID."""
+        check_limit(limit)
+        after_id = decode_cursor(cursor) if cursor else None
+        rows = await self.repository.get_page(limit + 1, after_id)
+        return build_page(rows, limit)
+
+class AsyncGetTodoChangesUseCase:
+    """Gets what changed since a sequence number, for clients that keep a local copy of the list."""
+    def __init__(self, repository: IAsyncTodoRepository):
+        self.repository = repository
+
+    async def execute(self, since: Optional[int] = None) -> ChangeSet:
+        if since is not None and since < 0:
+            raise InvalidInputError("'since' must be a non-negative sequence number.")
+        change_set = self.repository.get_changes(since)   # In memory: nothing to await
+        # Storage without a change log: clients always reload the full list
+        return change_set if change_set is not None else ChangeSet([], None, reset=True)
+
+class AsyncCreateTodoUseCase:
+    """Creates a new Todo item."""
+    def __init__(self, repository: IAsyncTodoRepository):
+        self.repository = repository
+
+    async def execute(self, task: str) -> Todo:
+        # Business logic: validate the input before creation
+        new_todo = Todo(task=task)
+        return await self.repository.add(new_todo)
+
+class AsyncUpdateTodoUseCase:
+    """Updates the status (e.g., is_complete) of an existing Todo."""
+    def __init__(self, repository: IAsyncTodoRepository):
+        self.repository = repository
+
+    async def execute(self, todo_id: str, is_complete: bool) -> Todo:
+        return await self.repository.update_status(todo_id, is_complete)
+
+class AsyncDeleteTodoUseCase:
+    """Deletes an existing Todo item."""
+    def __init__(self, repository: IAsyncTodoRepository):
+        self.repository = repository
+
+    async def execute(self, todo_id: str) -> bool:
+        return await self.repository.delete(todo_id)
@@ -1,9 +1,12 @@
 # src/domain/entities.py
 
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
 
 class Todo:
     """The core business entity for a To-Do item."""
+    # No per-instance __dict__: large lists of Todos take about a quarter less memory
+    __slots__ = ('id', 'task', 'is_complete')
+
     def __init__(self, task: str, id: Optional[str] = None, is_complete: bool = False):
         if not task:
             raise ValueError("Task cannot be empty.")
@@ -12,4 +15,122 @@ class Todo:
         self.is_complete = is_complete
     
     def __repr__(self):
-        return f"Todo(id={self.id}, task='{self.task}', is_complete={self.is_complete})"
\ No newline at end of file
+        return f"Todo(id={self.id}, task='{self.task}', is_complete={self.is_complete})"
+
+class TodoBatch:
+    """
+    A columnar, read-only list of Todos: parallel arrays of IDs, tasks and
+    completion flags (one byte each). Repositories build it straight from
+    rows and serializers read the columns directly, so a list request does
+    not allocate a Todo per row. It still behaves like a Sequence[Todo]:
+    indexing or iterating materializes Todo entities on demand.
+    """
+    __slots__ = ('ids', 'tasks', 'completed')
+
+    def __init__(self, ids: Optional[List[str]] = None, tasks: Optional[List[str]] = None,
+                 completed: Optional[bytearray] = None):
+        self.ids = ids if ids is not None else []
+        self.tasks = tasks if tasks is not None else []
+        self.completed = completed if completed is not None else bytearray()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> 'TodoBatch':
+        """Builds a batch from storage rows with 'id', 'task' and 'is_complete' keys."""
+        ids, tasks, completed = [], [], bytearray()
+        for row in rows:
+            ids.append(str(row['id']))
+            tasks.append(row['task'])
+            completed.append(1 if row['is_complete'] else 0)
+        return cls(ids, tasks, completed)
+
+    @classmethod
+    def from_partial_rows(cls, rows: Iterable[dict]) -> 'TodoBatch':
+        """
+        Like from_rows, for rows from a projected select: columns that were
+        not selected are left as None (tasks) or 0 (completion flags).
+        """
+        ids, tasks, completed = [], [], bytearray()
+        for row in rows:
+            ids.append(str(row['id']))
+            tasks.append(row.get('task'))
+            completed.append(1 if row.get('is_complete') else 0)
+        return cls(ids, tasks, completed)
+
+    @classmethod
+    def from_todos(cls, todos: Iterable[Todo]) -> 'TodoBatch':
+        ids, tasks, completed = [], [], bytearray()
+        for todo in todos:
+            ids.append(todo.id)
+            tasks.append(todo.task)
+            completed.append(1 if todo.is_complete else 0)
+        return cls(ids, tasks, completed)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Todo, 'TodoBatch']:
+        if isinstance(index, slice):
+            return TodoBatch(self.ids[index], self.tasks[index], self.completed[index])
+        return Todo(id=self.ids[index], task=self.tasks[index], is_complete=bool(self.completed[index]))
+
+    def __iter__(self) -> Iterator[Todo]:
+        for todo_id, task, is_complete in zip(self.ids, self.tasks, self.completed):
+            yield Todo(id=todo_id, task=task, is_complete=bool(is_complete))
+
+    def __repr__(self):
+        return f"TodoBatch(size={len(self)})"
+
+class TodoPage:
+    """One bounded slice of the Todo list, ordered by ID."""
+    def __init__(self, items: Sequence[Todo], next_cursor: Optional[str] = None):
+        self.items = items
+        # Opaque cursor for the following page, or None when this is the last page
+        self.next_cursor = next_cursor
+
+    def __repr__(self):
+        return f"TodoPage(items={len(self.items)}, next_cursor={self.next_cursor!r})"
+
+class TodoChange:
+    """One entry of the change feed: a Todo's latest state, or a tombstone (todo is None) if deleted."""
+    __slots__ = ('seq', 'todo_id', 'todo')
+
+    def __init__(self, seq: int, todo_id: str, todo: Optional[Todo] = None):
+        self.seq = seq
+        self.todo_id = todo_id
+        self.todo = todo
+
+    @property
+    def deleted(self) -> bool:
+        return self.todo is None
+
+    def __repr__(self):
+        return f"TodoChange(seq={self.seq}, todo_id={self.todo_id}, deleted={self.deleted})"
+
+class ChangeSet:
+    """
+    What changed after a sequence number. `seq` is the position to ask from
+    next time; `reset` means the changes cannot be replayed from there (the
+    log was trimmed, or the position comes from another process) and the
+    client must reload the full list.
+    """
+    def __init__(self, changes: List[TodoChange], seq: Optional[int], reset: bool = False):
+        self.changes = changes
+        self.seq = seq
+        self.reset = reset
+
+    def __repr__(self):
+        return f"ChangeSet(changes={len(self.changes)}, seq={self.seq}, reset={self.reset})"
+
+class BatchItemResult:
+    """The outcome of a single item within a batch operation."""
+    def __init__(self, todo: Optional[Todo] = None, todo_id: Optional[str] = None, error: Optional[str] = None):
+        self.todo = todo
+        self.todo_id = todo_id if todo_id is not None else (todo.id if todo else None)
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        return f"BatchItemResult(todo_id={self.todo_id}, ok={self.ok}, error={self.error!r})"
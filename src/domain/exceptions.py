@@ -1,5 +1,7 @@
 # src/domain/exceptions.py
 
+from typing import Optional
+
 class DomainException(Exception):
     """Base exception for all domain-specific errors."""
     pass
@@ -13,4 +15,10 @@ class TodoNotFoundError(DomainException):
 class InvalidInputError(DomainException):
     """Raised when data passed to a Use Case or Entity is invalid."""
     def __init__(self, message: str):
-        super().__init__(message)
\ No newline at end of file
+        super().__init__(message)
+
+class BackendUnavailableError(DomainException):
+    """Raised when the storage backend cannot answer (timeout, outage, open circuit breaker)."""
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after  # Seconds until it is worth trying again, when known
+        super().__init__(message)
@@ -0,0 +1,90 @@
+# src/domain/pagination.py
+
+import base64
+import binascii
+import json
+from typing import Any, List, Optional
+from .entities import Todo, TodoPage
+from .exceptions import InvalidInputError
+from .query import KeysetPosition, TodoQuery, field_value
+
+# Page size used when the client does not ask for one, and the hard upper bound.
+# The bound stays below PostgREST's default max-rows (1000) so that the extra
+# "look-ahead" row fetched by GetTodosUseCase is never silently truncated.
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(last_id: str, sort: str = 'id', after_value: Any = None) -> str:
+    """
+    Encodes the position of the last item on a page into an opaque, URL-safe
+    cursor. Sorted pages also record the sort and the item's sort value.
+    """
+    payload = {'id': last_id}
+    if sort != 'id':
+        payload['sort'] = sort
+        payload['after'] = after_value
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+# Type of the sort value a cursor records, per sortable column other than the ID
+_SORT_VALUE_TYPES = {'task': str, 'is_complete': bool}
+
+
+def decode_keyset_cursor(cursor: str, sort: str = 'id') -> KeysetPosition:
+    """
+    Decodes a cursor back into (sort value, last seen ID). A cursor is only
+    valid for the sort it was issued for, and only with a numeric ID and a
+    sort value of the sort column's type: anything else is rejected here,
+    so no backend ever receives a position it cannot compare.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        last_id = payload['id']
+        if isinstance(last_id, bool) or not isinstance(last_id, (str, int)):
+            raise ValueError("cursor ID is not a number")
+        last_id = str(last_id)
+        if not (last_id.isascii() and last_id.isdigit()):
+            raise ValueError("cursor ID is not a number")
+        if payload.get('sort', 'id') != sort:
+            raise ValueError("cursor was issued for another sort")
+        if sort.lstrip('-') == 'id':
+            return last_id, last_id
+        after = payload['after']
+        # Exact type: bool is an int, and an int is no task
+        if type(after) is not _SORT_VALUE_TYPES[sort.lstrip('-')]:
+            raise ValueError("cursor sort value has the wrong type")
+        return after, last_id
+    except (binascii.Error, ValueError, UnicodeError, KeyError, TypeError, AttributeError):
+        raise InvalidInputError("Invalid pagination cursor.")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Decodes a cursor produced by encode_cursor back into the last seen ID."""
+    return decode_keyset_cursor(cursor)[1]
+
+
+def check_limit(limit: int) -> None:
+    """Business rule: every page request does bounded work, whatever the table size."""
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise InvalidInputError(f"Limit must be between 1 and {MAX_PAGE_SIZE}.")
+
+
+def build_page(rows: List[Todo], limit: int, query: Optional[TodoQuery] = None) -> TodoPage:
+    """
+    Builds a page from `limit + 1` fetched rows: the extra look-ahead row
+    only tells us whether another page exists (no COUNT query needed).
+    """
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = len(items) - 1
+        if query is None:
+            next_cursor = encode_cursor(field_value(items, last, 'id'))
+        else:
+            next_cursor = encode_cursor(
+                field_value(items, last, 'id'), query.sort_spec, field_value(items, last, query.sort)
+            )
+    return TodoPage(items=items, next_cursor=next_cursor)
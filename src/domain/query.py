@@ -0,0 +1,104 @@
+# src/domain/query.py
+
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from .entities import Todo, TodoBatch
+from .exceptions import InvalidInputError
+
+# Columns a list request may sort on or select. Every sort falls back to the
+# ID as a tie-breaker, so the order is total and keyset paging is stable.
+SORT_FIELDS = ('id', 'task', 'is_complete')
+FIELDS = ('id', 'task', 'is_complete')
+
+# Keeps the substring filter a bounded amount of work for the database
+MAX_TASK_FILTER_LENGTH = 200
+
+# Keyset position for a sorted query: (sort value, ID) of the last row already seen
+KeysetPosition = Tuple[Any, str]
+
+
+def field_value(todos: Sequence[Todo], index: int, field: str) -> Any:
+    """Reads one field of one row, straight from the columns when given a TodoBatch."""
+    if isinstance(todos, TodoBatch):
+        if field == 'id':
+            return todos.ids[index]
+        if field == 'task':
+            return todos.tasks[index]
+        return bool(todos.completed[index])
+    return getattr(todos[index], field)
+
+
+class TodoQuery:
+    """
+    What a list request asks for beyond paging: filters (completion status,
+    case-insensitive substring of the task), a sort order and a sparse
+    fieldset. Storage backends translate it into their own query language;
+    `apply` is the in-memory reference behavior.
+    """
+    __slots__ = ('is_complete', 'task_contains', 'sort', 'descending', 'fields')
+
+    def __init__(self, is_complete: Optional[bool] = None, task_contains: Optional[str] = None,
+                 sort: str = 'id', descending: bool = False, fields: Optional[Sequence[str]] = None):
+        if sort not in SORT_FIELDS:
+            raise InvalidInputError(f"Cannot sort by '{sort}' (expected one of: {', '.join(SORT_FIELDS)}).")
+        if task_contains is not None and len(task_contains) > MAX_TASK_FILTER_LENGTH:
+            raise InvalidInputError(f"Task filter cannot be longer than {MAX_TASK_FILTER_LENGTH} characters.")
+        if fields is not None:
+            unknown = [field for field in fields if field not in FIELDS]
+            if unknown or not fields:
+                raise InvalidInputError(f"Unknown fields requested (expected some of: {', '.join(FIELDS)}).")
+            # Canonical column order, duplicates removed
+            fields = tuple(field for field in FIELDS if field in fields)
+
+        self.is_complete = is_complete
+        self.task_contains = task_contains or None
+        self.sort = sort
+        self.descending = descending
+        self.fields = fields
+
+    @property
+    def is_default(self) -> bool:
+        """True for plain ID-ordered paging over whole rows (the get_page fast path)."""
+        return (self.is_complete is None and self.task_contains is None
+                and self.sort == 'id' and not self.descending and self.fields is None)
+
+    @property
+    def sort_spec(self) -> str:
+        """The sort as written in the query string: 'task', '-task', ..."""
+        return ('-' if self.descending else '') + self.sort
+
+    def key(self) -> tuple:
+        """Hashable identity of the query, for caches and request coalescing."""
+        return (self.is_complete, self.task_contains, self.sort, self.descending, self.fields)
+
+    def columns(self) -> Tuple[str, ...]:
+        """Columns a backend must read: the requested fields plus what paging needs (ID, sort key)."""
+        wanted = set(self.fields or FIELDS) | {'id', self.sort}
+        return tuple(column for column in FIELDS if column in wanted)
+
+    # --- In-memory reference implementation ---
+    def matches(self, todo: Todo) -> bool:
+        if self.is_complete is not None and todo.is_complete != self.is_complete:
+            return False
+        if self.task_contains is not None and self.task_contains.lower() not in todo.task.lower():
+            return False
+        return True
+
+    def _order_key(self, value: Any, todo_id: str) -> tuple:
+        # IDs are numeric in every backend: compare them as numbers, not strings
+        return (int(value) if self.sort == 'id' else value, int(todo_id))
+
+    def apply(self, todos: Iterable[Todo], limit: int, after: Optional[KeysetPosition] = None) -> List[Todo]:
+        """Filters, sorts and keyset-pages Todos in memory (for repositories that cannot push it down)."""
+        rows = [todo for todo in todos if self.matches(todo)]
+        rows.sort(key=lambda todo: self._order_key(getattr(todo, self.sort), todo.id), reverse=self.descending)
+        if after is not None:
+            position = self._order_key(*after)
+            if self.descending:
+                rows = [t for t in rows if self._order_key(getattr(t, self.sort), t.id) < position]
+            else:
+                rows = [t for t in rows if self._order_key(getattr(t, self.sort), t.id) > position]
+        return rows[:limit]
+
+    def __repr__(self):
+        return (f"TodoQuery(is_complete={self.is_complete}, task_contains={self.task_contains!r}, "
+                f"sort={self.sort_spec!r}, fields={self.fields})")
@@ -1,59 +1,229 @@
 # src/domain/use_cases.py
 
-from typing import List
-from .entities import Todo
-from ..application.interfaces import ITodoRepository # Dependency pointing INWARD (abstraction)
+from typing import Iterator, List, Optional, Sequence, Tuple
+from .entities import ChangeSet, Todo, TodoPage, BatchItemResult
+from .exceptions import InvalidInputError, TodoNotFoundError
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, check_limit, decode_cursor, decode_keyset_cursor, build_page
+from .query import TodoQuery
+from ..application.interfaces import ITodoRepository, ITodoListener, ITodoSearchIndex # Dependency pointing INWARD (abstraction)
+
+# Upper bound on items per batch request, keeping each bulk call a single bounded query
+MAX_BATCH_SIZE = 500
+
+def _check_batch_size(items: list) -> None:
+    if not items:
+        raise InvalidInputError("Batch must contain at least one item.")
+    if len(items) > MAX_BATCH_SIZE:
+        raise InvalidInputError(f"Batch cannot contain more than {MAX_BATCH_SIZE} items.")
+
+# Upper bound on results per search request
+MAX_SEARCH_RESULTS = 100
+
+def _notify(listeners: Sequence[ITodoListener], event: str, items: list) -> None:
+    """Tells every listener about a stored change. A failing listener never fails the write."""
+    if not items:
+        return
+    for listener in listeners:
+        try:
+            getattr(listener, event)(items)
+        except Exception as e:
+            print(f"Todo listener {type(listener).__name__}.{event} failed: {e}")
 
 class GetTodosUseCase:
     """Gets the entire list of Todos."""
     def __init__(self, repository: ITodoRepository):
         self.repository = repository
         
-    def execute(self) -> List[Todo]:
+    def execute(self) -> Sequence[Todo]:
         return self.repository.get_all()
 
+    def execute_page(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None,
+                     query: Optional[TodoQuery] = None) -> TodoPage:
+        """
+        Gets one keyset-paginated page of Todos, ordered by ID unless `query`
+        asks for filters, another sort or a subset of fields.
+        """
+        after = self._position(limit, cursor, query)
+        if query is None or query.is_default:
+            # Fetch one extra row to learn whether another page exists
+            rows = self.repository.get_page(limit + 1, after)
+            return build_page(rows, limit)
+
+        rows = self.repository.find_page(query, limit + 1, after)
+        return build_page(rows, limit, query)
+
+    def page_key(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None,
+                 query: Optional[TodoQuery] = None) -> tuple:
+        """
+        Validates a page request like execute_page, without reading anything,
+        and returns what identifies the page: (limit, decoded position, query).
+        """
+        after = self._position(limit, cursor, query)
+        return limit, after, query.key() if query is not None and not query.is_default else None
+
+    @staticmethod
+    def _position(limit: int, cursor: Optional[str], query: Optional[TodoQuery]):
+        """Checks the limit and decodes the cursor: the last seen ID, or a keyset position for a query."""
+        check_limit(limit)
+        if not cursor:
+            return None
+        if query is None or query.is_default:
+            return decode_cursor(cursor)
+        return decode_keyset_cursor(cursor, query.sort_spec)
+
+    def iter_pages(self, page_size: int = MAX_PAGE_SIZE) -> Iterator[Sequence[Todo]]:
+        """
+        Lazily walks the whole list one keyset page at a time, so a full export
+        holds at most one page in memory and can start streaming immediately.
+        """
+        check_limit(page_size)
+        after_id = None
+        while True:
+            rows = self.repository.get_page(page_size, after_id)
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1].id
+
+    def current_version(self) -> Optional[str]:
+        """Cheap collection version for cache validation (None if unsupported)."""
+        return self.repository.get_version()
+
+class GetTodoChangesUseCase:
+    """Gets what changed since a sequence number, for clients that keep a local copy of the list."""
+    def __init__(self, repository: ITodoRepository):
+        self.repository = repository
+
+    def execute(self, since: Optional[int] = None) -> ChangeSet:
+        if since is not None and since < 0:
+            raise InvalidInputError("'since' must be a non-negative sequence number.")
+        change_set = self.repository.get_changes(since)
+        # Storage without a change log: clients always reload the full list
+        return change_set if change_set is not None else ChangeSet([], None, reset=True)
+
 class CreateTodoUseCase:
     """Creates a new Todo item."""
-    def __init__(self, repository: ITodoRepository):
+    def __init__(self, repository: ITodoRepository, listeners: Sequence[ITodoListener] = ()):
         self.repository = repository
+        self.listeners = listeners
         
     def execute(self, task: str) -> Todo:
         # Business logic: validate the input before creation
         new_todo = Todo(task=task) 
-        return self.repository.add(new_todo)
+        created = self.repository.add(new_todo)
+        _notify(self.listeners, 'todos_created', [created])
+        return created
 
 class UpdateTodoUseCase:
     """Updates the status (e.g., is_complete) of an existing Todo."""
-    def __init__(self, repository: ITodoRepository):
+    def __init__(self, repository: ITodoRepository, listeners: Sequence[ITodoListener] = ()):
         self.repository = repository
+        self.listeners = listeners
         
     def execute(self, todo_id: str, is_complete: bool) -> Todo:
         # Business logic: Validation that the ID exists would go here.
         # We assume the ID is valid for now and let the repository handle the lookup/update.
-        return self.repository.update_status(todo_id, is_complete)
+        updated = self.repository.update_status(todo_id, is_complete)
+        _notify(self.listeners, 'todos_updated', [updated])
+        return updated
 
 class DeleteTodoUseCase:
     """Deletes an existing Todo item."""
-    def __init__(self, repository: ITodoRepository):
+    def __init__(self, repository: ITodoRepository, listeners: Sequence[ITodoListener] = ()):
         self.repository = repository
+        self.listeners = listeners
         
     def execute(self, todo_id: str) -> bool:
-        return self.repository.delete(todo_id)
-    
-class UpdateTodoUseCase:
-    """Updates the status (e.g., is_complete) of an existing Todo."""
-    def __init__(self, repository: ITodoRepository):
+        deleted = self.repository.delete(todo_id)
+        if deleted:
+            _notify(self.listeners, 'todos_deleted', [todo_id])
+        return deleted
+
+class SearchTodosUseCase:
+    """Finds Todos whose task contains every searched word (as a word prefix)."""
+    def __init__(self, index: ITodoSearchIndex):
+        self.index = index
+
+    def execute(self, text: str, limit: int = 20) -> List[Todo]:
+        if not text or not text.strip():
+            raise InvalidInputError("Search text cannot be empty.")
+        if limit < 1 or limit > MAX_SEARCH_RESULTS:
+            raise InvalidInputError(f"Limit must be between 1 and {MAX_SEARCH_RESULTS}.")
+        return self.index.search(text, limit)
+
+
+# --- Batch Use Cases: one repository round trip per call ---
+
+class BatchCreateTodosUseCase:
+    """Creates several Todo items with a single bulk insert."""
+    def __init__(self, repository: ITodoRepository, listeners: Sequence[ITodoListener] = ()):
         self.repository = repository
-        
-    def execute(self, todo_id: str, is_complete: bool) -> Todo:
-        # Business logic: Validation that the ID exists would go here.
-        # We assume the ID is valid for now and let the repository handle the lookup/update.
-        return self.repository.update_status(todo_id, is_complete)
+        self.listeners = listeners
 
-class DeleteTodoUseCase:
-    """Deletes an existing Todo item."""
-    def __init__(self, repository: ITodoRepository):
+    def execute(self, tasks: List[str]) -> List[BatchItemResult]:
+        _check_batch_size(tasks)
+
+        # Business logic: validate every task; only the valid ones are inserted
+        outcomes = []
+        valid_todos = []
+        for task in tasks:
+            try:
+                todo = Todo(task=task)
+            except ValueError as e:
+                outcomes.append(str(e))
+                continue
+            valid_todos.append(todo)
+            outcomes.append(todo)
+
+        # add_many returns the created Todos in input order
+        created_todos = self.repository.add_many(valid_todos) if valid_todos else []
+        _notify(self.listeners, 'todos_created', created_todos)
+        created = iter(created_todos)
+        return [
+            BatchItemResult(todo=next(created)) if isinstance(outcome, Todo)
+            else BatchItemResult(error=outcome)
+            for outcome in outcomes
+        ]
+
+class BatchUpdateTodosUseCase:
+    """Updates the status of several Todos with at most one bulk update per status value."""
+    def __init__(self, repository: ITodoRepository, listeners: Sequence[ITodoListener] = ()):
         self.repository = repository
-        
-    def execute(self, todo_id: str) -> bool:
-        return self.repository.delete(todo_id)
\ No newline at end of file
+        self.listeners = listeners
+
+    def execute(self, updates: List[Tuple[str, bool]]) -> List[BatchItemResult]:
+        _check_batch_size(updates)
+
+        # Business logic: the last status given for an ID wins
+        final_status = dict(updates)
+        updated = {}
+        for is_complete in (True, False):
+            ids = [todo_id for todo_id, status in final_status.items() if status is is_complete]
+            for todo in self.repository.update_status_many(ids, is_complete) if ids else []:
+                updated[todo.id] = todo
+        _notify(self.listeners, 'todos_updated', list(updated.values()))
+
+        return [
+            BatchItemResult(todo_id=todo_id, todo=updated[todo_id]) if todo_id in updated
+            else BatchItemResult(todo_id=todo_id, error=str(TodoNotFoundError(todo_id)))
+            for todo_id, _ in updates
+        ]
+
+class BatchDeleteTodosUseCase:
+    """Deletes several Todo items with a single bulk delete."""
+    def __init__(self, repository: ITodoRepository, listeners: Sequence[ITodoListener] = ()):
+        self.repository = repository
+        self.listeners = listeners
+
+    def execute(self, todo_ids: List[str]) -> List[BatchItemResult]:
+        _check_batch_size(todo_ids)
+
+        deleted_ids = self.repository.delete_many(list(dict.fromkeys(todo_ids)))
+        _notify(self.listeners, 'todos_deleted', deleted_ids)
+        deleted = set(deleted_ids)
+        return [
+            BatchItemResult(todo_id=todo_id) if todo_id in deleted
+            else BatchItemResult(todo_id=todo_id, error=str(TodoNotFoundError(todo_id)))
+            for todo_id in todo_ids
+        ]
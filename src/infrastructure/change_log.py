@@ -0,0 +1,111 @@
+# src/infrastructure/change_log.py
+
+import random
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from ..domain.entities import ChangeSet, Todo, TodoChange
+
+# A change sequence number is (process epoch << _COUNTER_BITS) | write counter. Both fit
+# in 52 bits, so every seq is an exact integer in JavaScript too.
+_COUNTER_BITS = 32
+_EPOCH_BITS = 20
+
+
+class ChangeLog:
+    """
+    Bounded log of row changes for delta sync and push.
+
+    Every write gets the next sequence number and records each affected
+    row's new state, or a tombstone for deleted rows. The log only sees
+    writes made through this process, so every seq carries a random
+    per-process epoch in its high bits: a position issued by another process
+    (or before a restart), or older than the retained log, is answered with
+    a reset.
+
+    Listeners get each write's ChangeSet, carrying its seq, in log order:
+    they are called while the log is locked, so keep them cheap.
+    """
+
+    def __init__(self, max_changes: int = 10000):
+        self.max_changes = max_changes
+        self._seq = self._new_seq_epoch()
+        # Changes after `_floor` are all still in the log; older positions get a reset
+        self._floor = self._seq
+        self._changes: Deque[Tuple[int, str, Optional[Todo]]] = deque()
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[ChangeSet], None]] = []
+
+    @property
+    def seq(self) -> int:
+        """The position of the latest write."""
+        return self._seq
+
+    def add_listener(self, listener: Callable[[ChangeSet], None]) -> None:
+        """Registers `listener` to be called with the ChangeSet of every later write."""
+        self._listeners.append(listener)
+
+    @staticmethod
+    def _new_seq_epoch() -> int:
+        """The first seq of a fresh epoch (never 0, so no client default can pass for one of ours)."""
+        return random.randrange(1, 1 << _EPOCH_BITS) << _COUNTER_BITS
+
+    def get_changes(self, since: Optional[int]) -> ChangeSet:
+        with self._lock:
+            if (since is None or since >> _COUNTER_BITS != self._seq >> _COUNTER_BITS
+                    or since < self._floor or since > self._seq):
+                return ChangeSet([], self._seq, reset=since is not None)
+
+            # Walk back from the newest entry; the latest change per ID wins
+            latest: Dict[str, TodoChange] = {}
+            for seq, todo_id, todo in reversed(self._changes):
+                if seq <= since:
+                    break
+                if todo_id not in latest:
+                    latest[todo_id] = TodoChange(seq, todo_id, todo)
+            # Back to log order (oldest first)
+            return ChangeSet(list(reversed(latest.values())), self._seq)
+
+    def record(self, upserted: Iterable[Todo] = (), deleted_ids: Iterable[str] = ()) -> None:
+        """Logs one write (with nothing changed, it still moves the seq on)."""
+        with self._lock:
+            self._advance()
+            seq = self._seq
+            changes = [
+                # Snapshot: callers may mutate the Todo they got back
+                TodoChange(seq, todo.id, Todo(id=todo.id, task=todo.task, is_complete=todo.is_complete))
+                for todo in upserted
+            ]
+            changes.extend(TodoChange(seq, todo_id, None) for todo_id in deleted_ids)
+            self._changes.extend((change.seq, change.todo_id, change.todo) for change in changes)
+            while len(self._changes) > self.max_changes:
+                self._floor = self._changes.popleft()[0]
+            if changes:
+                self._notify(ChangeSet(changes, seq))
+
+    def invalidate(self) -> None:
+        """
+        Records a write that may or may not have happened (e.g. it timed out):
+        no position from before it can be replayed reliably.
+        """
+        with self._lock:
+            self._advance()
+            self._floor = self._seq
+            self._changes.clear()
+            self._notify(ChangeSet([], self._seq, reset=True))
+
+    def _advance(self) -> None:
+        """Moves to the next seq (lock held). An exhausted counter starts a new epoch: every client resets."""
+        if (self._seq + 1) >> _COUNTER_BITS != self._seq >> _COUNTER_BITS:
+            self._seq = self._floor = self._new_seq_epoch()
+            self._changes.clear()
+        self._seq += 1
+
+    def _notify(self, change_set: ChangeSet) -> None:
+        """Hands a write's ChangeSet to the listeners (lock held, so in seq order)."""
+        for listener in self._listeners:
+            try:
+                listener(change_set)
+            except Exception as e:
+                # The write itself succeeded: a failing listener must not fail it
+                print(f"Change listener {getattr(listener, '__qualname__', listener)!s} failed: {e}")
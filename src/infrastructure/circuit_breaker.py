@@ -0,0 +1,68 @@
+# src/infrastructure/circuit_breaker.py
+
+import threading
+import time
+from typing import Callable, Dict
+
+class CircuitBreaker:
+    """
+    Fails fast while a dependency keeps failing.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    are refused for `reset_timeout_seconds`. Then one trial call is let through
+    (half-open): a success closes the circuit, a failure opens it again.
+    """
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        self.opened = 0     # times the circuit opened
+        self.rejected = 0   # calls refused without reaching the dependency
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """True if a call may go ahead; callers must then report its outcome."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout_seconds:
+                self._state = self.HALF_OPEN   # This caller makes the trial call
+                return True
+            # Still open, or half-open with the trial call in progress
+            self.rejected += 1
+            return False
+
+    def retry_after(self) -> float:
+        """Seconds until the circuit lets a trial call through (0 when closed)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout_seconds - self._clock())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.opened += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'open': 0 if self._state == self.CLOSED else 1, 'opened': self.opened, 'rejected': self.rejected}
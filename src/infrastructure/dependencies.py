@@ -0,0 +1,107 @@
+# src/infrastructure/dependencies.py
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Sentinel for a singleton that has not been built yet (None is a valid dependency)
+_UNSET = object()
+
+
+class Provider:
+    """
+    Resolves one named dependency. Bind it once (e.g. when registering a
+    route) and call get() per request: no name lookup, and a built
+    singleton costs a single attribute read.
+    """
+    __slots__ = ('container', 'name', 'factory', 'scoped', '_value')
+
+    def __init__(self, container: 'Container', name: str, factory: Callable[['Container'], Any], scoped: bool):
+        self.container = container
+        self.name = name
+        self.factory = factory
+        self.scoped = scoped
+        self._value = _UNSET
+
+    def get(self) -> Any:
+        if self.scoped:
+            return self.container._resolve_scoped(self)
+        value = self._value
+        if value is _UNSET:
+            with self.container._lock:
+                value = self._value
+                if value is _UNSET:
+                    value = self._value = self.factory(self.container)
+        return value
+
+
+class Container:
+    """
+    Named dependencies and how to build them.
+
+    - Singletons are built on first use and shared by the whole process
+      until reset() (e.g. in a freshly forked worker).
+    - Scoped dependencies are built at most once per scope() (one request)
+      and dropped when the scope ends.
+
+    Factories receive the container, so they can resolve what they need.
+    """
+
+    def __init__(self):
+        self._providers: Dict[str, Provider] = {}
+        self._lock = threading.RLock()   # Re-entrant: a singleton's factory may resolve other singletons
+        self._scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar('dependency_scope', default=None)
+
+    # --- Registration ---
+    def singleton(self, name: str, factory: Callable[['Container'], Any]) -> Provider:
+        return self._register(name, factory, scoped=False)
+
+    def scoped(self, name: str, factory: Callable[['Container'], Any]) -> Provider:
+        return self._register(name, factory, scoped=True)
+
+    def _register(self, name: str, factory: Callable[['Container'], Any], scoped: bool) -> Provider:
+        with self._lock:
+            provider = self._providers[name] = Provider(self, name, factory, scoped)
+        return provider
+
+    # --- Resolution ---
+    def provider(self, name: str) -> Provider:
+        provider = self._providers.get(name)
+        if provider is None:
+            raise KeyError(f"No dependency named '{name}' is registered.")
+        return provider
+
+    def resolve(self, name: str) -> Any:
+        return self.provider(name).get()
+
+    def _resolve_scoped(self, provider: Provider) -> Any:
+        instances = self._scope.get()
+        if instances is None:
+            raise LookupError(f"'{provider.name}' is request-scoped and was resolved outside a scope.")
+        value = instances.get(provider.name, _UNSET)
+        if value is _UNSET:
+            value = instances[provider.name] = provider.factory(self)
+        return value
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Opens a scope (one per request): scoped dependencies resolved inside it are built once."""
+        token = self._scope.set({})
+        try:
+            yield
+        finally:
+            self._scope.reset(token)
+
+    # --- Lifecycle ---
+    def override(self, name: str, value: Any) -> None:
+        """Replaces a singleton's instance (and drops the others, which may have been built from it)."""
+        with self._lock:
+            self.reset()
+            self.provider(name)._value = value
+
+    def reset(self) -> None:
+        """Drops every built singleton; each is rebuilt on its next use."""
+        with self._lock:
+            for provider in self._providers.values():
+                provider._value = _UNSET
@@ -0,0 +1,125 @@
+# src/infrastructure/event_hub.py
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Set
+
+class Subscription:
+    """
+    One subscriber's bounded message buffer. A subscriber that falls more than
+    `max_buffer` messages behind is dropped rather than slowing the publisher
+    down or growing without bound; it has to resynchronize and subscribe again.
+
+    Threads wait with next_batch(). An event loop passes a `wakeup` callback
+    instead (called whenever there is something to read, from the publishing
+    thread) and reads with drain(), so a subscriber costs no thread.
+    """
+    __slots__ = ('_hub', '_buffer', '_ready', '_wakeup', 'max_buffer', 'dropped', 'closed')
+
+    def __init__(self, hub: 'EventHub', max_buffer: int, wakeup: Optional[Callable[[], None]] = None):
+        self._hub = hub
+        self._buffer: Deque[str] = deque()
+        self._ready = threading.Event()
+        self._wakeup = wakeup
+        self.max_buffer = max_buffer
+        self.dropped = False
+        self.closed = False
+
+    def _signal(self) -> None:
+        self._ready.set()
+        if self._wakeup is not None:
+            self._wakeup()
+
+    def _offer(self, message: str) -> bool:
+        if len(self._buffer) >= self.max_buffer:
+            self.dropped = True
+            self._buffer.clear()
+            self._signal()
+            return False
+        self._buffer.append(message)
+        self._signal()
+        return True
+
+    def next_batch(self, timeout: float) -> Optional[List[str]]:
+        """
+        Waits up to `timeout` seconds and returns every buffered message
+        ([] when none arrived), or None once the subscription was dropped or closed.
+        """
+        if not (self.dropped or self.closed):
+            self._ready.wait(timeout)
+        return self.drain()
+
+    def drain(self) -> Optional[List[str]]:
+        """Returns every buffered message without waiting, or None once dropped or closed."""
+        # Clear before draining: a message appended meanwhile sets it again
+        self._ready.clear()
+        if self.dropped or self.closed:
+            return None
+        messages = []
+        while self._buffer:
+            messages.append(self._buffer.popleft())
+        return messages
+
+    def close(self) -> None:
+        self.closed = True
+        self._hub._unsubscribe(self)
+        self._signal()
+
+
+class EventHub:
+    """
+    In-process publish/subscribe fan-out of pre-serialized messages.
+
+    Publishing appends to each subscriber's buffer and never blocks on a
+    subscriber, so the writer's cost is one append per subscriber however
+    slowly they read. Subscriptions beyond `max_subscribers` are refused.
+    """
+
+    def __init__(self, max_subscribers: int = 5000, max_buffer: int = 64):
+        self.max_subscribers = max_subscribers
+        self.max_buffer = max_buffer
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self.published = 0
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, wakeup: Optional[Callable[[], None]] = None) -> Optional[Subscription]:
+        """Returns a new subscription (see Subscription for `wakeup`), or None when the hub is full."""
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            subscription = Subscription(self, self.max_buffer, wakeup)
+            self._subscribers.add(subscription)
+            return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, message: str) -> int:
+        """Delivers `message` to every subscriber; returns how many received it."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self.published += 1
+        slow = [subscription for subscription in subscribers if not subscription._offer(message)]
+        if slow:
+            with self._lock:
+                self._subscribers.difference_update(slow)
+                self.dropped += len(slow)
+        return len(subscribers) - len(slow)
+
+    def close(self) -> None:
+        """Ends every subscription (their streams finish and clients reconnect)."""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, set()
+        for subscription in subscribers:
+            subscription.closed = True
+            subscription._signal()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'subscribers': len(self._subscribers), 'published': self.published, 'dropped': self.dropped}
@@ -0,0 +1,221 @@
+# src/infrastructure/metrics.py
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Default histogram buckets: request/call latency in seconds, payload size in bytes
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in values)
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(names, escaped)) + '}'
+
+
+class Counter:
+    """A monotonically increasing count per label combination."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, label_values)} {value:g}")
+        return lines
+
+
+class Histogram:
+    """Bucketed observations (cumulative on render) plus sum and count, per label combination."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[LabelValues, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return series[2] if series else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        names = self.label_names + ('le',)
+        with self._lock:
+            for label_values, (bucket_counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float('inf'),), bucket_counts):
+                    cumulative += bucket_count
+                    le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                    lines.append(f"{self.name}_bucket{_format_labels(names, label_values + (le,))} {cumulative}")
+                labels = _format_labels(self.label_names, label_values)
+                lines.append(f"{self.name}_sum{labels} {total:g}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the process's metrics and renders them in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: Dict[str, Callable[[], List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(name, lambda: Counter(name, help_text, label_names))
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(name, lambda: Histogram(name, help_text, label_names, buckets))
+
+    def _get_or_create(self, name: str, factory):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            return metric
+
+    def set_collector(self, name: str, collect: Callable[[], List[str]]) -> None:
+        """Registers (or replaces) a callback producing extra exposition lines at scrape time."""
+        with self._lock:
+            self._collectors[name] = collect
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collect in collectors:
+            lines.extend(collect())
+        return '\n'.join(lines) + '\n'
+
+
+# --- Per-request timing (feeds the Server-Timing header) ---
+
+class RequestTimings:
+    """Durations accumulated by the layers that ran during one request."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self.spans: Dict[str, List[float]] = {}  # name -> [total seconds, count]
+
+    def add(self, name: str, seconds: float) -> None:
+        span = self.spans.get(name)
+        if span is None:
+            self.spans[name] = [seconds, 1]
+        else:
+            span[0] += seconds
+            span[1] += 1
+
+    def server_timing(self, total_seconds: float) -> str:
+        parts = [f"total;dur={total_seconds * 1000:.2f}"]
+        for name, (seconds, count) in self.spans.items():
+            parts.append(f'{name};dur={seconds * 1000:.2f};desc="{count} call{"s" if count != 1 else ""}"')
+        return ', '.join(parts)
+
+
+_current_request: ContextVar[Optional[RequestTimings]] = ContextVar('todo_request_timings', default=None)
+
+
+def current_endpoint() -> str:
+    timings = _current_request.get()
+    return timings.endpoint if timings is not None else 'none'
+
+
+def record_span(name: str, seconds: float) -> None:
+    """Adds a duration to the current request's Server-Timing, if there is one."""
+    timings = _current_request.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+@contextmanager
+def track_request(endpoint: str) -> Iterator[RequestTimings]:
+    timings = RequestTimings(endpoint)
+    token = _current_request.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_request.reset(token)
+
+
+# --- Use case hook ---
+
+class InstrumentedUseCase:
+    """
+    Transparent proxy timing every `execute*` call of a use case into a
+    histogram and the current request's Server-Timing.
+    """
+
+    def __init__(self, use_case, registry: MetricsRegistry, name: str):
+        self._use_case = use_case
+        self._name = name
+        self._histogram = registry.histogram(
+            'todo_use_case_duration_seconds', 'Time spent in use case execute calls.', ('use_case', 'method')
+        )
+
+    def __getattr__(self, attribute: str):
+        value = getattr(self._use_case, attribute)
+        if not attribute.startswith('execute') or not callable(value):
+            return value
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return value(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                self._histogram.observe(elapsed, self._name, attribute)
+                record_span('usecase', elapsed)
+        return timed
+
+
+def stats_lines(prefix: str, help_text: str, stats: Dict[str, float], gauges: Sequence[str] = ()) -> List[str]:
+    """Exposes a stats() dict as counters (`<prefix>_<key>_total`) and gauges (`<prefix>_<key>`)."""
+    lines = []
+    for key, value in stats.items():
+        is_gauge = key in gauges
+        name = f"{prefix}_{key}" if is_gauge else f"{prefix}_{key}_total"
+        lines.append(f"# HELP {name} {help_text} ({key}).")
+        lines.append(f"# TYPE {name} {'gauge' if is_gauge else 'counter'}")
+        lines.append(f"{name} {value:g}")
+    return lines
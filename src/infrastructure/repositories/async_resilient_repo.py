@@ -0,0 +1,94 @@
+# src/infrastructure/repositories/async_resilient_repo.py
+
+import asyncio
+import random
+from typing import Awaitable, Callable, Optional, Sequence
+from ...application.interfaces import IAsyncTodoRepository
+from ...domain.entities import Todo
+from ...domain.exceptions import BackendUnavailableError, DomainException
+from ..circuit_breaker import CircuitBreaker
+
+class AsyncResilientTodoRepository(IAsyncTodoRepository):
+    """
+    Async counterpart of ResilientTodoRepository for the ASGI serving path:
+    a per-call timeout (the awaited call is cancelled, so nothing is left
+    running), jittered retries for reads only, and a circuit breaker.
+
+    Domain errors (e.g. TodoNotFoundError, or InvalidInputError for a 4xx)
+    pass straight through; every other failure surfaces as
+    BackendUnavailableError. There is no hedging: the async path has no
+    thread pool whose slow calls need overtaking.
+    """
+
+    def __init__(self, inner: IAsyncTodoRepository, timeout_seconds: float = 5.0, read_retries: int = 2,
+                 backoff_seconds: float = 0.05, max_backoff_seconds: float = 1.0,
+                 breaker: Optional[CircuitBreaker] = None,
+                 sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+                 jitter: Callable[[], float] = random.random):
+        self.inner = inner
+        self.timeout_seconds = timeout_seconds
+        self.read_retries = read_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.breaker = breaker or CircuitBreaker()
+        self._sleep = sleep
+        self._jitter = jitter
+        # Single event loop: plain increments are safe
+        self._stats = {'calls': 0, 'failures': 0, 'timeouts': 0, 'retries': 0}
+
+    def stats(self) -> dict:
+        stats = dict(self._stats)
+        stats.update(self.breaker.stats())
+        return stats
+
+    # --- Policy ---
+    async def _guarded(self, operation: str, call: Callable[[], Awaitable], idempotent: bool = False):
+        self._stats['calls'] += 1
+        attempts = 1 + (self.read_retries if idempotent else 0)
+        last_error: Optional[Exception] = None
+        for attempt in range(attempts):
+            if attempt:
+                self._stats['retries'] += 1
+                # Full jitter: a random wait up to the exponential backoff, so callers spread out
+                await self._sleep(self._jitter() * min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempt - 1)))
+            if not self.breaker.allow():
+                raise BackendUnavailableError(
+                    "Storage backend is unavailable, try again later.", retry_after=self.breaker.retry_after()
+                ) from last_error
+            try:
+                result = await asyncio.wait_for(call(), timeout=self.timeout_seconds)
+            except DomainException:
+                self.breaker.record_success()   # The backend answered
+                raise
+            except Exception as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    self._stats['timeouts'] += 1
+                self.breaker.record_failure()
+                self._stats['failures'] += 1
+                last_error = e
+                continue
+            self.breaker.record_success()
+            return result
+
+        print(f"Storage backend call '{operation}' failed after {attempts} attempt(s): {last_error!r}")
+        raise BackendUnavailableError("Storage backend did not answer, try again later.") from last_error
+
+    # --- Reads (idempotent: retried) ---
+    async def get_all(self) -> Sequence[Todo]:
+        return await self._guarded('get_all', self.inner.get_all, idempotent=True)
+
+    async def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        return await self._guarded('get_page', lambda: self.inner.get_page(limit, after_id), idempotent=True)
+
+    # --- Writes (one attempt) ---
+    async def add(self, todo: Todo) -> Todo:
+        return await self._guarded('add', lambda: self.inner.add(todo))
+
+    async def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        return await self._guarded('update_status', lambda: self.inner.update_status(todo_id, is_complete))
+
+    async def delete(self, todo_id: str) -> bool:
+        return await self._guarded('delete', lambda: self.inner.delete(todo_id))
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
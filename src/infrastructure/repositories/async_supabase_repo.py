@@ -0,0 +1,84 @@
+# src/infrastructure/repositories/async_supabase_repo.py
+
+from typing import Optional, Sequence
+import httpx
+from ...application.interfaces import IAsyncTodoRepository
+from ...domain.entities import Todo, TodoBatch
+from ...domain.exceptions import InvalidInputError, TodoNotFoundError
+
+# Ask PostgREST to return the affected rows from insert/update/delete
+_RETURN_ROWS = {'Prefer': 'return=representation'}
+_COLUMNS = 'id,task,is_complete'
+
+
+def create_postgrest_client(supabase_url: str, supabase_key: str,
+                            max_connections: int = 100, timeout_seconds: float = 10.0) -> httpx.AsyncClient:
+    """
+    Builds one pooled, keep-alive HTTP client for the project's PostgREST API.
+    Create it once per process (or event loop) and share it across requests.
+    """
+    return httpx.AsyncClient(
+        base_url=f"{supabase_url.rstrip('/')}/rest/v1",
+        headers={'apikey': supabase_key, 'Authorization': f"Bearer {supabase_key}"},
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        timeout=timeout_seconds,
+    )
+
+
+def _to_entity(item: dict) -> Todo:
+    return Todo(id=str(item['id']), task=item['task'], is_complete=item['is_complete'])
+
+
+class AsyncSupabaseTodoRepository(IAsyncTodoRepository):
+    """Non-blocking implementation of IAsyncTodoRepository over Supabase's REST API."""
+
+    def __init__(self, http_client: httpx.AsyncClient):
+        self.client = http_client
+        self.table = '/todos' # Hardcoded table name
+
+    async def _request(self, method: str, params: dict, **kwargs) -> list:
+        response = await self.client.request(method, self.table, params=params, **kwargs)
+        if 400 <= response.status_code < 500:
+            # An answer about the request (e.g. `id=gt.abc`), not a backend fault: not retried,
+            # not counted against the circuit breaker
+            try:
+                message = response.json().get('message')
+            except ValueError:
+                message = None
+            raise InvalidInputError(f"The storage backend rejected the request: {message or response.status_code}")
+        response.raise_for_status()
+        return response.json() if response.content else []
+
+    async def get_all(self) -> Sequence[Todo]:
+        rows = await self._request('GET', {'select': _COLUMNS})
+        return TodoBatch.from_rows(rows)
+
+    async def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        params = {'select': _COLUMNS, 'order': 'id.asc', 'limit': str(limit)}
+        if after_id is not None:
+            params['id'] = f"gt.{after_id}"
+        rows = await self._request('GET', params)
+        return TodoBatch.from_rows(rows)
+
+    async def add(self, todo: Todo) -> Todo:
+        rows = await self._request('POST', {'select': _COLUMNS}, json={'task': todo.task}, headers=_RETURN_ROWS)
+        if rows:
+            todo.id = str(rows[0]['id'])
+            todo.is_complete = rows[0]['is_complete']
+        return todo
+
+    async def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        rows = await self._request(
+            'PATCH', {'select': _COLUMNS, 'id': f"eq.{todo_id}"},
+            json={'is_complete': is_complete}, headers=_RETURN_ROWS
+        )
+        if rows:
+            return _to_entity(rows[0])
+        raise TodoNotFoundError(todo_id)
+
+    async def delete(self, todo_id: str) -> bool:
+        rows = await self._request('DELETE', {'select': _COLUMNS, 'id': f"eq.{todo_id}"}, headers=_RETURN_ROWS)
+        return bool(rows)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,64 @@
+# src/infrastructure/repositories/async_versioned_repo.py
+
+from typing import Callable, Optional, Sequence
+from ...application.interfaces import IAsyncTodoRepository
+from ...domain.entities import ChangeSet, Todo
+from ...domain.exceptions import TodoNotFoundError
+from ..change_log import ChangeLog
+
+class AsyncVersionedTodoRepository(IAsyncTodoRepository):
+    """
+    Async counterpart of VersionedTodoRepository's change log, for the ASGI
+    app: every write made through it is recorded in a ChangeLog, which feeds
+    /api/todos/changes and the event stream. (No collection version: the
+    ASGI app serves no ETags.)
+    """
+
+    def __init__(self, inner: IAsyncTodoRepository, max_changes: int = 10000):
+        self.inner = inner
+        self.change_log = ChangeLog(max_changes=max_changes)
+
+    def add_change_listener(self, listener: Callable[[ChangeSet], None]) -> None:
+        """Registers `listener` to be called with the ChangeSet of every later write."""
+        self.change_log.add_listener(listener)
+
+    def get_changes(self, since: Optional[int]) -> Optional[ChangeSet]:
+        return self.change_log.get_changes(since)
+
+    async def _write(self, operation: Callable):
+        try:
+            return await operation()
+        except TodoNotFoundError:
+            # Nothing was written, so the log stays replayable
+            self.change_log.record()
+            raise
+        except Exception:
+            # The write may still have reached the backend
+            self.change_log.invalidate()
+            raise
+
+    # --- Reads ---
+    async def get_all(self) -> Sequence[Todo]:
+        return await self.inner.get_all()
+
+    async def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        return await self.inner.get_page(limit, after_id)
+
+    # --- Writes ---
+    async def add(self, todo: Todo) -> Todo:
+        created = await self._write(lambda: self.inner.add(todo))
+        self.change_log.record(upserted=[created])
+        return created
+
+    async def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        updated = await self._write(lambda: self.inner.update_status(todo_id, is_complete))
+        self.change_log.record(upserted=[updated])
+        return updated
+
+    async def delete(self, todo_id: str) -> bool:
+        deleted = await self._write(lambda: self.inner.delete(todo_id))
+        self.change_log.record(deleted_ids=[todo_id] if deleted else [])
+        return deleted
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
@@ -0,0 +1,136 @@
+# src/infrastructure/repositories/caching_repo.py
+
+import threading
+from typing import Callable, Hashable, Iterable, List, Optional, Sequence
+from ...application.interfaces import ITodoRepository
+from ...domain.entities import Todo, TodoBatch
+from ...domain.exceptions import BackendUnavailableError, DomainException
+from ...domain.query import KeysetPosition, TodoQuery
+from ..ttl_cache import TTLCache, MISSING
+from .decorator import TodoRepositoryDecorator
+
+class CachingTodoRepository(TodoRepositoryDecorator):
+    """
+    Read-through cache in front of any ITodoRepository.
+
+    List and page reads are served from a bounded TTL/LRU cache. Writes go
+    straight to the wrapped repository and then patch (updates) or drop
+    (inserts/deletes, which move page boundaries) the affected cache entries.
+    The TTL bounds staleness from writes made by other processes.
+    """
+
+    _ALL_KEY = ('all',)
+
+    def __init__(self, inner: ITodoRepository, cache: TTLCache):
+        super().__init__(inner)
+        self.cache = cache
+        # Bumped on every write so that a read which raced a write never caches stale rows
+        self._generation = 0
+        self._write_lock = threading.Lock()
+
+    def stats(self):
+        """Hit/miss/eviction counters of the underlying cache."""
+        return self.cache.stats()
+
+    # --- Reads ---
+    def get_all(self) -> Sequence[Todo]:
+        return self._read_through(self._ALL_KEY, self.inner.get_all)
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        key = ('page', limit, after_id)
+        return self._read_through(key, lambda: self.inner.get_page(limit, after_id))
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        key = ('find', query.key(), limit, after)
+        return self._read_through(key, lambda: self.inner.find_page(query, limit, after))
+
+    def _read_through(self, key: Hashable, load: Callable[[], Sequence[Todo]]) -> Sequence[Todo]:
+        cached = self.cache.get(key)
+        if cached is MISSING:
+            generation = self._generation
+            cached = load()
+            # TodoBatch is read-only and can be shared; lists are copied so callers can't alter the cache
+            if not isinstance(cached, TodoBatch):
+                cached = list(cached)
+            with self._write_lock:
+                if generation == self._generation:
+                    self.cache.set(key, cached)
+        return cached if isinstance(cached, TodoBatch) else list(cached)
+
+    # --- Writes ---
+    def add(self, todo: Todo) -> Todo:
+        created = self._write(lambda: self.inner.add(todo))
+        self._apply_write(added=[created])
+        return created
+
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        created = self._write(lambda: self.inner.add_many(todos))
+        self._apply_write(added=created)
+        return created
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        updated = self._write(lambda: self.inner.update_status(todo_id, is_complete))
+        self._apply_write(updated=[updated])
+        return updated
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        updated = self._write(lambda: self.inner.update_status_many(todo_ids, is_complete))
+        self._apply_write(updated=updated)
+        return updated
+
+    def delete(self, todo_id: str) -> bool:
+        deleted = self._write(lambda: self.inner.delete(todo_id))
+        if deleted:
+            self._apply_write(deleted_ids=[todo_id])
+        return deleted
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        deleted_ids = self._write(lambda: self.inner.delete_many(todo_ids))
+        self._apply_write(deleted_ids=deleted_ids)
+        return deleted_ids
+
+    def _write(self, operation: Callable):
+        try:
+            return operation()
+        except BackendUnavailableError:
+            # A domain error too, but an ambiguous one (e.g. a timed-out write)
+            self._clear()
+            raise
+        except DomainException:
+            # An answer (e.g. TodoNotFoundError): nothing was written, the cache is still right
+            raise
+        except Exception:
+            self._clear()
+            raise
+
+    def _clear(self) -> None:
+        # The write may or may not have reached the backend: forget everything
+        with self._write_lock:
+            self._generation += 1
+            self.cache.clear()
+
+    def _apply_write(self, added: Iterable[Todo] = (), updated: Iterable[Todo] = (),
+                     deleted_ids: Iterable[str] = ()) -> None:
+        added = list(added)
+        updated_by_id = {todo.id: todo for todo in updated}
+        deleted = set(deleted_ids)
+        if not (added or updated_by_id or deleted):
+            return
+
+        with self._write_lock:
+            self._generation += 1
+            for key, rows in self.cache.items():
+                if key[0] == 'find':
+                    # Any write can move rows in or out of a filtered or sorted page
+                    self.cache.pop(key)
+                elif key == self._ALL_KEY:
+                    patched = [updated_by_id.get(todo.id, todo) for todo in rows if todo.id not in deleted]
+                    # A read that overlapped the insert may have cached the new rows already
+                    present = {todo.id for todo in patched}
+                    patched.extend(todo for todo in added if todo.id not in present)
+                    self.cache.replace(key, patched)
+                elif added or deleted:
+                    # Inserts and deletes shift page boundaries, so drop cached pages
+                    self.cache.pop(key)
+                elif any(todo.id in updated_by_id for todo in rows):
+                    self.cache.replace(key, [updated_by_id.get(todo.id, todo) for todo in rows])
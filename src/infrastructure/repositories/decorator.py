@@ -0,0 +1,51 @@
+# src/infrastructure/repositories/decorator.py
+
+from typing import List, Optional, Sequence
+from ...application.interfaces import ITodoRepository
+from ...domain.entities import ChangeSet, Todo
+from ...domain.query import KeysetPosition, TodoQuery
+
+class TodoRepositoryDecorator(ITodoRepository):
+    """
+    Base class for repositories that wrap another ITodoRepository.
+    Every call is forwarded to the wrapped repository unchanged, so
+    subclasses only override the operations they add behavior to.
+    """
+
+    def __init__(self, inner: ITodoRepository):
+        self.inner = inner
+
+    def get_all(self) -> Sequence[Todo]:
+        return self.inner.get_all()
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        return self.inner.get_page(limit, after_id)
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        return self.inner.find_page(query, limit, after)
+
+    def add(self, todo: Todo) -> Todo:
+        return self.inner.add(todo)
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        return self.inner.update_status(todo_id, is_complete)
+
+    def delete(self, todo_id: str) -> bool:
+        return self.inner.delete(todo_id)
+
+    def get_version(self) -> Optional[str]:
+        return self.inner.get_version()
+
+    def get_changes(self, since: Optional[int]) -> Optional[ChangeSet]:
+        return self.inner.get_changes(since)
+
+    # Forward the bulk operations too, so the wrapped backend's single-round-trip
+    # overrides are used instead of the per-item defaults on ITodoRepository.
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        return self.inner.add_many(todos)
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        return self.inner.update_status_many(todo_ids, is_complete)
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        return self.inner.delete_many(todo_ids)
@@ -0,0 +1,69 @@
+# src/infrastructure/repositories/instrumented_repo.py
+
+import time
+from typing import Callable, List, Optional, Sequence
+from ...application.interfaces import ITodoRepository
+from ...domain.entities import Todo
+from ...domain.query import KeysetPosition, TodoQuery
+from ..metrics import MetricsRegistry, current_endpoint, record_span
+from .decorator import TodoRepositoryDecorator
+
+class InstrumentedTodoRepository(TodoRepositoryDecorator):
+    """
+    Records latency, round-trip counts (per endpoint) and errors for every call
+    to the wrapped repository. Wire it directly around the storage backend so
+    that cache hits and coalesced writes are not counted as round trips.
+    """
+
+    def __init__(self, inner: ITodoRepository, registry: MetricsRegistry):
+        super().__init__(inner)
+        self._calls = registry.counter(
+            'todo_backend_round_trips_total', 'Storage backend calls, by endpoint and operation.',
+            ('endpoint', 'operation')
+        )
+        self._errors = registry.counter(
+            'todo_backend_errors_total', 'Storage backend calls that raised, by operation.', ('operation',)
+        )
+        self._latency = registry.histogram(
+            'todo_backend_call_duration_seconds', 'Storage backend call latency.', ('operation',)
+        )
+
+    def _timed(self, operation: str, call: Callable):
+        started = time.perf_counter()
+        try:
+            return call()
+        except Exception:
+            self._errors.inc(operation)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self._calls.inc(current_endpoint(), operation)
+            self._latency.observe(elapsed, operation)
+            record_span('db', elapsed)
+
+    def get_all(self) -> Sequence[Todo]:
+        return self._timed('get_all', self.inner.get_all)
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        return self._timed('get_page', lambda: self.inner.get_page(limit, after_id))
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        return self._timed('find_page', lambda: self.inner.find_page(query, limit, after))
+
+    def add(self, todo: Todo) -> Todo:
+        return self._timed('add', lambda: self.inner.add(todo))
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        return self._timed('update_status', lambda: self.inner.update_status(todo_id, is_complete))
+
+    def delete(self, todo_id: str) -> bool:
+        return self._timed('delete', lambda: self.inner.delete(todo_id))
+
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        return self._timed('add_many', lambda: self.inner.add_many(todos))
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        return self._timed('update_status_many', lambda: self.inner.update_status_many(todo_ids, is_complete))
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        return self._timed('delete_many', lambda: self.inner.delete_many(todo_ids))
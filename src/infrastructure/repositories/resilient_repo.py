@@ -0,0 +1,162 @@
+# src/infrastructure/repositories/resilient_repo.py
+
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, Sequence
+from ...application.interfaces import ITodoRepository
+from ...domain.entities import Todo
+from ...domain.exceptions import BackendUnavailableError, DomainException
+from ...domain.query import KeysetPosition, TodoQuery
+from ..circuit_breaker import CircuitBreaker
+from .decorator import TodoRepositoryDecorator
+
+class ResilientTodoRepository(TodoRepositoryDecorator):
+    """
+    Guards every call to a remote storage backend:
+
+    - a per-call timeout: calls run on a bounded thread pool, so a hung
+      request releases the caller after `timeout_seconds`;
+    - up to `read_retries` retries with full-jitter exponential backoff, for
+      reads only (a timed-out write may still have been applied);
+    - a circuit breaker that fails fast while the backend keeps failing;
+    - optional hedged reads: a read still running after `hedge_after_seconds`
+      is sent again and the first answer wins, trimming tail latency for a
+      little extra load.
+
+    Domain errors (e.g. TodoNotFoundError, or InvalidInputError for a request
+    the backend rejected with a 4xx) are answers and pass straight through:
+    not retried, not counted against the breaker. Every other failure
+    surfaces as BackendUnavailableError.
+    A timed-out call keeps its pool thread until the client library gives
+    up, so the HTTP client needs a timeout of its own too.
+    """
+
+    def __init__(self, inner: ITodoRepository, timeout_seconds: float = 5.0, read_retries: int = 2,
+                 backoff_seconds: float = 0.05, max_backoff_seconds: float = 1.0,
+                 hedge_after_seconds: Optional[float] = None, breaker: Optional[CircuitBreaker] = None,
+                 max_workers: int = 20, sleep: Callable[[float], None] = time.sleep,
+                 jitter: Callable[[], float] = random.random):
+        super().__init__(inner)
+        self.timeout_seconds = timeout_seconds
+        self.read_retries = read_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.hedge_after_seconds = hedge_after_seconds
+        self.breaker = breaker or CircuitBreaker()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='todo-backend')
+        self._sleep = sleep
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'failures': 0, 'timeouts': 0, 'retries': 0, 'hedges': 0, 'hedge_wins': 0}
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(self.breaker.stats())
+        return stats
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    # --- Policy ---
+    def _submit(self, call: Callable) -> Future:
+        # Run in a copy of the caller's context, so per-request spans still reach its Server-Timing
+        return self._executor.submit(contextvars.copy_context().run, call)
+
+    def _attempt(self, call: Callable, hedge: bool):
+        """One logical call (plus its hedge), bounded by the timeout."""
+        deadline = time.monotonic() + self.timeout_seconds
+        futures: List[Future] = [self._submit(call)]
+        if hedge and self.hedge_after_seconds is not None and self.hedge_after_seconds < self.timeout_seconds:
+            done, _ = wait(futures, timeout=self.hedge_after_seconds)
+            if not done:
+                self._count('hedges')
+                futures.append(self._submit(call))
+        hedged = futures[-1] if len(futures) > 1 else None
+
+        pending = futures
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                for future in pending:
+                    future.cancel()   # Only helps calls still queued for a worker
+                self._count('timeouts')
+                raise TimeoutError(f"No answer within {self.timeout_seconds:g}s")
+
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner is not None:
+                for future in pending:
+                    future.cancel()
+                if winner is hedged:
+                    self._count('hedge_wins')
+                return winner.result()
+            errors = [future.exception() for future in done]
+            answer = next((error for error in errors if isinstance(error, DomainException)), None)
+            if answer is not None:
+                raise answer
+            if not pending:
+                raise errors[0]
+            # Failed fast, but the other copy may still succeed: keep waiting for it
+
+    def _guarded(self, operation: str, call: Callable, idempotent: bool = False):
+        self._count('calls')
+        attempts = 1 + (self.read_retries if idempotent else 0)
+        last_error: Optional[Exception] = None
+        for attempt in range(attempts):
+            if attempt:
+                self._count('retries')
+                # Full jitter: a random wait up to the exponential backoff, so callers spread out
+                self._sleep(self._jitter() * min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (attempt - 1)))
+            if not self.breaker.allow():
+                raise BackendUnavailableError(
+                    "Storage backend is unavailable, try again later.", retry_after=self.breaker.retry_after()
+                ) from last_error
+            try:
+                result = self._attempt(call, hedge=idempotent)
+            except DomainException:
+                self.breaker.record_success()   # The backend answered
+                raise
+            except Exception as e:
+                self.breaker.record_failure()
+                self._count('failures')
+                last_error = e
+                continue
+            self.breaker.record_success()
+            return result
+
+        print(f"Storage backend call '{operation}' failed after {attempts} attempt(s): {last_error!r}")
+        raise BackendUnavailableError("Storage backend did not answer, try again later.") from last_error
+
+    # --- Reads (idempotent: retried and hedged) ---
+    def get_all(self) -> Sequence[Todo]:
+        return self._guarded('get_all', self.inner.get_all, idempotent=True)
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        return self._guarded('get_page', lambda: self.inner.get_page(limit, after_id), idempotent=True)
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        return self._guarded('find_page', lambda: self.inner.find_page(query, limit, after), idempotent=True)
+
+    # --- Writes (one attempt) ---
+    def add(self, todo: Todo) -> Todo:
+        return self._guarded('add', lambda: self.inner.add(todo))
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        return self._guarded('update_status', lambda: self.inner.update_status(todo_id, is_complete))
+
+    def delete(self, todo_id: str) -> bool:
+        return self._guarded('delete', lambda: self.inner.delete(todo_id))
+
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        return self._guarded('add_many', lambda: self.inner.add_many(todos))
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        return self._guarded('update_status_many', lambda: self.inner.update_status_many(todo_ids, is_complete))
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        return self._guarded('delete_many', lambda: self.inner.delete_many(todo_ids))
@@ -0,0 +1,71 @@
+# src/infrastructure/repositories/single_flight_repo.py
+
+import threading
+from typing import Callable, List, Optional, Sequence
+from ...application.interfaces import ITodoRepository
+from ...domain.entities import Todo, TodoBatch
+from ...domain.query import KeysetPosition, TodoQuery
+from ..single_flight import SingleFlight
+from .decorator import TodoRepositoryDecorator
+
+class SingleFlightTodoRepository(TodoRepositoryDecorator):
+    """
+    Shares one backend read among concurrent identical reads.
+
+    When a burst of requests asks for the same list or page at once, only
+    the first reaches the wrapped repository and the rest wait for its
+    result. Every completed write starts a new generation, so a read issued
+    after a write never joins a flight that started before it.
+    """
+
+    def __init__(self, inner: ITodoRepository, flights: Optional[SingleFlight] = None):
+        super().__init__(inner)
+        self.flights = flights or SingleFlight()
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+
+    def stats(self):
+        return self.flights.stats()
+
+    # --- Reads ---
+    def get_all(self) -> Sequence[Todo]:
+        return self._shared(('all', self._generation), self.inner.get_all)
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        return self._shared(('page', limit, after_id, self._generation), lambda: self.inner.get_page(limit, after_id))
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        key = ('find', query.key(), limit, after, self._generation)
+        return self._shared(key, lambda: self.inner.find_page(query, limit, after))
+
+    def _shared(self, key, load: Callable[[], Sequence[Todo]]) -> Sequence[Todo]:
+        todos = self.flights.do(key, load)
+        # TodoBatch is read-only and can be shared; each caller gets its own list
+        return todos if isinstance(todos, TodoBatch) else list(todos)
+
+    # --- Writes ---
+    def add(self, todo: Todo) -> Todo:
+        return self._write(lambda: self.inner.add(todo))
+
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        return self._write(lambda: self.inner.add_many(todos))
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        return self._write(lambda: self.inner.update_status(todo_id, is_complete))
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        return self._write(lambda: self.inner.update_status_many(todo_ids, is_complete))
+
+    def delete(self, todo_id: str) -> bool:
+        return self._write(lambda: self.inner.delete(todo_id))
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        return self._write(lambda: self.inner.delete_many(todo_ids))
+
+    def _write(self, operation: Callable):
+        try:
+            return operation()
+        finally:
+            # Even a failed write may have reached the backend
+            with self._generation_lock:
+                self._generation += 1
@@ -0,0 +1,229 @@
+# src/infrastructure/repositories/sqlite_repo.py
+
+import queue
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence
+from ...application.interfaces import ITodoRepository
+from ...domain.entities import Todo, TodoBatch
+from ...domain.exceptions import TodoNotFoundError
+from ...domain.query import KeysetPosition, TodoQuery
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS todos (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task TEXT NOT NULL CHECK (task <> ''),
+        is_complete INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    # The primary key already indexes id; this one serves status filters in id order
+    "CREATE INDEX IF NOT EXISTS idx_todos_is_complete_id ON todos (is_complete, id)",
+    # Serves `sort=task` pages as an index range scan
+    "CREATE INDEX IF NOT EXISTS idx_todos_task_id ON todos (task, id)",
+)
+
+# Fixed SQL text: sqlite3 keeps the compiled (prepared) statement in each
+# connection's statement cache, so repeated calls skip parsing and planning.
+_SELECT_ALL = "SELECT id, task, is_complete FROM todos ORDER BY id"
+_SELECT_FIRST_PAGE = "SELECT id, task, is_complete FROM todos ORDER BY id LIMIT ?"
+_SELECT_PAGE = "SELECT id, task, is_complete FROM todos WHERE id > ? ORDER BY id LIMIT ?"
+_INSERT = "INSERT INTO todos (task) VALUES (?) RETURNING id, task, is_complete"
+_UPDATE_STATUS = "UPDATE todos SET is_complete = ? WHERE id = ? RETURNING id, task, is_complete"
+_DELETE = "DELETE FROM todos WHERE id = ? RETURNING id"
+
+# Bulk statements bind one parameter per item; chunking keeps each statement
+# well under SQLite's bound-variable limit and reuses a handful of cached plans.
+_BULK_CHUNK = 500
+
+
+def _chunks(items: list) -> Iterator[list]:
+    for start in range(0, len(items), _BULK_CHUNK):
+        yield items[start:start + _BULK_CHUNK]
+
+
+def _placeholders(count: int) -> str:
+    return ','.join('?' * count)
+
+
+def _find_statement(query: TodoQuery, has_after: bool) -> str:
+    """
+    SQL for a filtered/sorted page. Built from fixed fragments (the sort column
+    is one of SORT_FIELDS), so there are only a few distinct texts to cache.
+    """
+    conditions = []
+    if query.is_complete is not None:
+        conditions.append("is_complete = ?")
+    if query.task_contains is not None:
+        conditions.append("task LIKE ? ESCAPE '\\'")
+    operator, direction = ('<', 'DESC') if query.descending else ('>', 'ASC')
+    if has_after:
+        conditions.append(f"id {operator} ?" if query.sort == 'id' else f"({query.sort}, id) {operator} (?, ?)")
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+    order = f"id {direction}" if query.sort == 'id' else f"{query.sort} {direction}, id {direction}"
+    return f"SELECT id, task, is_complete FROM todos{where} ORDER BY {order} LIMIT ?"
+
+
+def _find_parameters(query: TodoQuery, limit: int, after: Optional[KeysetPosition]) -> list:
+    parameters = []
+    if query.is_complete is not None:
+        parameters.append(int(query.is_complete))
+    if query.task_contains is not None:
+        # LIKE is case-insensitive for ASCII in SQLite; escape its wildcards to match literally
+        escaped = query.task_contains.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        parameters.append(f"%{escaped}%")
+    if after is not None:
+        after_value, after_id = after
+        if query.sort != 'id':
+            parameters.append(int(after_value) if query.sort == 'is_complete' else after_value)
+        parameters.append(int(after_id))
+    parameters.append(limit)
+    return parameters
+
+
+def _to_entity(row: sqlite3.Row) -> Todo:
+    return Todo(id=str(row['id']), task=row['task'], is_complete=bool(row['is_complete']))
+
+
+class _ConnectionPool:
+    """A small thread-safe pool: connections are created on demand, up to `size`."""
+
+    def __init__(self, connect, size: int):
+        self._connect = connect
+        self._size = size
+        self._created = 0
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._all: List[sqlite3.Connection] = []
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if self._created < self._size:
+                    # Count the slot only once it holds a connection: a failed connect must not use it up
+                    conn = self._connect()
+                    self._created += 1
+                    self._all.append(conn)
+            if conn is None:
+                # Pool exhausted: wait for another thread to hand one back
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+
+
+class SqliteTodoRepository(ITodoRepository):
+    """
+    Concrete implementation of ITodoRepository on a local SQLite database.
+    Runs without the network: a fast local/edge backend and a benchmark baseline.
+    """
+
+    def __init__(self, path: str = 'todos.db', pool_size: int = 8):
+        if path == ':memory:':
+            # Every plain ':memory:' connection is its own database; share one
+            # named in-memory database instead, through a single connection.
+            self._uri = f"file:todos-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            pool_size = 1
+        else:
+            self._uri = f"file:{path}"
+        self._pool = _ConnectionPool(self._connect, pool_size)
+
+        with self._pool.connection() as conn, conn:
+            if path != ':memory:':
+                # WAL lets readers proceed while a write is in progress
+                conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._uri, uri=True, timeout=5.0,
+                               check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        # Durable across application crashes; with WAL, fsync only at checkpoints
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def close(self) -> None:
+        self._pool.close()
+
+    # --- Reads ---
+    def get_all(self) -> Sequence[Todo]:
+        with self._pool.connection() as conn:
+            return TodoBatch.from_rows(conn.execute(_SELECT_ALL))
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        with self._pool.connection() as conn:
+            if after_id is None:
+                rows = conn.execute(_SELECT_FIRST_PAGE, (limit,))
+            else:
+                rows = conn.execute(_SELECT_PAGE, (after_id, limit))
+            return TodoBatch.from_rows(rows)
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        # Filters, sort and keyset run in SQL; whole rows are read (the fields
+        # projection only trims the response, a local read gains little from it)
+        with self._pool.connection() as conn:
+            rows = conn.execute(_find_statement(query, after is not None), _find_parameters(query, limit, after))
+            return TodoBatch.from_rows(rows)
+
+    # --- Writes (each in its own transaction) ---
+    def add(self, todo: Todo) -> Todo:
+        with self._pool.connection() as conn, conn:
+            row = conn.execute(_INSERT, (todo.task,)).fetchone()
+        todo.id = str(row['id'])
+        todo.is_complete = bool(row['is_complete'])
+        return todo
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        with self._pool.connection() as conn, conn:
+            row = conn.execute(_UPDATE_STATUS, (int(is_complete), todo_id)).fetchone()
+        if row is None:
+            raise TodoNotFoundError(todo_id)
+        return _to_entity(row)
+
+    def delete(self, todo_id: str) -> bool:
+        with self._pool.connection() as conn, conn:
+            return conn.execute(_DELETE, (todo_id,)).fetchone() is not None
+
+    # --- Bulk operations: one transaction per call ---
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        with self._pool.connection() as conn, conn:
+            for chunk in _chunks(todos):
+                sql = (f"INSERT INTO todos (task) VALUES {','.join(['(?)'] * len(chunk))} "
+                       "RETURNING id, task, is_complete")
+                # RETURNING order is unspecified, but AUTOINCREMENT ids follow VALUES order
+                rows = sorted(conn.execute(sql, [todo.task for todo in chunk]), key=lambda row: row['id'])
+                for todo, row in zip(chunk, rows):
+                    todo.id = str(row['id'])
+                    todo.is_complete = bool(row['is_complete'])
+        return todos
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        updated = []
+        with self._pool.connection() as conn, conn:
+            for chunk in _chunks(todo_ids):
+                sql = (f"UPDATE todos SET is_complete = ? WHERE id IN ({_placeholders(len(chunk))}) "
+                       "RETURNING id, task, is_complete")
+                updated.extend(_to_entity(row) for row in conn.execute(sql, [int(is_complete), *chunk]))
+        return updated
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        deleted = []
+        with self._pool.connection() as conn, conn:
+            for chunk in _chunks(todo_ids):
+                sql = f"DELETE FROM todos WHERE id IN ({_placeholders(len(chunk))}) RETURNING id"
+                deleted.extend(str(row['id']) for row in conn.execute(sql, chunk))
+        return deleted
@@ -1,38 +1,131 @@
 # src/infrastructure/repositories/supabase_repo.py
 
-from typing import List
-from supabase import Client
+from typing import TYPE_CHECKING, List, Optional, Sequence
+if TYPE_CHECKING:
+    # Only needed for type hints; importing the SDK eagerly slows every cold start
+    from supabase import Client
 from ...application.interfaces import ITodoRepository
-from ...domain.entities import Todo
-from ...domain.exceptions import TodoNotFoundError # NEW
+from ...domain.entities import Todo, TodoBatch
+from ...domain.exceptions import InvalidInputError, TodoNotFoundError # NEW
+from ...domain.query import FIELDS, KeysetPosition, TodoQuery
+
+
+def _like_pattern(substring: str) -> str:
+    """A `%substring%` pattern that matches the text literally (LIKE wildcards escaped)."""
+    escaped = substring.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+def _regex_pattern(substring: str) -> str:
+    """A POSIX regex that matches the text literally (every non-alphanumeric character escaped)."""
+    return ''.join(char if char.isalnum() else '\\' + char for char in substring)
+
+
+# PostgREST answers these with a 4xx (see its SQLSTATE to HTTP status table): the request was
+# wrong, the backend is fine. Class 22 is bad data (e.g. `id=gt.abc`), 23 a constraint violation,
+# 42 a bad reference, P0001 a raised exception, PGRST1xx/2xx malformed requests.
+_CLIENT_ERROR_CODES = ('22', '23', '42', 'P0001', 'PGRST1', 'PGRST2')
+
+
+def _is_client_error(error: Exception) -> bool:
+    code = str(getattr(error, 'code', None) or '')
+    if code.isdecimal():
+        # No JSON error body: postgrest-py reports the HTTP status instead
+        return 400 <= int(code) < 500
+    return code.startswith(_CLIENT_ERROR_CODES)
+
+
+def _execute(request):
+    """
+    Executes a PostgREST request. A 4xx answer is an answer about the request,
+    not a backend fault: it becomes InvalidInputError, which callers (and the
+    backend guard) neither retry nor count against the circuit breaker.
+    """
+    try:
+        return request.execute()
+    except Exception as e:
+        from postgrest.exceptions import APIError   # Imported on the error path only (cold starts)
+        if isinstance(e, APIError) and _is_client_error(e):
+            raise InvalidInputError(f"The storage backend rejected the request: {e.message or e.code}") from e
+        raise
+
+
+def _filter_value(column: str, value) -> str:
+    """Formats a value for a PostgREST filter, quoting text so commas and parentheses are safe."""
+    if column == 'is_complete':
+        return 'true' if value else 'false'
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
 
 class SupabaseTodoRepository(ITodoRepository):
-    """Concrete implementation of ITodoRepository using Supabase."""
+    """
+    Concrete implementation of ITodoRepository using Supabase.
+    Accepts a supabase Client or a bare postgrest client: only `.table()` is used.
+    """
     
-    def __init__(self, supabase_client: Client):
+    def __init__(self, supabase_client: 'Client'):
         self.client = supabase_client
         self.table = 'todos' # Hardcoded table name
 
-    def get_all(self) -> List[Todo]:
+    def get_all(self) -> Sequence[Todo]:
         # Supabase API call
-        response = self.client.table(self.table).select('id, task, is_complete').execute()
+        response = _execute(self.client.table(self.table).select('id, task, is_complete'))
         
-        # Mapping: Convert Supabase dicts to Domain Entities
-        return [
-            Todo(
-                id=str(item['id']), 
-                task=item['task'], 
-                is_complete=item['is_complete']
-            ) 
-            for item in response.data
-        ]
+        # Mapping: Convert Supabase dicts straight into columns (no Todo per row)
+        return TodoBatch.from_rows(response.data)
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        # Keyset pagination: ordered by the primary key, so each page is an index range scan
+        query = self.client.table(self.table)\
+            .select('id, task, is_complete')\
+            .order('id')
+        if after_id is not None:
+            query = query.gt('id', after_id)
+        response = _execute(query.limit(limit))
+
+        return TodoBatch.from_rows(response.data)
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        # Push everything down: PostgREST filters, orders and projects, so only matching rows
+        # (and only the columns the client asked for) leave the database
+        columns = query.columns()
+        request = self.client.table(self.table).select(', '.join(columns))
+        if query.is_complete is not None:
+            request = request.eq('is_complete', 'true' if query.is_complete else 'false')
+        if query.task_contains is not None:
+            if '*' in query.task_contains:
+                # PostgREST turns every `*` of a like pattern into `%`, escaped or not: match a literal regex instead
+                request = request.filter('task', 'imatch', _regex_pattern(query.task_contains))
+            else:
+                request = request.ilike('task', _like_pattern(query.task_contains))
+
+        # Keyset pagination on (sort value, id), in the query's direction
+        operator = 'lt' if query.descending else 'gt'
+        if after is not None:
+            after_value, after_id = after
+            if query.sort == 'id':
+                request = getattr(request, operator)('id', after_id)
+            else:
+                value = _filter_value(query.sort, after_value)
+                request = request.or_(
+                    f"{query.sort}.{operator}.{value},"
+                    f"and({query.sort}.eq.{value},id.{operator}.{_filter_value('id', after_id)})"
+                )
+        request = request.order(query.sort, desc=query.descending)
+        if query.sort != 'id':
+            request = request.order('id', desc=query.descending)
+        response = _execute(request.limit(limit))
+
+        if len(columns) == len(FIELDS):
+            return TodoBatch.from_rows(response.data)
+        return TodoBatch.from_partial_rows(response.data)
 
     def add(self, todo: Todo) -> Todo:
         # Data to insert (only task is needed, id/is_complete handled by Supabase)
         data = {'task': todo.task}
         
         # Supabase API call (insert)
-        response = self.client.table(self.table).insert(data).execute()
+        response = _execute(self.client.table(self.table).insert(data))
         
         # Mapping: Use the returned data to update the original entity (with the generated ID)
         if response.data:
@@ -45,10 +138,11 @@ class SupabaseTodoRepository(ITodoRepository):
     # --- New Method: Update Status ---
     def update_status(self, todo_id: str, is_complete: bool) -> Todo:
         # Supabase API call (update a row matching the ID)
-        response = self.client.table(self.table)\
-            .update({'is_complete': is_complete})\
-            .eq('id', todo_id)\
-            .execute()
+        response = _execute(
+            self.client.table(self.table)
+            .update({'is_complete': is_complete})
+            .eq('id', todo_id)
+        )
         
         # If successful, map the returned data to a Todo entity
         if response.data:
@@ -63,11 +157,63 @@ class SupabaseTodoRepository(ITodoRepository):
 
     def delete(self, todo_id: str) -> bool:
         # Supabase API call (delete a row matching the ID)
-        response = self.client.table(self.table)\
-            .delete()\
-            .eq('id', todo_id)\
-            .execute()
+        response = _execute(
+            self.client.table(self.table)
+            .delete()
+            .eq('id', todo_id)
+        )
         
         # Supabase returns the deleted row in 'data'. If data is present, deletion was successful.
         return bool(response.data)
-    
\ No newline at end of file
+    
+
+    # --- Bulk operations: one PostgREST request per call ---
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        if not todos:
+            return []
+
+        # Supabase API call (a single multi-row insert)
+        response = _execute(
+            self.client.table(self.table)
+            .insert([{'task': todo.task} for todo in todos])
+        )
+
+        # PostgREST returns the inserted rows in payload order
+        for todo, new_data in zip(todos, response.data):
+            todo.id = str(new_data['id'])
+            todo.is_complete = new_data['is_complete']
+        return todos
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        if not todo_ids:
+            return []
+
+        # Supabase API call (update every row whose ID is in the list)
+        response = _execute(
+            self.client.table(self.table)
+            .update({'is_complete': is_complete})
+            .in_('id', todo_ids)
+        )
+
+        return [
+            Todo(
+                id=str(data['id']), 
+                task=data['task'], 
+                is_complete=data['is_complete']
+            ) 
+            for data in response.data
+        ]
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        if not todo_ids:
+            return []
+
+        # Supabase API call (delete every row whose ID is in the list)
+        response = _execute(
+            self.client.table(self.table)
+            .delete()
+            .in_('id', todo_ids)
+        )
+
+        # Only rows that actually existed come back in 'data'
+        return [str(data['id']) for data in response.data]
@@ -0,0 +1,91 @@
+# src/infrastructure/repositories/versioned_repo.py
+
+import time
+import uuid
+from typing import Callable, Iterable, List, Optional
+from ...application.interfaces import ITodoRepository
+from ...domain.entities import ChangeSet, Todo
+from ...domain.exceptions import TodoNotFoundError
+from ..change_log import ChangeLog
+from .decorator import TodoRepositoryDecorator
+
+
+class VersionedTodoRepository(TodoRepositoryDecorator):
+    """
+    Maintains a collection version that changes on every write made through it,
+    so HTTP validators (ETags) can be derived without reading or hashing rows.
+
+    The version is process-local: a random epoch distinguishes processes, and the
+    current `max_age_seconds` window is folded in so that writes made by *other*
+    processes become visible to revalidating clients within that window.
+
+    It also records every write in a bounded ChangeLog for delta sync and push.
+    Writes made by other processes never appear in this log, so delta sync is
+    only complete when a single process serves the API (see gunicorn.conf.py).
+    """
+
+    def __init__(self, inner: ITodoRepository, max_age_seconds: float = 10.0,
+                 clock: Callable[[], float] = time.time, max_changes: int = 10000):
+        super().__init__(inner)
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._epoch = uuid.uuid4().hex[:8]
+        self.change_log = ChangeLog(max_changes=max_changes)
+
+    def add_change_listener(self, listener: Callable[[ChangeSet], None]) -> None:
+        """Registers `listener` to be called with the ChangeSet of every later write."""
+        self.change_log.add_listener(listener)
+
+    def get_version(self) -> Optional[str]:
+        window = int(self._clock() // self.max_age_seconds) if self.max_age_seconds > 0 else 0
+        return f"{self._epoch}-{self.change_log.seq}-{window}"
+
+    def get_changes(self, since: Optional[int]) -> Optional[ChangeSet]:
+        return self.change_log.get_changes(since)
+
+    def _record(self, upserted: Iterable[Todo] = (), deleted_ids: Iterable[str] = ()) -> None:
+        self.change_log.record(upserted, deleted_ids)
+
+    def _write(self, operation: Callable):
+        try:
+            return operation()
+        except TodoNotFoundError:
+            # Nothing was written, so the log stays replayable (the version still moves on)
+            self._record()
+            raise
+        except Exception:
+            # The write may still have reached the backend: new version, and
+            # no position from before it can be replayed reliably
+            self.change_log.invalidate()
+            raise
+
+    # --- Writes ---
+    def add(self, todo: Todo) -> Todo:
+        created = self._write(lambda: self.inner.add(todo))
+        self._record(upserted=[created])
+        return created
+
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        created = self._write(lambda: self.inner.add_many(todos))
+        self._record(upserted=created)
+        return created
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        updated = self._write(lambda: self.inner.update_status(todo_id, is_complete))
+        self._record(upserted=[updated])
+        return updated
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        updated = self._write(lambda: self.inner.update_status_many(todo_ids, is_complete))
+        self._record(upserted=updated)
+        return updated
+
+    def delete(self, todo_id: str) -> bool:
+        deleted = self._write(lambda: self.inner.delete(todo_id))
+        self._record(deleted_ids=[todo_id] if deleted else [])
+        return deleted
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        deleted_ids = self._write(lambda: self.inner.delete_many(todo_ids))
+        self._record(deleted_ids=deleted_ids)
+        return deleted_ids
@@ -0,0 +1,244 @@
+# src/infrastructure/repositories/write_behind_repo.py
+
+import atexit
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from ...application.interfaces import ITodoRepository
+from ...domain.entities import Todo, TodoBatch
+from ...domain.query import KeysetPosition, TodoQuery
+from .decorator import TodoRepositoryDecorator
+
+# Queues still open at interpreter exit: one atexit hook flushes them all. Held weakly,
+# so a queue nobody closed can still be garbage collected.
+_open_queues: 'weakref.WeakSet[WriteBehindTodoRepository]' = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_queues() -> None:
+    for queue in list(_open_queues):
+        queue.close()
+
+
+class WriteBehindTodoRepository(TodoRepositoryDecorator):
+    """
+    Coalesces status updates and writes them behind the caller's back.
+
+    update_status only records the latest status per todo ID; a background
+    thread flushes whatever accumulated during `window_seconds` as at most two
+    bulk updates (one per status), so a burst of toggles on the same rows
+    costs a couple of round trips instead of one each. Reads overlay the
+    pending statuses, which keeps read-your-writes within this process.
+
+    Trade-offs: a deferred update can no longer report a missing row, so only
+    rows whose task is known are deferred: the last `max_known_tasks` rows
+    read as a page or written through this layer. Any other ID is written
+    synchronously, which returns its task and still raises TodoNotFoundError.
+    Pending writes live in memory until flushed. Call close() to flush on
+    shutdown (queues still open at exit are closed by an atexit hook); when
+    `max_pending` IDs are queued the caller flushes inline.
+    """
+
+    def __init__(self, inner: ITodoRepository, window_seconds: float = 0.05, max_pending: int = 1000,
+                 max_known_tasks: int = 10000):
+        super().__init__(inner)
+        self.window_seconds = window_seconds
+        self.max_pending = max_pending
+        self.max_known_tasks = max_known_tasks
+        self._pending: 'OrderedDict[str, bool]' = OrderedDict()
+        self._in_flight: Dict[str, bool] = {}   # Taken by a flush that has not reached the backend yet
+        # ID -> task of recently seen rows (least recently seen first), to answer deferred updates
+        self._tasks: 'OrderedDict[str, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()     # One flush (or synchronous status write) at a time
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {'deferred': 0, 'coalesced': 0, 'flushes': 0, 'flushed_rows': 0, 'failed_flushes': 0}
+        _open_queues.add(self)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, pending=len(self._pending))
+
+    # --- Reads (with pending statuses applied) ---
+    def get_all(self) -> Sequence[Todo]:
+        # Full-table reads (exports, index rebuilds) are not remembered: only pages the UI shows are
+        return self._overlay(self.inner.get_all(), remember=False)
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> Sequence[Todo]:
+        return self._overlay(self.inner.get_page(limit, after_id))
+
+    def find_page(self, query: TodoQuery, limit: int, after: Optional[KeysetPosition] = None) -> Sequence[Todo]:
+        # Pending statuses can move rows in or out of a filtered/sorted page: write them first
+        self.flush()
+        return self.inner.find_page(query, limit, after)
+
+    def _overlay(self, todos: Sequence[Todo], remember: bool = True) -> Sequence[Todo]:
+        with self._lock:
+            if remember:
+                if isinstance(todos, TodoBatch):
+                    self._remember(zip(todos.ids, todos.tasks))
+                else:
+                    self._remember((todo.id, todo.task) for todo in todos)
+            if not self._pending and not self._in_flight:
+                return todos
+            overlay = dict(self._in_flight)
+            overlay.update(self._pending)
+
+        if isinstance(todos, TodoBatch):
+            completed = bytearray(todos.completed)
+            for index, todo_id in enumerate(todos.ids):
+                status = overlay.get(todo_id)
+                if status is not None:
+                    completed[index] = 1 if status else 0
+            return TodoBatch(todos.ids, todos.tasks, completed)
+        return [
+            Todo(id=todo.id, task=todo.task, is_complete=overlay[todo.id]) if todo.id in overlay else todo
+            for todo in todos
+        ]
+
+    # --- Writes ---
+    def add(self, todo: Todo) -> Todo:
+        created = self.inner.add(todo)
+        with self._lock:
+            self._remember([(created.id, created.task)])
+        return created
+
+    def add_many(self, todos: List[Todo]) -> List[Todo]:
+        created = self.inner.add_many(todos)
+        with self._lock:
+            self._remember((todo.id, todo.task) for todo in created)
+        return created
+
+    def update_status(self, todo_id: str, is_complete: bool) -> Todo:
+        with self._lock:
+            task = self._tasks.get(todo_id)
+            # Decided once, under the lock: close() may run concurrently
+            deferred = task is not None and not self._closed
+            if deferred:
+                if todo_id in self._pending:
+                    self._stats['coalesced'] += 1
+                self._pending[todo_id] = is_complete
+                self._stats['deferred'] += 1
+                must_flush = len(self._pending) >= self.max_pending
+                self._ensure_worker()
+                self._wake.set()
+        if not deferred:
+            # Unknown row: write through, which also tells us whether it exists
+            updated = self._write_through(lambda: self.inner.update_status(todo_id, is_complete), [todo_id])
+            with self._lock:
+                self._remember([(updated.id, updated.task)])
+            return updated
+        if must_flush:
+            # Queue is full: apply backpressure by flushing on the caller's thread
+            try:
+                self.flush()
+            except Exception:
+                pass  # Already logged and re-queued (this update included): the worker retries it
+        return Todo(id=todo_id, task=task, is_complete=is_complete)
+
+    def update_status_many(self, todo_ids: List[str], is_complete: bool) -> List[Todo]:
+        updated = self._write_through(lambda: self.inner.update_status_many(todo_ids, is_complete), todo_ids)
+        with self._lock:
+            self._remember((todo.id, todo.task) for todo in updated)
+        return updated
+
+    def delete(self, todo_id: str) -> bool:
+        deleted = self._write_through(lambda: self.inner.delete(todo_id), [todo_id])
+        with self._lock:
+            self._tasks.pop(todo_id, None)
+        return deleted
+
+    def delete_many(self, todo_ids: List[str]) -> List[str]:
+        deleted = self._write_through(lambda: self.inner.delete_many(todo_ids), todo_ids)
+        with self._lock:
+            for todo_id in todo_ids:
+                self._tasks.pop(todo_id, None)
+        return deleted
+
+    def _remember(self, rows: Iterable[Tuple[str, str]]) -> None:
+        """Records (ID, task) pairs as most recently seen, evicting the oldest beyond the bound (lock held)."""
+        tasks = self._tasks
+        for todo_id, task in rows:
+            tasks[todo_id] = task
+            tasks.move_to_end(todo_id)
+        while len(tasks) > self.max_known_tasks:
+            tasks.popitem(last=False)
+
+    def _write_through(self, write, todo_ids: List[str]):
+        """Runs a synchronous write that supersedes any pending status for `todo_ids`."""
+        # Holding the flush lock keeps an in-flight flush from landing after this write
+        with self._flush_lock:
+            with self._lock:
+                for todo_id in todo_ids:
+                    self._pending.pop(todo_id, None)
+            return write()
+
+    # --- Flushing ---
+    def flush(self) -> None:
+        """Writes every pending status to the wrapped repository now."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, OrderedDict()
+                self._in_flight = dict(batch)
+            try:
+                by_status: Dict[bool, List[str]] = {}
+                for todo_id, is_complete in batch.items():
+                    by_status.setdefault(is_complete, []).append(todo_id)
+                for is_complete, todo_ids in by_status.items():
+                    self.inner.update_status_many(todo_ids, is_complete)
+                    with self._lock:
+                        for todo_id in todo_ids:
+                            self._in_flight.pop(todo_id, None)
+                with self._lock:
+                    self._stats['flushes'] += 1
+                    self._stats['flushed_rows'] += len(batch)
+            except Exception as e:
+                print(f"Write-behind flush failed, will retry: {e}")
+                with self._lock:
+                    self._stats['failed_flushes'] += 1
+                    # Re-queue what did not make it, unless a newer status arrived meanwhile
+                    for todo_id, is_complete in self._in_flight.items():
+                        self._pending.setdefault(todo_id, is_complete)
+                    self._wake.set()
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight = {}
+
+    def _ensure_worker(self) -> None:
+        # Started on first use (not in __init__) so that forked workers get their own thread
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='todo-write-behind', daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            # Let the window fill up; close() cuts the wait short
+            self._stop.wait(self.window_seconds)
+            try:
+                self.flush()
+            except Exception:
+                pass  # Already logged and re-queued; retried after the next window
+            with self._lock:
+                if self._pending:
+                    self._wake.set()
+
+    def close(self) -> None:
+        """Stops the background thread and flushes what is still pending."""
+        with self._lock:
+            self._closed = True
+            worker = self._worker
+        _open_queues.discard(self)
+        self._stop.set()
+        self._wake.set()
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout=max(1.0, self.window_seconds * 4))
+        self.flush()
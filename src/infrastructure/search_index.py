@@ -0,0 +1,202 @@
+# src/infrastructure/search_index.py
+
+import bisect
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from ..application.interfaces import ITodoListener, ITodoRepository, ITodoSearchIndex
+from ..domain.entities import Todo
+from ..domain.pagination import MAX_PAGE_SIZE
+
+_WORD = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased words of a task (Unicode-aware, punctuation dropped)."""
+    return _WORD.findall(text.lower())
+
+
+def _doc_id(todo_id: str) -> int:
+    # Postings hold integer IDs: smaller than strings and sorted numerically
+    return int(todo_id)
+
+
+class _Postings:
+    """
+    The index data: token -> sorted list of IDs, a sorted vocabulary (so a
+    word prefix is a bisect range) and each document's (task, is_complete).
+    Not thread-safe on its own: TodoSearchIndex guards the live instance.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, List[int]] = {}
+        self.vocabulary: List[str] = []             # Sorted tokens, for prefix ranges
+        self.docs: Dict[int, Tuple[str, bool]] = {}  # ID -> (task, is_complete)
+
+    def add_all(self, todos: Iterable[Todo]) -> None:
+        for todo in todos:
+            doc_id = _doc_id(todo.id)
+            previous = self.docs.get(doc_id)
+            if previous is not None and previous[0] != todo.task:
+                self.remove(doc_id)
+                previous = None
+            self.docs[doc_id] = (todo.task, todo.is_complete)
+            if previous is None:
+                for token in set(tokenize(todo.task)):
+                    self._add_posting(token, doc_id)
+
+    def _add_posting(self, token: str, doc_id: int) -> None:
+        postings = self.postings.get(token)
+        if postings is None:
+            self.postings[token] = [doc_id]
+            bisect.insort(self.vocabulary, token)
+            return
+        index = bisect.bisect_left(postings, doc_id)
+        if index == len(postings) or postings[index] != doc_id:
+            postings.insert(index, doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for token in set(tokenize(doc[0])):
+            postings = self.postings[token]
+            del postings[bisect.bisect_left(postings, doc_id)]
+            if not postings:
+                del self.postings[token]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, token)]
+
+    def prefix_matches(self, prefix: str) -> Set[int]:
+        vocabulary = self.vocabulary
+        matches: Set[int] = set()
+        index = bisect.bisect_left(vocabulary, prefix)
+        while index < len(vocabulary) and vocabulary[index].startswith(prefix):
+            matches.update(self.postings[vocabulary[index]])
+            index += 1
+        return matches
+
+
+class TodoSearchIndex(ITodoSearchIndex, ITodoListener):
+    """
+    In-process inverted index over task words. A query matches Todos
+    containing every query word as a prefix of one of their words
+    ("buy mi" finds "Buy milk"), without touching the database.
+
+    Built from the repository on the first search, then kept current by the
+    write use cases (it is an ITodoListener). Writes made by other processes
+    are picked up when the index is rebuilt after `max_age_seconds`. A rebuild
+    loads the table without holding the lock: searches keep using the old
+    index meanwhile, and writes that arrive during the load are replayed onto
+    the new one before it is swapped in.
+    """
+
+    def __init__(self, repository: ITodoRepository, max_age_seconds: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic, page_size: int = MAX_PAGE_SIZE):
+        self.repository = repository
+        self.max_age_seconds = max_age_seconds
+        self.page_size = page_size
+        self._clock = clock
+        self._index = _Postings()
+        self._built_at: Optional[float] = None
+        # Listener events seen while a rebuild is loading, replayed onto the new index (None: not rebuilding)
+        self._replay: Optional[List[Tuple[str, list]]] = None
+        self._lock = threading.Lock()            # Guards the live index (short critical sections only)
+        self._rebuild_lock = threading.Lock()    # One rebuild at a time
+
+    def __len__(self) -> int:
+        return len(self._index.docs)
+
+    # --- Building ---
+    def rebuild(self) -> None:
+        """Reloads every Todo from the repository, one bounded page at a time, then swaps the index in."""
+        with self._rebuild_lock:
+            self._load_and_swap()
+
+    def _load_and_swap(self) -> None:
+        with self._lock:
+            self._replay = []
+        try:
+            index = _Postings()
+            after_id = None
+            while True:
+                rows = self.repository.get_page(self.page_size, after_id)
+                index.add_all(rows)
+                if len(rows) < self.page_size:
+                    break
+                after_id = rows[-1].id
+        except Exception:
+            with self._lock:
+                self._replay = None
+            raise
+
+        with self._lock:
+            for event, items in self._replay:
+                self._apply_event(index, event, items)
+            self._index, self._replay = index, None
+            self._built_at = self._clock()
+
+    def _ensure_fresh(self) -> None:
+        built_at = self._built_at
+        if built_at is not None and self._clock() - built_at < self.max_age_seconds:
+            return
+        if built_at is None:
+            # Nothing to answer from yet: wait for the build (or do it)
+            with self._rebuild_lock:
+                if self._built_at is None:
+                    self._load_and_swap()
+        elif self._rebuild_lock.acquire(blocking=False):
+            # Stale: this search refreshes it, concurrent searches keep using the current index
+            try:
+                self._load_and_swap()
+            finally:
+                self._rebuild_lock.release()
+
+    # --- Maintenance (ITodoListener) ---
+    def todos_created(self, todos: List[Todo]) -> None:
+        self._on_event('upsert', todos)
+
+    def todos_updated(self, todos: List[Todo]) -> None:
+        self._on_event('upsert', todos)
+
+    def todos_deleted(self, todo_ids: List[str]) -> None:
+        self._on_event('delete', todo_ids)
+
+    def _on_event(self, event: str, items: list) -> None:
+        with self._lock:
+            if self._replay is not None:
+                self._replay.append((event, list(items)))
+            # Nothing to maintain until the first search builds the index
+            if self._built_at is not None:
+                self._apply_event(self._index, event, items)
+
+    @staticmethod
+    def _apply_event(index: _Postings, event: str, items: list) -> None:
+        if event == 'upsert':
+            index.add_all(items)
+        else:
+            for todo_id in items:
+                index.remove(_doc_id(todo_id))
+
+    # --- Querying ---
+    def search(self, text: str, limit: int) -> List[Todo]:
+        words = sorted(set(tokenize(text)), key=len, reverse=True)  # Longest (most selective) first
+        if not words:
+            return []
+        self._ensure_fresh()
+        with self._lock:
+            index = self._index
+            matches = index.prefix_matches(words[0])
+            for word in words[1:]:
+                if not matches:
+                    break
+                matches &= index.prefix_matches(word)
+            hits = sorted(matches)[:limit]
+            return [
+                Todo(id=str(doc_id), task=index.docs[doc_id][0], is_complete=index.docs[doc_id][1])
+                for doc_id in hits
+            ]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'documents': len(self._index.docs), 'tokens': len(self._index.vocabulary)}
@@ -0,0 +1,86 @@
+# src/infrastructure/ttl_cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+# Sentinel returned by TTLCache.get on a miss (None is a valid cached value)
+MISSING = object()
+
+class TTLCache:
+    """
+    A thread-safe, size-bounded LRU cache whose entries also expire after a TTL.
+    Keeps hit/miss/eviction counters so callers can publish cache effectiveness.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive.")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0    # entries dropped to respect max_entries
+        self.expirations = 0  # entries dropped because their TTL elapsed
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the cached value, or MISSING if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return MISSING
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def replace(self, key: Hashable, value: Any) -> None:
+        """Updates a live entry in place, keeping its expiry and LRU position."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], value)
+
+    def items(self) -> Iterable[Tuple[Hashable, Any]]:
+        """Returns a snapshot of the (key, value) pairs currently stored."""
+        with self._lock:
+            return [(key, value) for key, (_, value) in self._entries.items()]
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'size': len(self._entries),
+        }
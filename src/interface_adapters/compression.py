@@ -0,0 +1,165 @@
+# src/interface_adapters/compression.py
+
+import gzip
+import threading
+import zlib
+from typing import Dict, Iterable, Iterator, Optional
+from flask import Request, Response
+from ..infrastructure.ttl_cache import MISSING, TTLCache
+
+# Optional encoders: used when installed, otherwise gzip alone is offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Bodies worth compressing (JSON, NDJSON, text). Event streams are left alone so that
+# every event reaches the client as soon as it is written.
+COMPRESSIBLE_TYPES = ('application/json', 'application/x-ndjson', 'application/ndjson', 'application/javascript')
+
+
+class _Gzip:
+    name = 'gzip'
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        # mtime=0: identical bodies compress to identical bytes
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            # Sync flush: everything sent so far can be decoded without waiting for the next chunk
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+
+class _Brotli:
+    name = 'br'
+
+    def __init__(self, quality: int = 5):
+        self.quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self.quality)
+
+    def stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = brotli.Compressor(quality=self.quality)
+        for chunk in chunks:
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+
+
+class _Zstd:
+    name = 'zstd'
+
+    def __init__(self, level: int = 3):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = zstandard.ZstdCompressor(level=self.level).compressobj()
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        yield compressor.flush()
+
+
+def available_encoders() -> Dict[str, object]:
+    """Encoders this process can use, in server preference order (best ratio for the CPU first)."""
+    encoders = {}
+    if zstandard is not None:
+        encoders['zstd'] = _Zstd()
+    if brotli is not None:
+        encoders['br'] = _Brotli()
+    encoders['gzip'] = _Gzip()
+    return encoders
+
+
+class ResponseCompressor:
+    """
+    after_request hook that compresses JSON and text responses with the best
+    encoding the client accepts (Accept-Encoding, q-values honoured).
+
+    - Bodies under `min_size` bytes go out as they are: compressing them
+      costs more time than the bytes save.
+    - Streamed responses (exports) are compressed chunk by chunk, flushing
+      after each chunk so the client can decode rows as they arrive.
+    - Compressed bodies of responses with an ETag are cached by (ETag,
+      encoding): an unchanged list is compressed once, not on every request.
+      The ETag is then marked weak, since the bytes differ per encoding.
+    """
+
+    def __init__(self, min_size: int = 1024, cache: Optional[TTLCache] = None,
+                 encoders: Optional[Dict[str, object]] = None):
+        self.min_size = min_size
+        self.cache = cache
+        self.encoders = encoders if encoders is not None else available_encoders()
+        self._lock = threading.Lock()
+        self._stats = {'compressed': 0, 'streamed': 0, 'bytes_in': 0, 'bytes_out': 0, 'cache_hits': 0}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def negotiate(self, request: Request) -> Optional[object]:
+        """The encoder to use for this request, or None for an uncompressed body."""
+        name = request.accept_encodings.best_match(list(self.encoders))
+        return self.encoders.get(name) if name else None
+
+    def __call__(self, response: Response, request: Request) -> Response:
+        if (response.status_code < 200 or response.status_code in (204, 304)
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or not (response.mimetype in COMPRESSIBLE_TYPES or response.mimetype.startswith('text/'))
+                or response.mimetype == 'text/event-stream'):
+            return response
+
+        # The body now depends on Accept-Encoding: shared caches must key on it
+        response.vary.add('Accept-Encoding')
+        encoder = self.negotiate(request)
+        if encoder is None:
+            return response
+
+        if response.is_streamed:
+            original = response.response
+            response.response = encoder.stream(response.iter_encoded())
+            if hasattr(original, 'close'):
+                response.call_on_close(original.close)   # Still release the page generator
+            response.headers.pop('Content-Length', None)
+            response.headers['Content-Encoding'] = encoder.name
+            self._count(streamed=1)
+            return response
+
+        body = response.get_data()
+        if len(body) < self.min_size:
+            return response
+
+        etag, weak = response.get_etag()
+        key = (etag, encoder.name, len(body)) if etag and not weak else None
+        compressed = self.cache.get(key) if self.cache is not None and key else MISSING
+        if compressed is MISSING:
+            compressed = encoder.compress(body)
+            if self.cache is not None and key:
+                self.cache.set(key, compressed)
+        else:
+            self._count(cache_hits=1)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoder.name
+        if etag:
+            response.set_etag(etag, weak=True)
+        self._count(compressed=1, bytes_in=len(body), bytes_out=len(compressed))
+        return response
@@ -0,0 +1,28 @@
+# src/interface_adapters/events.py
+
+from ..domain.entities import ChangeSet
+from ..infrastructure.event_hub import EventHub
+from .serializers import change_set_to_json
+
+
+def format_sse(event: str, data: str) -> str:
+    """Frames one server-sent event (`data` must be a single line, e.g. compact JSON)."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+class TodoEventPublisher:
+    """
+    Pushes every entry of the change log to the event hub. Register it with
+    VersionedTodoRepository.add_change_listener: each write's ChangeSet is
+    serialized once, as an SSE frame in the same {"changes", "seq", "reset"}
+    shape as the delta sync endpoint, whatever the number of subscribers.
+    The seq lets clients skip frames their last sync already covered.
+    """
+
+    def __init__(self, hub: EventHub):
+        self.hub = hub
+
+    def __call__(self, change_set: ChangeSet) -> None:
+        # Nobody listening: skip the serialization
+        if self.hub.subscriber_count:
+            self.hub.publish(format_sse('change', change_set_to_json(change_set)))
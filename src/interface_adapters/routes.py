@@ -1,9 +1,29 @@
 # src/interface_adapters/routes.py
 
+import hashlib
 import json
-from flask import Blueprint, jsonify, request
-from ..domain.use_cases import GetTodosUseCase, CreateTodoUseCase
+import math
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from typing import List
+from ..domain.use_cases import (
+    GetTodosUseCase,
+    CreateTodoUseCase,
+    UpdateTodoUseCase,
+    DeleteTodoUseCase,
+    BatchCreateTodosUseCase,
+    BatchUpdateTodosUseCase,
+    BatchDeleteTodosUseCase,
+    SearchTodosUseCase,
+    GetTodoChangesUseCase
+)
+from ..domain.entities import BatchItemResult
+from .serializers import change_set_to_json, page_to_json, todos_to_json, todos_to_json_elements, todos_to_ndjson
 from ..domain.entities import Todo # To handle input validation
+from ..domain.exceptions import BackendUnavailableError, InvalidInputError, TodoNotFoundError
+from ..domain.pagination import DEFAULT_PAGE_SIZE
+from ..domain.query import TodoQuery
+from ..infrastructure.event_hub import EventHub
+from .events import format_sse
 
 # Create a Blueprint to organize routes
 todo_routes = Blueprint('todo_routes', __name__)
@@ -11,20 +31,217 @@ todo_routes = Blueprint('todo_routes', __name__)
 # NOTE: The Use Case instances must be injected or passed to these route handlers.
 # For simplicity, we define placeholders that will be initialized in api/index.py
 
+@todo_routes.errorhandler(BackendUnavailableError)
+def backend_unavailable(e: BackendUnavailableError):
+    """503 (not 500) while the storage backend is down: the request can simply be retried later."""
+    response = jsonify({"error": str(e)})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(max(1, math.ceil(e.retry_after or 0)))
+    return response
+
+
+@todo_routes.errorhandler(InvalidInputError)
+def invalid_input(e: InvalidInputError):
+    """400 for invalid input that reaches no route-level handler (e.g. a request the backend rejected)."""
+    return jsonify({"error": str(e)}), 400
+
+
+def _parse_todo_query(args) -> TodoQuery:
+    """
+    Adapts the list filters from the query string:
+    ?is_complete=true|false&task=<substring>&sort=[-]id|task|is_complete&fields=id,task,...
+    """
+    raw_is_complete = args.get('is_complete')
+    if raw_is_complete not in (None, 'true', 'false'):
+        raise InvalidInputError("'is_complete' must be 'true' or 'false'.")
+    sort = args.get('sort') or 'id'
+    descending = sort.startswith('-')
+    raw_fields = args.get('fields')
+    return TodoQuery(
+        is_complete=None if raw_is_complete is None else raw_is_complete == 'true',
+        task_contains=args.get('task') or None,
+        sort=sort[1:] if descending else sort,
+        descending=descending,
+        fields=[field.strip() for field in raw_fields.split(',')] if raw_fields else None
+    )
+
+
 @todo_routes.route('/todos', methods=['GET'])
 def get_todos_route(get_todos_uc: GetTodosUseCase):
-    """GET /api/todos - Retrieves all todos."""
+    """GET /api/todos?limit=&cursor=&is_complete=&task=&sort=&fields= - Retrieves one page of todos."""
     
-    # 1. Orchestration: Call the Use Case
-    todos = get_todos_uc.execute()
+    # 1. Adaptation: Read the paging and query parameters from the query string
+    raw_limit = request.args.get('limit', str(DEFAULT_PAGE_SIZE))
+    if not raw_limit.isdecimal():
+        return jsonify({"error": "'limit' must be a positive integer."}), 400
+    cursor = request.args.get('cursor') or None
+    try:
+        query = _parse_todo_query(request.args)
+    except InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # 2. Validation: a bad limit or cursor is a 400 whatever the client's cached tag
+    try:
+        limit = int(raw_limit)
+        page_key = get_todos_uc.page_key(limit=limit, cursor=cursor, query=query)
+    except InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # 3. Conditional GET: the ETag comes from the collection version, so an
+    #    unchanged list is answered with 304 before anything is fetched or serialized
+    etag = None
+    version = get_todos_uc.current_version()
+    if version is not None:
+        # The page's identity (limit, decoded position, filters) folded into a short header-safe digest
+        etag = f"{version}." + hashlib.blake2s(repr(page_key).encode('utf-8'), digest_size=8).hexdigest()
+        # Weak comparison (as If-None-Match specifies): compressed responses carry W/"<etag>"
+        if request.if_none_match.contains_weak(etag):
+            not_modified = Response(status=304)
+            not_modified.set_etag(etag)
+            return not_modified
+
+    # 4. Orchestration: Call the Use Case
+    try:
+        page = get_todos_uc.execute_page(limit=limit, cursor=cursor, query=query)
+    except InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
     
-    # 2. Adaptation: Convert Domain Entities to JSON response format
+    # 5. Adaptation: Serialize the page straight from the repository's columns
     # The 'id' is converted to int in Supabase but we want to ensure it's JSON-safe string here.
-    response_data = [
-        {'id': todo.id, 'task': todo.task, 'is_complete': todo.is_complete} 
-        for todo in todos
-    ]
-    return jsonify(response_data), 200
+    response = Response(page_to_json(page, query.fields), mimetype='application/json')
+    if etag is not None:
+        response.set_etag(etag)
+        # Let browsers keep the body but revalidate it on every request
+        response.headers['Cache-Control'] = 'no-cache'
+    return response, 200
+
+
+@todo_routes.route('/todos/export', methods=['GET'])
+def export_todos_route(get_todos_uc: GetTodosUseCase):
+    """
+    GET /api/todos/export - Streams every todo, page by page.
+    Sends NDJSON when the client accepts application/x-ndjson, otherwise one
+    chunked JSON array. Memory stays flat and the first rows go out as soon
+    as the first page is fetched.
+    """
+    ndjson = request.accept_mimetypes.best_match(
+        ['application/json', 'application/x-ndjson', 'application/ndjson']
+    ) in ('application/x-ndjson', 'application/ndjson')
+
+    # Fetch the first page before committing to a 200, so backend errors still get a proper status
+    pages = get_todos_uc.iter_pages()
+    try:
+        first_page = next(pages, None)
+    except BackendUnavailableError as e:
+        return backend_unavailable(e)
+    except Exception as e:
+        print(f"Error exporting todos: {e}")
+        return jsonify({"error": "Failed to export todo items."}), 500
+
+    def generate():
+        try:
+            if ndjson:
+                if first_page is not None:
+                    yield todos_to_ndjson(first_page)
+                for page in pages:
+                    yield todos_to_ndjson(page)
+                return
+
+            yield '['
+            if first_page is not None:
+                yield todos_to_json_elements(first_page)
+                for page in pages:
+                    yield ',' + todos_to_json_elements(page)
+            yield ']'
+        except Exception as e:
+            # Headers are already sent: re-raise so the server aborts the connection without
+            # the terminating chunk, and the client sees a failed transfer, not a short export
+            print(f"Error exporting todos mid-stream: {e}")
+            raise
+
+    mimetype = 'application/x-ndjson' if ndjson else 'application/json'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+
+@todo_routes.route('/todos/changes', methods=['GET'])
+def get_todo_changes_route(get_changes_uc: GetTodoChangesUseCase):
+    """
+    GET /api/todos/changes?since=<seq> - Inserts, updates and deletes after `seq`.
+    Without `since` it only returns the current seq. When `reset` is true the
+    client must reload the whole list, then sync from the returned seq.
+    The feed covers writes made through the answering process only.
+    """
+    raw_since = request.args.get('since')
+    if raw_since is not None and not raw_since.isdecimal():
+        return jsonify({"error": "'since' must be a non-negative integer."}), 400
+
+    try:
+        change_set = get_changes_uc.execute(since=int(raw_since) if raw_since is not None else None)
+    except InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+
+    response = Response(change_set_to_json(change_set), mimetype='application/json')
+    response.headers['Cache-Control'] = 'no-store'
+    return response, 200
+
+
+# Seconds between keep-alive comments on an idle event stream (keeps proxies from closing it)
+SSE_KEEPALIVE_SECONDS = 15
+
+
+@todo_routes.route('/todos/events', methods=['GET'])
+def todo_events_route(event_hub: EventHub):
+    """
+    GET /api/todos/events - Server-sent events: a `change` event, shaped like
+    the /todos/changes payload (with the write's seq), for every write made in
+    this process. A client that falls too far behind gets a `dropped` event and
+    the stream ends; EventSource then reconnects and the client resyncs via
+    /todos/changes. Each open stream holds a server thread, so subscribers are
+    capped (TODO_SSE_MAX_SUBSCRIBERS) and the rest are refused with a 503;
+    api/asgi.py serves the same stream without a thread per subscriber.
+    """
+    subscription = event_hub.subscribe()
+    if subscription is None:
+        return jsonify({"error": "Too many event stream subscribers, try again later."}), 503
+
+    def generate():
+        try:
+            # Reconnect delay for EventSource, then an initial comment so the stream opens immediately
+            yield 'retry: 3000\n: connected\n\n'
+            while True:
+                messages = subscription.next_batch(timeout=SSE_KEEPALIVE_SECONDS)
+                if messages is None:
+                    yield format_sse('dropped', '{}')
+                    return
+                yield ''.join(messages) if messages else ': keep-alive\n\n'
+        finally:
+            # Also runs when the client disconnects (the server closes the generator)
+            subscription.close()
+
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Tell reverse proxies not to buffer the stream
+    return response
+
+
+@todo_routes.route('/todos/search', methods=['GET'])
+def search_todos_route(search_todos_uc: SearchTodosUseCase):
+    """GET /api/todos/search?q=&limit= - Todos containing every word of q (prefix match), by ID."""
+    raw_limit = request.args.get('limit', '20')
+    if not raw_limit.isdecimal():
+        return jsonify({"error": "'limit' must be a positive integer."}), 400
+
+    try:
+        results = search_todos_uc.execute(text=request.args.get('q', ''), limit=int(raw_limit))
+    except InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+    except BackendUnavailableError as e:
+        return backend_unavailable(e)
+    except Exception as e:
+        print(f"Error searching todos: {e}")
+        return jsonify({"error": "Failed to search todo items."}), 500
+
+    return Response('{"items":' + todos_to_json(results) + '}', mimetype='application/json'), 200
 
 
 @todo_routes.route('/todos', methods=['POST'])
@@ -54,6 +271,8 @@ def create_todo_route(create_todo_uc: CreateTodoUseCase):
     except ValueError as e:
         # Handle Domain-level validation error
         return jsonify({"error": str(e)}), 400
+    except BackendUnavailableError as e:
+        return backend_unavailable(e)
     except Exception as e:
         # Handle unexpected errors
         print(f"Error creating todo: {e}")
@@ -81,8 +300,12 @@ def update_todo_route(update_todo_uc: UpdateTodoUseCase, todo_id: str):
         }
         return jsonify(response_data), 200
 
+    except TodoNotFoundError as e:
+        return jsonify({"error": str(e)}), 404
     except ValueError as e:
         return jsonify({"error": str(e)}), 404 # 404 Not Found if ID is invalid
+    except BackendUnavailableError as e:
+        return backend_unavailable(e)
     except Exception as e:
         print(f"Error updating todo: {e}")
         return jsonify({"error": "Failed to update todo item."}), 500
@@ -101,6 +324,93 @@ def delete_todo_route(delete_todo_uc: DeleteTodoUseCase, todo_id: str):
         else:
             return jsonify({"error": f"Todo with ID {todo_id} not found or failed to delete."}), 404
             
+    except BackendUnavailableError as e:
+        return backend_unavailable(e)
     except Exception as e:
         print(f"Error deleting todo: {e}")
-        return jsonify({"error": "Failed to delete todo item."}), 500
\ No newline at end of file
+        return jsonify({"error": "Failed to delete todo item."}), 500
+
+
+# --- Batch Routes: per-item results, one repository round trip per request ---
+
+def _batch_response(results: List[BatchItemResult]):
+    """Adapts per-item batch outcomes into a JSON response body."""
+    response_data = {'results': []}
+    for result in results:
+        item = {'ok': result.ok, 'id': result.todo_id}
+        if result.todo is not None:
+            item['todo'] = {
+                'id': result.todo.id,
+                'task': result.todo.task,
+                'is_complete': result.todo.is_complete
+            }
+        if result.error is not None:
+            item['error'] = result.error
+        response_data['results'].append(item)
+    return jsonify(response_data), 200
+
+
+@todo_routes.route('/todos:batchCreate', methods=['POST'])
+def batch_create_todos_route(batch_create_uc: BatchCreateTodosUseCase):
+    """POST /api/todos:batchCreate - Creates several todos: {"tasks": [...]}."""
+    try:
+        data = request.get_json(silent=True) or {}
+        tasks = data.get('tasks')
+        if not isinstance(tasks, list) or not all(isinstance(task, str) for task in tasks):
+            return jsonify({"error": "'tasks' must be a list of strings."}), 400
+
+        return _batch_response(batch_create_uc.execute(tasks=tasks))
+
+    except InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+    except BackendUnavailableError as e:
+        return backend_unavailable(e)
+    except Exception as e:
+        print(f"Error batch creating todos: {e}")
+        return jsonify({"error": "Failed to create todo items."}), 500
+
+
+@todo_routes.route('/todos:batchUpdate', methods=['POST'])
+def batch_update_todos_route(batch_update_uc: BatchUpdateTodosUseCase):
+    """POST /api/todos:batchUpdate - Updates statuses: {"items": [{"id": ..., "is_complete": ...}]}."""
+    try:
+        data = request.get_json(silent=True) or {}
+        items = data.get('items')
+        if not isinstance(items, list) or not all(
+            isinstance(item, dict)
+            and isinstance(item.get('id'), str)
+            and isinstance(item.get('is_complete'), bool)
+            for item in items
+        ):
+            return jsonify({"error": "'items' must be a list of {id: string, is_complete: boolean}."}), 400
+
+        updates = [(item['id'], item['is_complete']) for item in items]
+        return _batch_response(batch_update_uc.execute(updates=updates))
+
+    except InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+    except BackendUnavailableError as e:
+        return backend_unavailable(e)
+    except Exception as e:
+        print(f"Error batch updating todos: {e}")
+        return jsonify({"error": "Failed to update todo items."}), 500
+
+
+@todo_routes.route('/todos:batchDelete', methods=['POST'])
+def batch_delete_todos_route(batch_delete_uc: BatchDeleteTodosUseCase):
+    """POST /api/todos:batchDelete - Deletes several todos: {"ids": [...]}."""
+    try:
+        data = request.get_json(silent=True) or {}
+        todo_ids = data.get('ids')
+        if not isinstance(todo_ids, list) or not all(isinstance(todo_id, str) for todo_id in todo_ids):
+            return jsonify({"error": "'ids' must be a list of strings."}), 400
+
+        return _batch_response(batch_delete_uc.execute(todo_ids=todo_ids))
+
+    except InvalidInputError as e:
+        return jsonify({"error": str(e)}), 400
+    except BackendUnavailableError as e:
+        return backend_unavailable(e)
+    except Exception as e:
+        print(f"Error batch deleting todos: {e}")
+        return jsonify({"error": "Failed to delete todo items."}), 500
@@ -0,0 +1,88 @@
+# src/interface_adapters/serializers.py
+
+import json
+from json.encoder import encode_basestring_ascii
+from typing import List, Optional, Sequence
+from ..domain.entities import ChangeSet, Todo, TodoBatch, TodoPage
+
+# Hand-rolled JSON for the list endpoints: a list response is written straight
+# from the repository's columns instead of building a Todo and a dict per row
+# for jsonify. The output matches jsonify's compact, ASCII-escaped encoding.
+
+_ROW_TEMPLATE = '{"id":%s,"task":%s,"is_complete":%s}'
+_DELETED_TEMPLATE = '{"id":%s,"deleted":true}'
+
+
+def _todo_objects(todos: Sequence[Todo]) -> List[str]:
+    """Encodes each Todo as a JSON object string."""
+    encode = encode_basestring_ascii
+    if isinstance(todos, TodoBatch):
+        rows = zip(todos.ids, todos.tasks, todos.completed)
+    else:
+        rows = ((todo.id, todo.task, todo.is_complete) for todo in todos)
+    return [
+        _ROW_TEMPLATE % (encode(todo_id), encode(task), 'true' if is_complete else 'false')
+        for todo_id, task, is_complete in rows
+    ]
+
+
+def _projected_objects(todos: Sequence[Todo], fields: Sequence[str]) -> List[str]:
+    """Encodes only the requested fields of each Todo (a sparse fieldset)."""
+    encode = encode_basestring_ascii
+    if isinstance(todos, TodoBatch):
+        columns = {'id': todos.ids, 'task': todos.tasks, 'is_complete': todos.completed}
+    else:
+        columns = {
+            'id': [todo.id for todo in todos],
+            'task': [todo.task for todo in todos],
+            'is_complete': [todo.is_complete for todo in todos],
+        }
+    template = '{' + ','.join(f'"{field}":%s' for field in fields) + '}'
+    encoders = [
+        (lambda value: 'true' if value else 'false') if field == 'is_complete' else encode
+        for field in fields
+    ]
+    return [
+        template % tuple(encoder(value) for encoder, value in zip(encoders, values))
+        for values in zip(*(columns[field] for field in fields))
+    ]
+
+
+def todos_to_json(todos: Sequence[Todo]) -> str:
+    """Serializes Todos (a TodoBatch or any sequence of Todo) to a JSON array."""
+    return '[' + ','.join(_todo_objects(todos)) + ']'
+
+
+def todos_to_json_elements(todos: Sequence[Todo]) -> str:
+    """Serializes Todos as comma-separated array elements, for streaming a JSON array in chunks."""
+    return ','.join(_todo_objects(todos))
+
+
+def todos_to_ndjson(todos: Sequence[Todo]) -> str:
+    """Serializes Todos as newline-delimited JSON (one object per line)."""
+    return ''.join([line + '\n' for line in _todo_objects(todos)])
+
+
+def page_to_json(page: TodoPage, fields: Optional[Sequence[str]] = None) -> str:
+    """
+    Serializes a TodoPage to the {"items": [...], "next_cursor": ...} envelope,
+    limited to `fields` when given.
+    """
+    items = _todo_objects(page.items) if fields is None else _projected_objects(page.items, fields)
+    return '{"items":[' + ','.join(items) + '],"next_cursor":' + json.dumps(page.next_cursor) + '}'
+
+
+def change_set_to_json(change_set: ChangeSet) -> str:
+    """
+    Serializes a ChangeSet to {"changes": [...], "seq": ..., "reset": ...}.
+    Each change is the Todo's current state, or {"id": ..., "deleted": true}.
+    """
+    encode = encode_basestring_ascii
+    changes = [
+        _DELETED_TEMPLATE % encode(change.todo_id) if change.deleted
+        else _ROW_TEMPLATE % (encode(change.todo.id), encode(change.todo.task),
+                              'true' if change.todo.is_complete else 'false')
+        for change in change_set.changes
+    ]
+    return ('{"changes":[' + ','.join(changes) + '],"seq":' + json.dumps(change_set.seq)
+            + ',"reset":' + ('true' if change_set.reset else 'false') + '}')
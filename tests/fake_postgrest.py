@@ -0,0 +1,278 @@
+# tests/fake_postgrest.py
+
+"""
+A small in-memory stand-in for the Supabase/PostgREST REST API.
+
+It implements the subset of PostgREST used by the Todo repositories
+(select, filters including `or`/`and` trees, multi-column order, limit,
+insert, update, delete and `Prefer: return=representation`) on a single `todos` table, so the sync
+supabase client and the async httpx repository can be exercised end to
+end without a network connection.
+
+Latency and failures can be injected (`latency`, `delay_next`, `fail_next`)
+to exercise timeouts, retries and circuit breaking.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+TABLE_PATH = '/rest/v1/todos'
+COLUMNS = ('id', 'task', 'is_complete')
+
+
+def _coerce(column: str, raw: str):
+    """Converts a filter value from the query string to the column's type."""
+    if len(raw) >= 2 and raw[0] == raw[-1] == '"':
+        raw = re.sub(r'\\(.)', r'\1', raw[1:-1])
+    if column == 'id':
+        return int(raw)
+    if column == 'is_complete':
+        return raw == 'true'
+    return raw
+
+
+def _like_regex(pattern: str) -> 're.Pattern':
+    """Translates a (i)like pattern (`%`/`*` and `_` wildcards, backslash escapes) to a regex."""
+    parts, escaped = [], False
+    for char in pattern:
+        if escaped:
+            parts.append(re.escape(char))
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char in '%*':
+            parts.append('.*')
+        elif char == '_':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return re.compile(''.join(parts), re.IGNORECASE | re.DOTALL)
+
+
+def _split_top_level(text: str) -> List[str]:
+    """Splits `a,b(c,d),"e,f"` on the commas that are outside parentheses and quotes."""
+    parts, depth, quoted, escaped, start = [], 0, False, False, 0
+    for index, char in enumerate(text):
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        elif not quoted and depth == 0 and char == ',':
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _matches_logic(row: dict, operator: str, raw: str) -> bool:
+    """Evaluates an `or=(...)` / `and=(...)` filter tree."""
+    conditions = []
+    for part in _split_top_level(raw.strip()[1:-1]):
+        if part.startswith(('and(', 'or(')):
+            nested, _, inner = part.partition('(')
+            conditions.append(_matches_logic(row, nested, '(' + inner))
+        else:
+            column, _, expression = part.partition('.')
+            conditions.append(_matches(row, column, expression))
+    return any(conditions) if operator == 'or' else all(conditions)
+
+
+def _matches(row: dict, column: str, expression: str) -> bool:
+    operator, _, raw = expression.partition('.')
+    if operator == 'in':
+        values = [value.strip('"') for value in raw.strip('()').split(',') if value]
+        return row[column] in {_coerce(column, value) for value in values}
+    if operator in ('eq', 'is'):
+        return row[column] == _coerce(column, raw)
+    if operator == 'ilike':
+        return _like_regex(raw).fullmatch(str(row[column])) is not None
+    if operator == 'imatch':
+        return re.search(raw, str(row[column]), re.IGNORECASE) is not None
+    value = _coerce(column, raw)
+    return {
+        'gt': row[column] > value,
+        'gte': row[column] >= value,
+        'lt': row[column] < value,
+        'lte': row[column] <= value,
+        'neq': row[column] != value,
+    }[operator]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default listen backlog (5) drops connection bursts, which then wait out a SYN retransmit
+    request_queue_size = 128
+
+
+class FakePostgrest:
+    """An in-memory `todos` table served over HTTP on 127.0.0.1."""
+
+    def __init__(self):
+        self.rows: Dict[int, dict] = {}
+        self.next_id = 1
+        self.request_count = 0
+        self.latency = 0.0   # Seconds added to every request
+        self._faults: Deque[Tuple[str, float]] = deque()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    # --- Lifecycle ---
+    def start(self) -> str:
+        """Starts serving on a free port and returns the Supabase project URL."""
+        self._server = _Server(('127.0.0.1', 0), self._make_handler())
+        # A short poll interval keeps stop() (and so each test's teardown) fast
+        threading.Thread(target=self._server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        self.url = self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- Fault injection ---
+    def delay_next(self, seconds: float, count: int = 1) -> None:
+        """Delays the next `count` requests by `seconds` (on top of `latency`)."""
+        with self._lock:
+            self._faults.extend([('delay', seconds)] * count)
+
+    def fail_next(self, count: int = 1, status: int = 500) -> None:
+        """Answers the next `count` requests with an error status, without touching the table."""
+        with self._lock:
+            self._faults.extend([('fail', status)] * count)
+
+    def _next_fault(self) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            return self._faults.popleft() if self._faults else None
+
+    # --- Table operations ---
+    def seed(self, tasks: List[str]) -> None:
+        with self._lock:
+            for task in tasks:
+                self._insert({'task': task})
+
+    def _insert(self, payload: dict) -> dict:
+        row = {'id': self.next_id, 'task': payload['task'], 'is_complete': payload.get('is_complete', False)}
+        self.rows[row['id']] = row
+        self.next_id += 1
+        return row
+
+    def _select(self, params: List[tuple]) -> List[dict]:
+        rows = list(self.rows.values())
+        order, limit = None, None
+        for key, value in params:
+            if key == 'order':
+                order = value
+            elif key == 'limit':
+                limit = int(value)
+            elif key in COLUMNS:
+                rows = [row for row in rows if _matches(row, key, value)]
+            elif key in ('or', 'and'):
+                rows = [row for row in rows if _matches_logic(row, key, value)]
+        if order:
+            # Stable sorts applied from the last key to the first give a multi-column order
+            for term in reversed(order.split(',')):
+                column, _, direction = term.partition('.')
+                rows.sort(key=lambda row: row[column], reverse=direction.startswith('desc'))
+        return rows[:limit] if limit is not None else rows
+
+    @staticmethod
+    def _project(rows: List[dict], params: List[tuple]) -> List[dict]:
+        select = dict(params).get('select', '*')
+        if select == '*':
+            return [dict(row) for row in rows]
+        columns = [column.strip() for column in select.split(',')]
+        return [{column: row[column] for column in columns} for row in rows]
+
+    def handle(self, method: str, params: List[tuple], body) -> tuple:
+        """Executes one request; returns (status, rows-or-None)."""
+        with self._lock:
+            self.request_count += 1
+            if method == 'GET':
+                return 200, self._select(params)
+            if method == 'POST':
+                payloads = body if isinstance(body, list) else [body]
+                return 201, [self._insert(payload) for payload in payloads]
+            if method == 'PATCH':
+                rows = self._select(params)
+                for row in rows:
+                    row.update({key: value for key, value in body.items() if key in COLUMNS[1:]})
+                return 200, rows
+            if method == 'DELETE':
+                rows = self._select(params)
+                for row in rows:
+                    del self.rows[row['id']]
+                return 200, rows
+        return 405, None
+
+    def _make_handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps connections alive, which pooled clients rely on
+            protocol_version = 'HTTP/1.1'
+            # Send headers and body without waiting on delayed ACKs
+            disable_nagle_algorithm = True
+
+            def _dispatch(self):
+                parts = urlsplit(self.path)
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+
+                # Injected faults: sleep outside the table lock, so slow requests overlap
+                fault = fake._next_fault()
+                delay = fake.latency + (fault[1] if fault and fault[0] == 'delay' else 0.0)
+                if delay:
+                    time.sleep(delay)
+                if fault and fault[0] == 'fail':
+                    return self._reply(int(fault[1]), {'message': 'injected failure', 'code': 'XX000',
+                                                       'hint': None, 'details': None})
+                if parts.path != TABLE_PATH:
+                    return self._reply(404, {'message': 'relation does not exist'})
+
+                params = parse_qsl(parts.query, keep_blank_values=True)
+                try:
+                    status, rows = fake.handle(self.command, params, body)
+                except ValueError as e:
+                    # A filter value of the wrong type, answered like PostgreSQL's invalid_text_representation
+                    return self._reply(400, {'message': f"invalid input syntax: {e}", 'code': '22P02',
+                                             'hint': None, 'details': None})
+                if rows is None:
+                    return self._reply(status, {'message': 'unsupported'})
+                if 'return=representation' not in (self.headers.get('Prefer') or '') and self.command != 'GET':
+                    return self._reply(204 if status == 200 else status, None)
+                return self._reply(status, fake._project(rows, params))
+
+            def _reply(self, status: int, payload):
+                data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,278 @@
+# tests/test_async.py
+
+import asyncio
+import json
+import threading
+import pytest
+
+# Import the async serving path under test
+from src.domain.exceptions import InvalidInputError
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.repositories.async_resilient_repo import AsyncResilientTodoRepository
+from src.infrastructure.repositories.async_supabase_repo import (
+    AsyncSupabaseTodoRepository,
+    create_postgrest_client
+)
+from api.asgi import TodoASGIApp
+
+# Local PostgREST stand-in
+from fake_postgrest import FakePostgrest
+
+
+async def call_asgi(app, method: str, path: str, body=None, query: str = ''):
+    """Drives one HTTP request through an ASGI app and returns (status, json-or-None)."""
+    messages = [{'type': 'http.request', 'body': json.dumps(body).encode() if body is not None else b''}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query.encode()}
+    await app(scope, receive, send)
+    data = sent[1]['body']
+    return sent[0]['status'], (json.loads(data) if data and path != '/' else None)
+
+
+def test_asgi_app_crud_against_fake_postgrest():
+    """Test the full async path: ASGI app -> async use cases -> pooled httpx -> PostgREST."""
+    with FakePostgrest() as fake:
+        async def scenario():
+            app = TodoASGIApp(lambda: AsyncSupabaseTodoRepository(create_postgrest_client(fake.url, 'key')))
+
+            status, created = await call_asgi(app, 'POST', '/api/todos', {'task': 'Write async tests'})
+            assert status == 201 and created['id'] == '1'
+            for i in range(3):
+                await call_asgi(app, 'POST', '/api/todos', {'task': f'Task {i}'})
+
+            status, page = await call_asgi(app, 'GET', '/api/todos', query='limit=3')
+            assert [item['id'] for item in page['items']] == ['1', '2', '3']
+            status, page = await call_asgi(app, 'GET', '/api/todos', query=f"limit=3&cursor={page['next_cursor']}")
+            assert [item['id'] for item in page['items']] == ['4'] and page['next_cursor'] is None
+
+            status, updated = await call_asgi(app, 'PUT', '/api/todos/2', {'is_complete': True})
+            assert status == 200 and updated['is_complete'] is True
+            assert (await call_asgi(app, 'PUT', '/api/todos/99', {'is_complete': True}))[0] == 404
+            assert (await call_asgi(app, 'POST', '/api/todos', {'task': ''}))[0] == 400
+
+            assert (await call_asgi(app, 'DELETE', '/api/todos/1'))[0] == 204
+            assert (await call_asgi(app, 'DELETE', '/api/todos/1'))[0] == 404
+            await app.repository.aclose()
+
+        asyncio.run(scenario())
+        assert sorted(fake.rows) == [2, 3, 4]
+
+
+def test_async_repository_serves_concurrent_requests_on_one_pool():
+    """Test that many in-flight reads share one pooled client without errors."""
+    with FakePostgrest() as fake:
+        fake.seed([f"Task {i}" for i in range(20)])
+
+        async def scenario():
+            repo = AsyncSupabaseTodoRepository(create_postgrest_client(fake.url, 'key', max_connections=10))
+            try:
+                pages = await asyncio.gather(*(repo.get_page(5, str(i)) for i in range(50)))
+            finally:
+                await repo.aclose()
+            return pages
+
+        pages = asyncio.run(scenario())
+        assert [todo.id for todo in pages[0]] == ['1', '2', '3', '4', '5']
+        assert fake.request_count == 50
+
+
+def test_asgi_app_guards_backend_calls_and_answers_503():
+    """Test the async guard: read retries, timeouts, the circuit breaker, and its mapping to 503 + Retry-After."""
+    with FakePostgrest() as fake:
+        fake.seed(["Buy milk"])
+
+        async def scenario():
+            waits = []
+
+            async def sleep(seconds):
+                waits.append(seconds)
+
+            repo = AsyncResilientTodoRepository(
+                AsyncSupabaseTodoRepository(create_postgrest_client(fake.url, 'key')),
+                timeout_seconds=0.2, read_retries=1, backoff_seconds=0.1, sleep=sleep, jitter=lambda: 0.5,
+                breaker=CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30)
+            )
+            app = TodoASGIApp(lambda: repo)
+
+            fake.fail_next(1)
+            status, page = await call_asgi(app, 'GET', '/api/todos')
+            assert status == 200 and len(page['items']) == 1   # Retried once
+            assert waits == [0.05]
+
+            fake.delay_next(0.5)
+            assert (await call_asgi(app, 'POST', '/api/todos', {'task': 'Not retried'}))[0] == 503
+            assert repo.stats()['timeouts'] == 1
+            assert (await call_asgi(app, 'PUT', '/api/todos/99', {'is_complete': True}))[0] == 404  # An answer
+
+            # The 404 reset the failure count; two failures in a row open the circuit and the next call
+            # fails fast, with a Retry-After
+            fake.fail_next(2)
+            assert (await call_asgi(app, 'GET', '/api/todos'))[0] == 503
+            requests_before = fake.request_count
+            sent = []
+
+            async def receive():
+                return {'type': 'http.request', 'body': b''}
+
+            async def send(message):
+                sent.append(message)
+
+            await app({'type': 'http', 'method': 'GET', 'path': '/api/todos', 'query_string': b''}, receive, send)
+            assert sent[0]['status'] == 503 and dict(sent[0]['headers'])[b'retry-after'] == b'30'
+            assert fake.request_count == requests_before
+            await repo.aclose()
+
+        asyncio.run(scenario())
+
+
+def test_async_guard_answers_client_errors_without_retrying_or_tripping():
+    """Test that a PostgREST 4xx on the async path is an InvalidInputError: no retry, no breaker failure."""
+    with FakePostgrest() as fake:
+        fake.seed(["Buy milk"])
+
+        async def scenario():
+            async def sleep(seconds):
+                pass
+
+            repo = AsyncResilientTodoRepository(
+                AsyncSupabaseTodoRepository(create_postgrest_client(fake.url, 'key')),
+                read_retries=2, sleep=sleep, breaker=CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30)
+            )
+            try:
+                for _ in range(5):
+                    with pytest.raises(InvalidInputError):
+                        await repo.get_page(10, 'abc')
+                assert repo.stats()['failures'] == 0 and repo.breaker.state == CircuitBreaker.CLOSED
+                assert len(await repo.get_page(10)) == 1
+            finally:
+                await repo.aclose()
+
+        asyncio.run(scenario())
+        assert fake.request_count == 6
+
+
+class EventStreamClient:
+    """Holds one /api/todos/events request open on an ASGI app and collects what it sends."""
+
+    def __init__(self, app):
+        self.app = app
+        self.chunks = asyncio.Queue()
+        self.status = None
+        self._incoming = asyncio.Queue()
+        self._incoming.put_nowait({'type': 'http.request', 'body': b''})
+        self.task = None
+
+    async def open(self) -> str:
+        async def receive():
+            return await self._incoming.get()
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                self.status = message['status']
+            elif message.get('body'):
+                await self.chunks.put(message['body'].decode())
+
+        scope = {'type': 'http', 'method': 'GET', 'path': '/api/todos/events', 'query_string': b''}
+        self.task = asyncio.ensure_future(self.app(scope, receive, send))
+        return await self.next_chunk()
+
+    async def next_chunk(self) -> str:
+        return await asyncio.wait_for(self.chunks.get(), timeout=2)
+
+    async def next_event(self) -> str:
+        """The next chunk that is not a keep-alive comment."""
+        while (chunk := await self.next_chunk()) == ': keep-alive\n\n':
+            pass
+        return chunk
+
+    async def disconnect(self) -> None:
+        await self._incoming.put({'type': 'http.disconnect'})
+        await asyncio.wait_for(self.task, timeout=2)
+
+
+def test_asgi_event_stream_pushes_writes_to_many_subscribers_without_threads():
+    """Test /api/todos/events on the ASGI app: thousands of streams on one loop, seq'd frames, keep-alives, disconnects."""
+    with FakePostgrest() as fake:
+        async def scenario():
+            app = TodoASGIApp(lambda: AsyncSupabaseTodoRepository(create_postgrest_client(fake.url, 'key')),
+                              keepalive_seconds=0.2)
+            threads_before = threading.active_count()
+            streams = [EventStreamClient(app) for _ in range(2000)]
+            for stream in streams:
+                assert await stream.open() == 'retry: 3000\n: connected\n\n'
+            assert app.event_hub.subscriber_count == 2000
+            assert threading.active_count() <= threads_before   # Waiting streams hold no threads
+
+            status, start = await call_asgi(app, 'GET', '/api/todos/changes')
+            assert status == 200 and start['reset'] is False
+            status, created = await call_asgi(app, 'POST', '/api/todos', {'task': 'Pushed'})
+            for stream in streams:
+                frame = await stream.next_event()
+                assert frame.startswith('event: change\n')
+                assert json.loads(frame.split('data: ', 1)[1]) == {
+                    "changes": [{"id": created['id'], "task": "Pushed", "is_complete": False}],
+                    "seq": start['seq'] + 1, "reset": False
+                }
+
+            # The frame's seq is a position /changes continues from
+            status, delta = await call_asgi(app, 'GET', '/api/todos/changes', query=f"since={start['seq']}")
+            assert [change['id'] for change in delta['changes']] == [created['id']]
+            assert (await call_asgi(app, 'GET', '/api/todos/changes', query='since=-1'))[0] == 400
+
+            # Idle streams get keep-alive comments; a disconnect ends the stream and unsubscribes
+            assert await streams[0].next_chunk() == ': keep-alive\n\n'
+            for stream in streams:
+                await stream.disconnect()
+            assert app.event_hub.subscriber_count == 0
+            await app.repository.aclose()
+
+        asyncio.run(scenario())
+
+
+def test_asgi_event_stream_refuses_subscribers_beyond_the_cap():
+    """Test that streams beyond TODO_SSE_MAX_SUBSCRIBERS are refused with a 503."""
+    async def scenario():
+        app = TodoASGIApp(lambda: AsyncSupabaseTodoRepository(create_postgrest_client('http://127.0.0.1:9', 'key')),
+                          max_subscribers=1)
+        stream = EventStreamClient(app)
+        await stream.open()
+        refused = EventStreamClient(app)
+        body = await refused.open()
+        assert refused.status == 503 and 'Too many' in body
+        await stream.disconnect()
+        await app.repository.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_asgi_app_without_backend_configuration_fails_clearly(monkeypatch):
+    """Test that missing SUPABASE_URL/KEY fails lifespan startup with a message, and requests with a 503."""
+    import api.asgi
+    monkeypatch.setattr(api.asgi, 'SUPABASE_URL', None)
+
+    async def scenario():
+        app = TodoASGIApp(api.asgi._create_repository)
+        incoming = [{'type': 'lifespan.startup'}]
+        sent = []
+
+        async def receive():
+            return incoming.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await app({'type': 'lifespan'}, receive, send)
+        assert sent[0]['type'] == 'lifespan.startup.failed' and 'SUPABASE_URL' in sent[0]['message']
+
+        # Servers that skip lifespan: every request answers 503 until the backend can be wired
+        assert await call_asgi(app, 'GET', '/api/todos') == (503, {"error": "Storage backend is unavailable, try again later."})
+        assert app.repository is None
+
+    asyncio.run(scenario())
@@ -1,17 +1,23 @@
 # tests/test_domain.py
 
-from typing import List
+import base64
+import json
+from typing import List, Optional
 import pytest
 
 # Import the core Clean Architecture components
-from src.domain.entities import Todo
+from src.domain.entities import Todo, TodoPage, TodoBatch
+from src.domain.query import TodoQuery
 from src.domain.use_cases import (
     GetTodosUseCase, 
     CreateTodoUseCase, 
     UpdateTodoUseCase, 
-    DeleteTodoUseCase
+    DeleteTodoUseCase,
+    BatchCreateTodosUseCase,
+    BatchUpdateTodosUseCase,
+    BatchDeleteTodosUseCase
 )
-from src.application.interfaces import ITodoRepository
+from src.application.interfaces import ITodoRepository, ITodoListener
 from src.domain.exceptions import TodoNotFoundError, InvalidInputError # Import custom exceptions
 
 
@@ -20,38 +26,44 @@ from src.domain.exceptions import TodoNotFoundError, InvalidInputError # Import
 class MockTodoRepository(ITodoRepository):
     """
     A fake implementation of the ITodoRepository interface for testing.
-    It fulfills the contract but uses in-memory storage (a list).
+    It fulfills the contract but uses in-memory storage (a dict keyed by ID,
+    which keeps insertion order and gives O(1) lookups for update/delete).
     """
     def __init__(self):
         # In-memory storage for testing
-        self._todos = []
+        self._todos = {}
         self._next_id = 1 
 
     def get_all(self) -> List[Todo]:
-        return self._todos
+        return list(self._todos.values())
+
+    def get_page(self, limit: int, after_id: Optional[str] = None) -> List[Todo]:
+        # IDs are numeric strings handed out in increasing order, so insertion order is ID order
+        todos = self._todos.values()
+        if after_id is not None:
+            todos = [todo for todo in todos if int(todo.id) > int(after_id)]
+        return list(todos)[:limit]
     
     def add(self, todo: Todo) -> Todo:
         # Simulate ID generation and database interaction
         todo.id = str(self._next_id)
         self._next_id += 1
-        self._todos.append(todo)
+        self._todos[todo.id] = todo
         return todo
 
     def update_status(self, todo_id: str, is_complete: bool) -> Todo:
         """Finds and updates the status of a todo."""
-        for todo in self._todos:
-            if todo.id == todo_id:
-                todo.is_complete = is_complete
-                return todo
-        # Raise the specific Domain Exception if not found
-        raise TodoNotFoundError(todo_id)
+        todo = self._todos.get(todo_id)
+        if todo is None:
+            # Raise the specific Domain Exception if not found
+            raise TodoNotFoundError(todo_id)
+        todo.is_complete = is_complete
+        return todo
 
     def delete(self, todo_id: str) -> bool:
         """Deletes a todo by ID."""
-        initial_length = len(self._todos)
-        self._todos = [todo for todo in self._todos if todo.id != todo_id]
-        # Returns True if the list length changed (item was deleted)
-        return len(self._todos) < initial_length
+        # Returns True if the item existed (and was deleted)
+        return self._todos.pop(todo_id, None) is not None
 
 
 # --- Unit Tests for the Domain Entity ---
@@ -64,6 +76,19 @@ def test_todo_creation_valid():
     assert todo.is_complete is False
     assert todo.id is None
 
+def test_todo_batch_behaves_like_a_sequence_of_todos():
+    """Test that the columnar TodoBatch maps rows and materializes Todos on demand."""
+    batch = TodoBatch.from_rows([
+        {'id': 1, 'task': "A", 'is_complete': False},
+        {'id': 2, 'task': "B", 'is_complete': True},
+    ])
+
+    assert len(batch) == 2
+    assert batch.ids == ["1", "2"] and list(batch.completed) == [0, 1]
+    assert (batch[-1].id, batch[-1].task, batch[-1].is_complete) == ("2", "B", True)
+    assert [todo.task for todo in batch[:1]] == ["A"]
+    assert isinstance(batch[:1], TodoBatch)
+
 def test_todo_creation_invalid_empty_task():
     """Test that the Todo entity raises a ValueError on empty input."""
     # We use pytest.raises to assert that a specific exception is raised
@@ -149,4 +174,200 @@ def test_delete_todo_use_case_not_found():
     success = delete_uc.execute(todo_id="999")
     
     # Assert
-    assert success is False
\ No newline at end of file
+    assert success is False
+
+# --- Unit Tests for GetTodosUseCase pagination ---
+
+def test_get_todos_page_walks_all_items_with_cursor():
+    """Test that following next_cursor visits every item exactly once, in ID order."""
+    # Arrange
+    repo = MockTodoRepository()
+    create_uc = CreateTodoUseCase(repository=repo)
+    for i in range(12):
+        create_uc.execute(task=f"Task {i}")
+    get_uc = GetTodosUseCase(repository=repo)
+
+    # Act
+    seen, cursor = [], None
+    while True:
+        page = get_uc.execute_page(limit=5, cursor=cursor)
+        assert isinstance(page, TodoPage)
+        seen.extend(todo.id for todo in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    # Assert
+    assert seen == [str(i) for i in range(1, 13)]
+
+def test_get_todos_page_last_page_has_no_cursor():
+    """Test that an exactly-full final page does not advertise another page."""
+    repo = MockTodoRepository()
+    create_uc = CreateTodoUseCase(repository=repo)
+    for i in range(3):
+        create_uc.execute(task=f"Task {i}")
+
+    page = GetTodosUseCase(repository=repo).execute_page(limit=3)
+
+    assert len(page.items) == 3
+    assert page.next_cursor is None
+
+def test_get_todos_iter_pages_streams_every_item_in_bounded_pages():
+    """Test that iter_pages walks the whole list lazily, one bounded page at a time."""
+    repo = MockTodoRepository()
+    create_uc = CreateTodoUseCase(repository=repo)
+    for i in range(7):
+        create_uc.execute(task=f"Task {i}")
+
+    pages = list(GetTodosUseCase(repository=repo).iter_pages(page_size=3))
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [todo.id for page in pages for todo in page] == [str(i) for i in range(1, 8)]
+
+@pytest.mark.parametrize("limit, cursor", [(0, None), (10_000, None), (10, "not-a-cursor")])
+def test_get_todos_page_invalid_input(limit, cursor):
+    """Test that out-of-range limits and garbage cursors are rejected."""
+    get_uc = GetTodosUseCase(repository=MockTodoRepository())
+
+    with pytest.raises(InvalidInputError):
+        get_uc.execute_page(limit=limit, cursor=cursor)
+
+
+# --- Unit Tests for list queries (filters, sort, sparse fieldsets) ---
+
+def test_get_todos_page_with_query_filters_sorts_and_pages():
+    """Test that a sorted, filtered query pages through matches with keyset cursors."""
+    repo = MockTodoRepository()
+    create_uc = CreateTodoUseCase(repository=repo)
+    for task in ["buy milk", "Walk dog", "buy bread", "call mom", "Buy eggs"]:
+        create_uc.execute(task=task)
+    repo.update_status("3", True)
+    get_uc = GetTodosUseCase(repository=repo)
+
+    seen, cursor = [], None
+    while True:
+        page = get_uc.execute_page(limit=1, cursor=cursor, query=TodoQuery(task_contains="BUY", sort="task", descending=True))
+        seen.extend(todo.task for todo in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert seen == ["buy milk", "buy bread", "Buy eggs"]
+
+    open_items = get_uc.execute_page(limit=10, query=TodoQuery(is_complete=False, fields=["id"])).items
+    assert [todo.id for todo in open_items] == ["1", "2", "4", "5"]
+
+def test_get_todos_query_rejects_bad_sorts_fields_and_foreign_cursors():
+    """Test that unknown sorts/fields fail, and a cursor only works with the sort it came from."""
+    repo = MockTodoRepository()
+    for i in range(3):
+        repo.add(Todo(task=f"Task {i}"))
+    get_uc = GetTodosUseCase(repository=repo)
+
+    with pytest.raises(InvalidInputError):
+        TodoQuery(sort="created_at")
+    with pytest.raises(InvalidInputError):
+        TodoQuery(fields=["id", "password"])
+
+    cursor = get_uc.execute_page(limit=1, query=TodoQuery(sort="task")).next_cursor
+    with pytest.raises(InvalidInputError):
+        get_uc.execute_page(limit=1, cursor=cursor)
+
+
+
+def _forged_cursor(payload: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+@pytest.mark.parametrize("payload, sort", [
+    ({"id": "abc"}, None),
+    ({"id": True}, None),
+    ({"id": 1.5}, None),
+    ({"id": "1", "sort": "task", "after": 3}, "task"),
+    ({"id": "1", "sort": "-task", "after": None}, "-task"),
+    ({"id": "1", "sort": "is_complete", "after": 0}, "is_complete"),
+    ({"id": "abc", "sort": "task", "after": "x"}, "task"),
+])
+def test_get_todos_rejects_forged_cursors(payload, sort):
+    """Test that a cursor with a non-numeric ID or a sort value of the wrong type is invalid input, not a crash."""
+    repo = MockTodoRepository()
+    repo.add(Todo(task="Task"))
+    get_uc = GetTodosUseCase(repository=repo)
+    query = None
+    if sort is not None:
+        query = TodoQuery(sort=sort.lstrip('-'), descending=sort.startswith('-'))
+    with pytest.raises(InvalidInputError):
+        get_uc.execute_page(limit=1, cursor=_forged_cursor(payload), query=query)
+
+# --- Unit Tests for the Batch Use Cases ---
+
+def test_batch_create_reports_invalid_items_and_inserts_the_rest():
+    """Test that one empty task fails on its own without blocking the others."""
+    repo = MockTodoRepository()
+
+    results = BatchCreateTodosUseCase(repository=repo).execute(tasks=["A", "", "B"])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[1].error == "Task cannot be empty."
+    assert [todo.task for todo in repo.get_all()] == ["A", "B"]
+    assert results[2].todo_id == repo.get_all()[1].id
+
+def test_batch_update_groups_by_status_and_reports_missing_ids():
+    """Test that the last status per ID wins and unknown IDs are reported."""
+    repo = MockTodoRepository()
+    BatchCreateTodosUseCase(repository=repo).execute(tasks=["A", "B"])
+    calls = []
+    original = repo.update_status_many
+    repo.update_status_many = lambda ids, status: calls.append((ids, status)) or original(ids, status)
+
+    results = BatchUpdateTodosUseCase(repository=repo).execute(
+        updates=[("1", False), ("2", True), ("1", True), ("999", True)]
+    )
+
+    assert calls == [(["1", "2", "999"], True)]
+    assert [result.ok for result in results] == [True, True, True, False]
+    assert all(todo.is_complete for todo in repo.get_all())
+
+def test_batch_delete_and_size_limit():
+    """Test per-item delete results and rejection of an empty batch."""
+    repo = MockTodoRepository()
+    BatchCreateTodosUseCase(repository=repo).execute(tasks=["A", "B"])
+    delete_uc = BatchDeleteTodosUseCase(repository=repo)
+
+    results = delete_uc.execute(todo_ids=["2", "999"])
+
+    assert [(result.todo_id, result.ok) for result in results] == [("2", True), ("999", False)]
+    assert [todo.id for todo in repo.get_all()] == ["1"]
+    with pytest.raises(InvalidInputError):
+        delete_uc.execute(todo_ids=[])
+
+
+# --- Unit Tests for use case listeners ---
+
+class RecordingListener(ITodoListener):
+    """Listener that records the events it receives, in order."""
+    def __init__(self):
+        self.events = []
+
+    def todos_created(self, todos):
+        self.events.append(('created', [todo.id for todo in todos]))
+
+    def todos_deleted(self, todo_ids):
+        self.events.append(('deleted', list(todo_ids)))
+
+class FailingListener(ITodoListener):
+    """Listener whose hook always raises, as a broken index or feed would."""
+    def todos_created(self, todos):
+        raise RuntimeError("listener is down")
+
+def test_write_use_cases_notify_listeners_after_storing():
+    """Test that listeners see stored changes only, and a failing listener does not fail the write."""
+    repo = MockTodoRepository()
+    listener = RecordingListener()
+    listeners = [FailingListener(), listener]
+
+    BatchCreateTodosUseCase(repository=repo, listeners=listeners).execute(tasks=["a", "", "b"])
+    CreateTodoUseCase(repository=repo, listeners=listeners).execute(task="c")
+    BatchDeleteTodosUseCase(repository=repo, listeners=listeners).execute(todo_ids=["1", "99"])
+    DeleteTodoUseCase(repository=repo, listeners=listeners).execute(todo_id="99")
+    UpdateTodoUseCase(repository=repo, listeners=listeners).execute(todo_id="2", is_complete=True)  # No hook: ignored
+
+    assert listener.events == [('created', ['1', '2']), ('created', ['3']), ('deleted', ['1'])]
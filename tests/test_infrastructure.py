@@ -0,0 +1,86 @@
+# tests/test_infrastructure.py
+
+import threading
+import pytest
+
+# Import the infrastructure services under test (repositories are in test_repositories.py)
+from src.domain.use_cases import GetTodosUseCase
+from src.infrastructure.event_hub import EventHub
+from src.infrastructure.dependencies import Container
+
+# Reuse the in-memory fake from the domain tests
+from test_domain import MockTodoRepository
+
+
+# --- Unit Tests for EventHub ---
+
+def test_event_hub_fans_out_and_drops_slow_subscribers():
+    """Test fan-out, the subscriber limit, and that a subscriber with a full buffer is dropped."""
+    hub = EventHub(max_subscribers=2, max_buffer=2)
+    fast, slow = hub.subscribe(), hub.subscribe()
+    assert hub.subscribe() is None  # Full
+
+    assert hub.publish('a') == 2
+    assert fast.next_batch(timeout=0) == ['a']
+    hub.publish('b')
+    assert fast.next_batch(timeout=0) == ['b']
+    assert fast.next_batch(timeout=0) == []  # Timed out, nothing new
+
+    # `slow` never read: its third message overflows the buffer and it is dropped
+    assert hub.publish('c') == 1
+    assert slow.next_batch(timeout=0) is None
+    assert hub.stats() == {'subscribers': 1, 'published': 3, 'dropped': 1}
+
+    fast.close()
+    assert fast.next_batch(timeout=0) is None
+    assert hub.subscriber_count == 0
+
+
+def test_event_hub_wakes_non_blocking_subscribers():
+    """Test the wakeup callback an event loop uses instead of a thread blocked in next_batch."""
+    hub = EventHub(max_subscribers=1, max_buffer=2)
+    wakeups = []
+    subscription = hub.subscribe(wakeup=lambda: wakeups.append(1))
+    assert subscription.drain() == []  # Nothing yet, and no blocking
+
+    hub.publish('a')
+    hub.publish('b')
+    assert wakeups == [1, 1] and subscription.drain() == ['a', 'b']
+
+    # Dropping (on overflow) and closing wake the subscriber too, and drain reports the end
+    hub.publish('c'), hub.publish('d'), hub.publish('e')
+    assert subscription.drain() is None and len(wakeups) == 5
+    assert hub.subscriber_count == 0
+
+# --- Unit Tests for the dependency Container ---
+
+def test_container_builds_singletons_once_and_scoped_dependencies_per_scope():
+    """Test thread-safe singletons, per-scope instances, reset and override."""
+    container = Container()
+    built = []
+    container.singleton('repository', lambda c: built.append('repository') or MockTodoRepository())
+    container.singleton('get_todos_uc', lambda c: GetTodosUseCase(c.resolve('repository')))
+    container.scoped('request_id', lambda c: object())
+    provider = container.provider('get_todos_uc')
+
+    threads = [threading.Thread(target=provider.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert built == ['repository'] and provider.get() is provider.get()
+
+    with container.scope():
+        first = container.resolve('request_id')
+        assert container.resolve('request_id') is first
+    with container.scope():
+        assert container.resolve('request_id') is not first
+    with pytest.raises(LookupError):
+        container.resolve('request_id')
+
+    # After a reset (e.g. in a forked worker) everything is rebuilt; override injects an instance
+    container.reset()
+    assert provider.get().repository is not None and built == ['repository', 'repository']
+    fake = MockTodoRepository()
+    container.override('repository', fake)
+    assert provider.get().repository is fake
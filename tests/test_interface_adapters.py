@@ -0,0 +1,263 @@
+# tests/test_interface_adapters.py
+
+import gzip
+import json
+import zlib
+import pytest
+
+# Import the interface adapters under test
+from src.domain.entities import Todo
+from src.domain.pagination import MAX_PAGE_SIZE
+from src.infrastructure.event_hub import EventHub
+from src.infrastructure.repositories.versioned_repo import VersionedTodoRepository
+from src.infrastructure.ttl_cache import TTLCache
+from src.interface_adapters.events import TodoEventPublisher
+from src.interface_adapters.compression import ResponseCompressor
+from src.infrastructure.repositories.sqlite_repo import SqliteTodoRepository
+
+# Reuse the in-memory fake from the domain tests
+from test_domain import MockTodoRepository
+
+
+# --- Unit Tests for TodoEventPublisher ---
+
+def test_event_publisher_pushes_change_log_entries_with_their_seq():
+    """Test that every change log entry reaches subscribers as one SSE frame carrying its seq, in seq order."""
+    hub = EventHub()
+    repo = VersionedTodoRepository(MockTodoRepository())
+    repo.add_change_listener(TodoEventPublisher(hub))
+    repo.add(Todo(task="Quiet"))  # No subscribers: nothing published
+    assert hub.stats()['published'] == 0
+
+    subscription = hub.subscribe()
+    created = repo.add(Todo(task="Buy milk"))
+    repo.delete(created.id)
+    seq = repo.get_changes(None).seq
+
+    upsert, tombstone = subscription.next_batch(timeout=0)
+    assert upsert.startswith('event: change\ndata: ') and upsert.endswith('\n\n')
+    assert json.loads(upsert.split('data: ', 1)[1]) == {
+        "changes": [{"id": created.id, "task": "Buy milk", "is_complete": False}], "seq": seq - 1, "reset": False
+    }
+    assert json.loads(tombstone.split('data: ', 1)[1]) == {
+        "changes": [{"id": created.id, "deleted": True}], "seq": seq, "reset": False
+    }
+
+    # A frame's seq is a position the delta sync endpoint can continue from
+    assert repo.get_changes(seq - 1).changes[0].deleted
+
+
+# --- Unit Tests for ResponseCompressor ---
+
+def test_response_compressor_negotiates_caches_by_etag_and_streams():
+    """Test encoding negotiation, the ETag-keyed cache, the size threshold and flushed streaming."""
+    from flask import Flask, Response, request
+    app = Flask(__name__)
+    compressor = ResponseCompressor(min_size=100, cache=TTLCache(ttl_seconds=60))
+    app.after_request(lambda response: compressor(response, request))
+    body = '[' + ','.join('{"task":"Buy milk"}' for _ in range(50)) + ']'
+
+    @app.route('/list')
+    def list_route():
+        response = Response(body, mimetype='application/json')
+        response.set_etag('v1')
+        return response
+
+    @app.route('/small')
+    def small_route():
+        return Response('[]', mimetype='application/json')
+
+    @app.route('/export')
+    def export_route():
+        return Response((f'{{"row":{i}}}\n' for i in range(3)), mimetype='application/x-ndjson')
+
+    client = app.test_client()
+    first = client.get('/list', headers={'Accept-Encoding': 'br;q=0, gzip'})
+    assert first.headers['Content-Encoding'] == 'gzip' and first.headers['Vary'] == 'Accept-Encoding'
+    assert first.headers['ETag'] == 'W/"v1"'
+    assert gzip.decompress(first.data).decode() == body
+    assert client.get('/list', headers={'Accept-Encoding': 'gzip'}).data == first.data
+    assert compressor.stats()['cache_hits'] == 1
+
+    assert 'Content-Encoding' not in client.get('/list').headers                       # Not accepted
+    assert 'Content-Encoding' not in client.get('/small', headers={'Accept-Encoding': 'gzip'}).headers
+
+    # Each streamed chunk is flushed: it decodes on its own, before the stream ends
+    streamed = client.get('/export', headers={'Accept-Encoding': 'gzip'}, buffered=False)
+    chunks = list(streamed.response)
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decoder.decompress(chunks[0]) == b'{"row":0}\n'
+    assert b''.join(decoder.decompress(chunk) for chunk in chunks[1:]) == b'{"row":1}\n{"row":2}\n'
+
+
+# --- Flask routes (api/index.py wired to an in-memory SQLite backend) ---
+
+@pytest.fixture
+def wire():
+    """Wires the app around a given repository and returns a test client for it."""
+    from api.index import app, build_use_cases, container
+
+    def wire_repository(repository):
+        container.override('use_cases', build_use_cases(repository))
+        return app.test_client()
+    yield wire_repository
+    container.reset()
+
+@pytest.fixture
+def client(wire):
+    repository = SqliteTodoRepository(path=':memory:')
+    yield wire(repository)
+    repository.close()
+
+def test_batch_routes_report_per_item_results(client):
+    """Test the batch endpoints end to end: created, updated and deleted items, and per-item errors."""
+    created = client.post('/api/todos:batchCreate', json={'tasks': ["Buy milk", "", "Walk dog"]})
+    assert created.status_code == 200
+    results = created.get_json()['results']
+    assert [(item['ok'], item.get('todo', {}).get('task')) for item in results] == [
+        (True, "Buy milk"), (False, None), (True, "Walk dog")
+    ]
+    assert 'error' in results[1]
+    first_id, second_id = results[0]['id'], results[2]['id']
+
+    updated = client.post('/api/todos:batchUpdate', json={'items': [
+        {'id': first_id, 'is_complete': True}, {'id': '999', 'is_complete': True}
+    ]})
+    assert updated.status_code == 200
+    assert [(item['id'], item['ok']) for item in updated.get_json()['results']] == [(first_id, True), ('999', False)]
+    assert updated.get_json()['results'][0]['todo']['is_complete'] is True
+
+    deleted = client.post('/api/todos:batchDelete', json={'ids': [second_id, '999']})
+    assert deleted.status_code == 200
+    assert [(item['id'], item['ok']) for item in deleted.get_json()['results']] == [(second_id, True), ('999', False)]
+    assert [todo['id'] for todo in client.get('/api/todos').get_json()['items']] == [first_id]
+
+@pytest.mark.parametrize("path, body", [
+    ('/api/todos:batchCreate', {'tasks': "Buy milk"}),
+    ('/api/todos:batchCreate', {'tasks': [1, 2]}),
+    ('/api/todos:batchUpdate', {'items': [{'id': '1', 'is_complete': 'yes'}]}),
+    ('/api/todos:batchUpdate', {'items': ['1']}),
+    ('/api/todos:batchDelete', {'ids': [1]}),
+    ('/api/todos:batchDelete', None),
+])
+def test_batch_routes_reject_malformed_bodies(client, path, body):
+    """Test that a body of the wrong shape (or none at all) is a 400, not a partial batch."""
+    response = client.post(path, json=body) if body is not None else client.post(path, data='not json')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+def test_list_route_answers_matching_etags_with_304(client):
+    """Test 200 then 304 for an unchanged page (strong or weak tag), and a fresh 200 after a write."""
+    client.post('/api/todos', json={'task': "Buy milk"})
+    first = client.get('/api/todos?limit=10')
+    etag = first.headers['ETag']
+    assert first.status_code == 200 and first.headers['Cache-Control'] == 'no-cache'
+
+    assert client.get('/api/todos?limit=10', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/api/todos?limit=10', headers={'If-None-Match': 'W/' + etag}).status_code == 304
+    # Another page or filter of the same collection has its own tag
+    assert client.get('/api/todos?limit=5', headers={'If-None-Match': etag}).status_code == 200
+    assert client.get('/api/todos?limit=10&task=milk', headers={'If-None-Match': etag}).status_code == 200
+
+    client.post('/api/todos', json={'task': "Walk dog"})
+    changed = client.get('/api/todos?limit=10', headers={'If-None-Match': etag})
+    assert changed.status_code == 200 and len(changed.get_json()['items']) == 2
+
+def test_list_route_validates_the_cursor_before_matching_etags(client):
+    """Test that a bad cursor or limit is a 400 even when sent with a tag, and the tag never echoes the cursor."""
+    client.post('/api/todos:batchCreate', json={'tasks': ["Buy milk", "Walk dog"]})
+    cursor = client.get('/api/todos?limit=1').get_json()['next_cursor']
+    paged = client.get(f'/api/todos?limit=1&cursor={cursor}')
+    assert cursor not in paged.headers['ETag']
+
+    for path in ('/api/todos?limit=1&cursor=garbage', '/api/todos?limit=0'):
+        for headers in ({}, {'If-None-Match': '*'}):   # '*' matches any current tag
+            assert client.get(path, headers=headers).status_code == 400
+
+
+class FailingAfterFirstPage(SqliteTodoRepository):
+    """SqliteTodoRepository whose backend goes away after the first page of a walk."""
+    def get_page(self, limit, after_id=None):
+        if after_id is not None:
+            raise RuntimeError("connection reset")
+        return super().get_page(limit, after_id)
+
+def test_export_route_streams_json_and_ndjson(client):
+    """Test that the export is one JSON array by default and one object per line for NDJSON clients."""
+    client.post('/api/todos:batchCreate', json={'tasks': ["Buy milk", "Walk dog"]})
+
+    as_json = client.get('/api/todos/export')
+    assert as_json.status_code == 200 and as_json.mimetype == 'application/json'
+    assert [todo['task'] for todo in as_json.get_json()] == ["Buy milk", "Walk dog"]
+
+    as_ndjson = client.get('/api/todos/export', headers={'Accept': 'application/x-ndjson'})
+    assert as_ndjson.mimetype == 'application/x-ndjson'
+    assert [json.loads(line)['task'] for line in as_ndjson.data.decode().splitlines()] == ["Buy milk", "Walk dog"]
+
+def test_export_route_aborts_the_stream_when_a_later_page_fails(wire):
+    """Test that a failure after the first page breaks the transfer instead of ending it cleanly."""
+    repository = FailingAfterFirstPage(path=':memory:')
+    repository.add_many([Todo(task=f"Task {i}") for i in range(MAX_PAGE_SIZE)])  # One full page: a second is read
+    client = wire(repository)
+
+    response = client.get('/api/todos/export', headers={'Accept': 'application/x-ndjson'}, buffered=False)
+    assert response.status_code == 200
+    chunks = iter(response.response)
+    assert next(chunks).count(b'\n') == MAX_PAGE_SIZE
+    with pytest.raises(RuntimeError):
+        next(chunks)
+    repository.close()
+
+
+def test_routes_open_a_scope_for_dependencies_registered_after_binding(wire, monkeypatch):
+    """Test that a request-scoped dependency registered after the routes were bound resolves once per request."""
+    from api.index import app, build_use_cases, container
+
+    # Register on a copy of the global registry, which monkeypatch puts back afterwards
+    monkeypatch.setattr(container, '_providers', dict(container._providers))
+    container.scoped('request_probe', lambda c: object())
+    seen = []
+
+    class ProbingGetTodos:
+        """Resolves the scoped dependency twice per page read, then delegates."""
+        def __init__(self, inner):
+            self.inner = inner
+
+        def __getattr__(self, name):
+            return getattr(self.inner, name)
+
+        def execute_page(self, *args, **kwargs):
+            seen.append((container.resolve('request_probe'), container.resolve('request_probe')))
+            return self.inner.execute_page(*args, **kwargs)
+
+    repository = SqliteTodoRepository(path=':memory:')
+    try:
+        use_cases = build_use_cases(repository)
+        use_cases.get_todos_uc = ProbingGetTodos(use_cases.get_todos_uc)
+        container.override('use_cases', use_cases)
+        client = app.test_client()
+        assert client.get('/api/todos').status_code == 200
+        assert client.get('/api/todos').status_code == 200
+    finally:
+        repository.close()
+
+    (first, again), (second, _) = seen
+    assert first is again and first is not second
+
+
+def test_compression_does_not_depend_on_the_repository_wiring(monkeypatch):
+    """Test that / and /metrics answer (compressed when large) even when the storage backend cannot be wired."""
+    import api.index
+    from api.index import app, container
+
+    def unwired():
+        raise RuntimeError("SUPABASE_URL is not set")
+    monkeypatch.setattr(api.index, 'create_repository', unwired)
+    container.reset()
+    try:
+        client = app.test_client()
+        assert client.get('/').status_code == 200
+        metrics = client.get('/metrics', headers={'Accept-Encoding': 'gzip'})
+        assert metrics.status_code == 200 and metrics.headers.get('Content-Encoding') == 'gzip'
+    finally:
+        container.reset()
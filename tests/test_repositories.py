@@ -0,0 +1,630 @@
+# tests/test_repositories.py
+
+import gc
+import sqlite3
+import threading
+import time
+import weakref
+import pytest
+
+# Import the infrastructure components under test
+from src.domain.entities import Todo
+from src.domain.use_cases import CreateTodoUseCase, DeleteTodoUseCase, UpdateTodoUseCase, SearchTodosUseCase
+from src.domain.query import TodoQuery, field_value
+from src.domain.exceptions import BackendUnavailableError, InvalidInputError, TodoNotFoundError
+from src.infrastructure.repositories.caching_repo import CachingTodoRepository
+from src.infrastructure.repositories.versioned_repo import VersionedTodoRepository
+from src.infrastructure.repositories.sqlite_repo import SqliteTodoRepository, _ConnectionPool
+from src.infrastructure.repositories.supabase_repo import SupabaseTodoRepository
+from src.infrastructure.repositories.instrumented_repo import InstrumentedTodoRepository
+from src.infrastructure.repositories.write_behind_repo import WriteBehindTodoRepository
+from src.infrastructure.repositories.single_flight_repo import SingleFlightTodoRepository
+from src.infrastructure.repositories.resilient_repo import ResilientTodoRepository
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.metrics import MetricsRegistry, track_request
+from src.infrastructure.ttl_cache import TTLCache
+from src.infrastructure.search_index import TodoSearchIndex
+
+# Reuse the in-memory fake from the domain tests
+from test_domain import MockTodoRepository
+from fake_postgrest import FakePostgrest
+
+
+class CountingRepository(MockTodoRepository):
+    """MockTodoRepository that counts how often reads reach the 'backend'."""
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get_all(self):
+        self.reads += 1
+        return list(super().get_all())
+
+    def get_page(self, limit, after_id=None):
+        self.reads += 1
+        return super().get_page(limit, after_id)
+
+
+class FakeClock:
+    """A settable clock: tests move `now` forward by hand."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# --- Unit Tests for TTLCache ---
+
+def test_ttl_cache_expires_and_evicts_least_recently_used():
+    """Test TTL expiry and LRU eviction, including the published counters."""
+    clock = FakeClock()
+    cache = TTLCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1           # 'a' becomes most recently used
+    cache.set('c', 3)                    # evicts 'b'
+    clock.now = 11
+    cache.get('a')                       # expired
+
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 1, 'expirations': 1, 'size': 1}
+
+
+# --- Unit Tests for CachingTodoRepository ---
+
+def test_caching_repository_serves_repeated_reads_from_cache():
+    """Test that repeated list and page reads only hit the backend once."""
+    inner = CountingRepository()
+    inner.add(Todo(task="A"))
+    repo = CachingTodoRepository(inner, TTLCache())
+
+    for _ in range(3):
+        assert [todo.task for todo in repo.get_all()] == ["A"]
+        assert [todo.task for todo in repo.get_page(10)] == ["A"]
+
+    assert inner.reads == 2
+    assert repo.stats()['hits'] == 4
+
+def test_caching_repository_patches_and_invalidates_on_writes():
+    """Test that writes are immediately visible through the cache."""
+    inner = CountingRepository()
+    repo = CachingTodoRepository(inner, TTLCache())
+    first = repo.add(Todo(task="A"))
+    repo.get_all()
+    repo.get_page(10)
+
+    repo.update_status(first.id, True)
+    second = repo.add(Todo(task="B"))
+    repo.delete(first.id)
+
+    assert [(todo.id, todo.is_complete) for todo in repo.get_all()] == [(second.id, False)]
+    assert [todo.id for todo in repo.get_page(10)] == [second.id]
+    # get_all was patched in place; the page was re-read after the insert invalidated it
+    assert inner.reads == 3
+
+def test_caching_repository_clears_cache_only_when_a_write_fails_ambiguously():
+    """Test that a not-found answer keeps the cache, while a backend failure drops possibly-stale entries."""
+    inner = CountingRepository()
+    repo = CachingTodoRepository(inner, TTLCache())
+    repo.get_all()
+
+    with pytest.raises(TodoNotFoundError):
+        repo.update_status("999", True)
+    assert len(repo.cache) == 1
+
+    def backend_down(todo):
+        raise BackendUnavailableError("Storage backend did not answer.")
+    inner.add = backend_down
+    with pytest.raises(BackendUnavailableError):
+        repo.add(Todo(task="A"))
+    assert len(repo.cache) == 0
+
+
+def test_caching_repository_does_not_duplicate_an_insert_a_concurrent_read_already_cached():
+    """Test a list read that lands between the backend insert and the cache patch."""
+    inner = CountingRepository()
+    repo = CachingTodoRepository(inner, TTLCache())
+    backend_add = inner.add
+
+    def add_then_read(todo):
+        created = backend_add(todo)
+        repo.get_all()   # Another request's read: sees the new row and caches it
+        return created
+    inner.add = add_then_read
+
+    created = repo.add(Todo(task="A"))
+    assert [todo.id for todo in repo.get_all()] == [created.id]
+
+# --- Unit Tests for VersionedTodoRepository ---
+
+def test_versioned_repository_changes_version_on_writes_only():
+    """Test that reads keep the version stable while every write changes it."""
+    clock = FakeClock()
+    repo = VersionedTodoRepository(CachingTodoRepository(MockTodoRepository(), TTLCache()),
+                                   max_age_seconds=10, clock=clock)
+    v0 = repo.get_version()
+    repo.get_all()
+    assert repo.get_version() == v0
+
+    todo = repo.add(Todo(task="A"))
+    v1 = repo.get_version()
+    with pytest.raises(TodoNotFoundError):
+        repo.update_status("999", True)
+    v2 = repo.get_version()
+    repo.delete_many([todo.id])
+
+    assert len({v0, v1, v2, repo.get_version()}) == 4
+
+def test_versioned_repository_version_expires_after_max_age():
+    """Test that the version rolls over so other processes' writes surface eventually."""
+    clock = FakeClock()
+    repo = VersionedTodoRepository(MockTodoRepository(), max_age_seconds=10, clock=clock)
+    v0 = repo.get_version()
+
+    clock.now = 9.9
+    assert repo.get_version() == v0
+    clock.now = 10.0
+    assert repo.get_version() != v0
+
+def test_versioned_repository_replays_changes_with_tombstones():
+    """Test that the change log replays the latest state per row, and old positions get a reset."""
+    repo = VersionedTodoRepository(MockTodoRepository(), max_changes=4)
+    start = repo.get_changes(None)
+    assert 0 < start.seq < 2 ** 53 and not start.reset and start.changes == []
+
+    a, b = repo.add_many([Todo(task="a"), Todo(task="b")])
+    repo.update_status(a.id, True)
+    repo.delete(b.id)
+    delta = repo.get_changes(start.seq)
+    assert [(c.todo_id, c.deleted, c.todo and c.todo.is_complete) for c in delta.changes] == [
+        (a.id, False, True), (b.id, True, None)
+    ]
+    assert repo.get_changes(delta.seq).changes == []
+
+    # Positions older than the retained log, or unknown to this process, must reload
+    repo.add_many([Todo(task="c"), Todo(task="d")])
+    assert repo.get_changes(start.seq).reset
+    assert repo.get_changes(delta.seq + 10).reset
+    assert [c.todo.task for c in repo.get_changes(delta.seq).changes] == ["c", "d"]
+
+def test_versioned_repository_resets_positions_issued_by_another_process(tmp_path):
+    """Test that a seq from another process's log is never replayed against this one (one shared database)."""
+    path = str(tmp_path / "todos.db")
+    first = VersionedTodoRepository(SqliteTodoRepository(path=path))
+    second = VersionedTodoRepository(SqliteTodoRepository(path=path))
+    first.add(Todo(task="A"))
+    first_position = first.get_changes(None).seq
+    second_position = second.get_changes(None).seq
+
+    second.add(Todo(task="B"))
+    # Each log only knows its own writes: a foreign position must reload the full list
+    assert first.get_changes(second_position).reset
+    assert second.get_changes(first_position).reset
+    assert [c.todo.task for c in second.get_changes(second_position).changes] == ["B"]
+    first.inner.close()
+    second.inner.close()
+
+
+# --- Unit Tests for InstrumentedTodoRepository ---
+
+def test_instrumented_repository_counts_round_trips_per_endpoint():
+    """Test that backend calls are counted per endpoint and summed into Server-Timing."""
+    registry = MetricsRegistry()
+    repo = InstrumentedTodoRepository(MockTodoRepository(), registry)
+
+    with track_request('create_todo_route') as timings:
+        repo.add(Todo(id=None, task="a"))
+        with pytest.raises(TodoNotFoundError):
+            repo.update_status("missing", True)
+    repo.get_all()  # Outside of a request
+
+    calls = registry.counter('todo_backend_round_trips_total', '')
+    assert calls.value('create_todo_route', 'add') == 1
+    assert calls.value('create_todo_route', 'update_status') == 1
+    assert calls.value('none', 'get_all') == 1
+    assert registry.counter('todo_backend_errors_total', '').value('update_status') == 1
+    assert timings.spans['db'][1] == 2
+    assert timings.server_timing(0.0125).startswith('total;dur=12.50, db;dur=')
+
+    exposition = registry.render()
+    assert 'todo_backend_round_trips_total{endpoint="create_todo_route",operation="add"} 1' in exposition
+    assert 'todo_backend_call_duration_seconds_bucket{operation="get_all",le="+Inf"} 1' in exposition
+
+
+# --- Unit Tests for SingleFlightTodoRepository ---
+
+class BlockingRepository(CountingRepository):
+    """CountingRepository whose reads wait until the test releases them."""
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def get_all(self):
+        self.release.wait(timeout=5)
+        return super().get_all()
+
+
+def test_single_flight_repository_collapses_concurrent_identical_reads():
+    """Test that concurrent identical reads share one backend call, but never across a write."""
+    backend = BlockingRepository()
+    backend.add(Todo(task="a"))
+    repo = SingleFlightTodoRepository(backend)
+
+    results = []
+    readers = [threading.Thread(target=lambda: results.append(repo.get_all())) for _ in range(5)]
+    for reader in readers:
+        reader.start()
+    # Wait until every reader has either started or joined the flight
+    deadline = time.monotonic() + 5
+    while repo.stats()['calls'] + repo.stats()['collapsed'] < 5 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    backend.release.set()
+    for reader in readers:
+        reader.join()
+
+    assert backend.reads == 1
+    assert repo.stats() == {'calls': 1, 'collapsed': 4, 'in_flight': 0}
+    assert [[t.task for t in todos] for todos in results] == [["a"]] * 5
+    assert len({id(todos) for todos in results}) == 5  # Each caller got its own list
+
+    # A read after a write never reuses an earlier flight
+    repo.add(Todo(task="b"))
+    assert [t.task for t in repo.get_all()] == ["a", "b"]
+    assert backend.reads == 2
+
+
+# --- Unit Tests for WriteBehindTodoRepository ---
+
+class BulkWriteRecorder(MockTodoRepository):
+    """MockTodoRepository that records every bulk status write it receives."""
+    def __init__(self):
+        super().__init__()
+        self.bulk_writes = []
+
+    def update_status_many(self, todo_ids, is_complete):
+        self.bulk_writes.append((sorted(todo_ids), is_complete))
+        return super().update_status_many(todo_ids, is_complete)
+
+
+def test_write_behind_repository_coalesces_toggles_into_bulk_writes():
+    """Test that repeated toggles are coalesced, visible to reads, and flushed in bulk on close."""
+    backend = BulkWriteRecorder()
+    first, second = backend.add(Todo(task="a")), backend.add(Todo(task="b"))
+    repo = WriteBehindTodoRepository(backend, window_seconds=60)
+    repo.get_page(10)  # Learns the tasks, so updates can be deferred
+
+    for is_complete in (True, False, True):
+        assert repo.update_status(first.id, is_complete).is_complete == is_complete
+    repo.update_status(second.id, False)
+
+    # Nothing written yet, but reads already see the pending statuses
+    assert backend.bulk_writes == []
+    assert [t.is_complete for t in repo.get_all()] == [True, False]
+    assert repo.stats()['coalesced'] == 2
+
+    repo.close()
+    assert sorted(backend.bulk_writes) == [([first.id], True), ([second.id], False)]
+    assert [t.is_complete for t in backend.get_all()] == [True, False]
+
+
+def test_write_behind_repository_writes_unknown_ids_through_and_flushes_when_full():
+    """Test that rows never read are written synchronously and a full queue flushes inline."""
+    backend = BulkWriteRecorder()
+    todos = [backend.add(Todo(task=f"t{i}")) for i in range(3)]
+    repo = WriteBehindTodoRepository(backend, window_seconds=60, max_pending=2)
+
+    # Never seen: written synchronously, so a missing row still raises
+    assert repo.update_status(todos[0].id, True).task == "t0"
+    with pytest.raises(TodoNotFoundError):
+        repo.update_status("missing", True)
+
+    repo.get_page(10)
+    repo.update_status(todos[1].id, True)
+    repo.update_status(todos[2].id, True)  # Hits max_pending: flushed inline
+    assert backend.bulk_writes == [([todos[1].id, todos[2].id], True)]
+    assert repo.stats()['pending'] == 0
+    repo.close()
+
+def test_write_behind_repository_keeps_queued_updates_when_an_inline_flush_fails():
+    """Test that a failing inline flush neither fails the already-queued update nor loses it."""
+    backend = BulkWriteRecorder()
+    todos = [backend.add(Todo(task=f"t{i}")) for i in range(2)]
+    repo = WriteBehindTodoRepository(backend, window_seconds=60, max_pending=2)
+    repo.get_page(10)
+
+    working_update = backend.update_status_many
+    def backend_down(todo_ids, is_complete):
+        raise ConnectionError("backend down")
+    backend.update_status_many = backend_down
+
+    repo.update_status(todos[0].id, True)
+    assert repo.update_status(todos[1].id, True).is_complete is True  # Hits max_pending: the flush fails
+    assert repo.stats()['pending'] == 2 and repo.stats()['failed_flushes'] == 1
+
+    backend.update_status_many = working_update
+    repo.close()
+    assert [t.is_complete for t in backend.get_all()] == [True, True]
+
+def test_write_behind_repository_keeps_a_bounded_task_map_and_is_not_kept_alive():
+    """Test that only the last `max_known_tasks` page rows are remembered, and closed queues can be collected."""
+    backend = BulkWriteRecorder()
+    todos = backend.add_many([Todo(task=f"t{i}") for i in range(5)])
+    repo = WriteBehindTodoRepository(backend, window_seconds=60, max_known_tasks=2)
+
+    repo.get_all()  # Full-table reads are not remembered
+    assert len(repo._tasks) == 0
+    repo.get_page(5)
+    assert list(repo._tasks) == [todos[3].id, todos[4].id]
+
+    # An evicted row is written through; a remembered one is deferred
+    repo.update_status(todos[0].id, True)
+    repo.update_status(todos[4].id, True)
+    assert repo.stats()['deferred'] == 1
+    repo.close()
+    assert backend.bulk_writes == [([todos[4].id], True)]
+
+    closed = weakref.ref(repo)
+    del repo
+    gc.collect()
+    assert closed() is None
+
+
+# --- Unit Tests for SqliteTodoRepository ---
+
+@pytest.fixture(params=[':memory:', 'file'])
+def sqlite_repo(request, tmp_path):
+    path = ':memory:' if request.param == ':memory:' else str(tmp_path / "todos.db")
+    repo = SqliteTodoRepository(path=path)
+    yield repo
+    repo.close()
+
+def test_sqlite_repository_fulfils_the_contract(sqlite_repo):
+    """Test single and bulk operations, keyset pages and not-found handling."""
+    first = sqlite_repo.add(Todo(task="A"))
+    others = sqlite_repo.add_many([Todo(task="B"), Todo(task="C"), Todo(task="D")])
+    assert [todo.id for todo in others] == ["2", "3", "4"]
+
+    assert [todo.id for todo in sqlite_repo.get_page(2, first.id)] == ["2", "3"]
+    assert sqlite_repo.update_status("2", True).is_complete is True
+    assert [todo.id for todo in sqlite_repo.update_status_many(["3", "999"], True)] == ["3"]
+    with pytest.raises(TodoNotFoundError):
+        sqlite_repo.update_status("999", True)
+
+    assert sqlite_repo.delete(first.id) is True
+    assert sqlite_repo.delete(first.id) is False
+    assert sqlite_repo.delete_many(["2", "999"]) == ["2"]
+    assert [(todo.id, todo.is_complete) for todo in sqlite_repo.get_all()] == [("3", True), ("4", False)]
+
+def test_sqlite_repository_is_thread_safe(tmp_path):
+    """Test concurrent writers and readers sharing the connection pool."""
+    repo = SqliteTodoRepository(path=str(tmp_path / "todos.db"), pool_size=4)
+
+    def worker():
+        for i in range(50):
+            todo = repo.add(Todo(task=f"Task {i}"))
+            repo.update_status(todo.id, True)
+            repo.get_page(10)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    todos = repo.get_all()
+    assert len(todos) == 400 and all(todo.is_complete for todo in todos)
+    repo.close()
+
+def test_sqlite_connection_pool_survives_failed_connects():
+    """Test that a connect that fails does not use up a pool slot (later callers would block forever)."""
+    attempts = []
+
+    def flaky_connect():
+        attempts.append(1)
+        if len(attempts) <= 3:
+            raise sqlite3.OperationalError("unable to open database file")
+        return sqlite3.connect(':memory:', check_same_thread=False)
+    pool = _ConnectionPool(flaky_connect, size=1)
+
+    for _ in range(3):
+        with pytest.raises(sqlite3.OperationalError):
+            with pool.connection():
+                pass
+    with pool.connection() as conn:
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+    pool.close()
+
+
+# --- Unit Tests for TodoSearchIndex ---
+
+def test_search_index_matches_word_prefixes_and_follows_use_case_writes():
+    """Test prefix matching of every query word, and that use case writes update the index in place."""
+    backend = CountingRepository()
+    for task in ["Buy milk", "buy bread", "Call mom", "Milkshake?"]:
+        backend.add(Todo(task=task))
+    index = TodoSearchIndex(backend)
+    search = SearchTodosUseCase(index=index)
+
+    assert [t.task for t in search.execute("mil")] == ["Buy milk", "Milkshake?"]
+    assert [t.task for t in search.execute("BUY mi")] == ["Buy milk"]
+    assert search.execute("buy", limit=1)[0].id == "1"
+    assert search.execute("zzz") == []
+    reads = backend.reads
+
+    # Writes through the use cases keep the index current without reloading it
+    created = CreateTodoUseCase(backend, listeners=[index]).execute("Buy milk chocolate")
+    UpdateTodoUseCase(backend, listeners=[index]).execute("1", True)
+    DeleteTodoUseCase(backend, listeners=[index]).execute("4")
+    results = search.execute("milk")
+    assert [(t.id, t.is_complete) for t in results] == [("1", True), (created.id, False)]
+    assert backend.reads == reads
+    assert index.stats()['documents'] == 4
+
+def test_search_index_reloads_after_max_age():
+    """Test that writes the index never heard of appear after the next full reload."""
+    backend, clock = CountingRepository(), FakeClock()
+    backend.add(Todo(task="alpha"))
+    index = TodoSearchIndex(backend, max_age_seconds=60, clock=clock)
+    assert len(index.search("al", 10)) == 1
+
+    backend.add(Todo(task="alpine"))  # Written by "another instance": no listener call
+    assert len(index.search("al", 10)) == 1
+    clock.now = 60
+    assert len(index.search("al", 10)) == 2
+
+def test_search_index_rebuilds_off_the_lock_and_replays_concurrent_writes():
+    """Test that searches and writes proceed during a slow rebuild, and writes made meanwhile survive the swap."""
+    backend, clock = CountingRepository(), FakeClock()
+    backend.add(Todo(task="alpha"))
+    index = TodoSearchIndex(backend, max_age_seconds=60, clock=clock)
+    index.search("al", 10)
+
+    loading, release = threading.Event(), threading.Event()
+    read_page = backend.get_page
+
+    def slow_get_page(limit, after_id=None):
+        rows = read_page(limit, after_id)  # Read before the write below
+        loading.set()
+        release.wait(timeout=5)
+        return rows
+    backend.get_page = slow_get_page
+
+    clock.now = 60
+    rebuild = threading.Thread(target=index.search, args=("al", 10))
+    rebuild.start()
+    assert loading.wait(timeout=5)
+    assert [t.task for t in index.search("al", 10)] == ["alpha"]  # The current index still answers
+    CreateTodoUseCase(backend, listeners=[index]).execute("alpine")
+    assert len(index.search("al", 10)) == 2
+
+    release.set()
+    rebuild.join()
+    assert [t.task for t in index.search("al", 10)] == ["alpha", "alpine"]  # Replayed onto the new index
+
+
+# --- Query push-down (filters, sort, keyset, projection) in the storage backends ---
+
+@pytest.fixture(params=['sqlite', 'supabase'])
+def query_backend(request):
+    if request.param == 'sqlite':
+        repo = SqliteTodoRepository(path=':memory:')
+        yield repo
+        repo.close()
+    else:
+        from postgrest import SyncPostgrestClient
+        with FakePostgrest() as fake:
+            yield SupabaseTodoRepository(SyncPostgrestClient(f"{fake.url}/rest/v1", headers={'apikey': 'key'}))
+
+def _walk_query(repo, query, page_size=2):
+    """Follows keyset positions through every page; returns the IDs seen."""
+    seen, after = [], None
+    while True:
+        page = repo.find_page(query, page_size, after)
+        seen.extend(field_value(page, index, 'id') for index in range(len(page)))
+        if len(page) < page_size:
+            return seen
+        last = len(page) - 1
+        after = (field_value(page, last, query.sort), field_value(page, last, 'id'))
+
+@pytest.mark.parametrize("query", [
+    TodoQuery(is_complete=False),
+    TodoQuery(task_contains="a_", sort="task"),
+    TodoQuery(task_contains="%"),
+    TodoQuery(task_contains="2*"),
+    TodoQuery(sort="task", descending=True, fields=["id"]),
+    TodoQuery(sort="is_complete", fields=["is_complete"]),
+    TodoQuery(sort="id", descending=True, task_contains="BETA"),
+], ids=repr)
+def test_backends_push_down_queries_like_the_reference(query_backend, query):
+    """Test that SQL and PostgREST push-down match TodoQuery.apply, page after page."""
+    tasks = ["alpha", "a_b", "Beta", "gamma, delta", 'say "hi"', "beta", "100%", "beta", "zeta", "2*3", "243"]
+    created = query_backend.add_many([Todo(task=task) for task in tasks])
+    query_backend.update_status_many([created[1].id, created[5].id, created[6].id], True)
+
+    expected = [todo.id for todo in query.apply(query_backend.get_all(), 100)]
+    assert expected  # Every query in the list matches something
+    assert _walk_query(query_backend, query) == expected
+
+    # Projected pages still carry the requested columns
+    page = query_backend.find_page(query, 100)
+    for field in query.fields or ('id', 'task', 'is_complete'):
+        assert [field_value(page, i, field) for i in range(len(page))] == [
+            getattr(todo, field) for todo in query.apply(query_backend.get_all(), 100)
+        ]
+
+
+# --- Unit Tests for ResilientTodoRepository (fault injection in the fake) ---
+
+@pytest.fixture
+def flaky_backend():
+    from postgrest import SyncPostgrestClient
+    with FakePostgrest() as fake:
+        fake.seed(["Buy milk", "Walk dog"])
+        yield fake, SupabaseTodoRepository(SyncPostgrestClient(f"{fake.url}/rest/v1", headers={'apikey': 'key'}))
+
+def test_resilient_repository_retries_reads_only_and_opens_the_circuit(flaky_backend):
+    """Test jittered read retries, single-attempt writes and the circuit breaker's open/half-open cycle."""
+    fake, backend = flaky_backend
+    clock = FakeClock()
+    waits = []
+    repo = ResilientTodoRepository(
+        backend, timeout_seconds=2.0, read_retries=2, backoff_seconds=0.1, sleep=waits.append, jitter=lambda: 0.5,
+        breaker=CircuitBreaker(failure_threshold=3, reset_timeout_seconds=30, clock=clock)
+    )
+
+    fake.fail_next(2)
+    assert len(repo.get_page(10)) == 2          # Third attempt succeeds
+    assert waits == [0.05, 0.1]                 # Jittered exponential backoff
+
+    fake.fail_next(1)
+    with pytest.raises(BackendUnavailableError):
+        repo.add(Todo(task="Not retried"))      # Writes get a single attempt
+    with pytest.raises(TodoNotFoundError):
+        repo.update_status("999", True)         # An answer, not a failure: passes through
+
+    # Three failures in a row open the circuit: calls then fail without a request
+    fake.fail_next(3)
+    with pytest.raises(BackendUnavailableError):
+        repo.get_all()
+    requests_before = fake.request_count
+    with pytest.raises(BackendUnavailableError) as error:
+        repo.get_all()
+    assert fake.request_count == requests_before
+    assert error.value.retry_after == 30
+    assert repo.stats()['open'] == 1
+
+    # After the reset timeout one trial call goes through and closes it again
+    clock.now += 30
+    assert [todo.task for todo in repo.get_all()] == ["Buy milk", "Walk dog"]
+    assert repo.breaker.state == CircuitBreaker.CLOSED
+
+def test_resilient_repository_answers_client_errors_without_retrying_or_tripping(flaky_backend):
+    """Test that a PostgREST 4xx (here `id=gt.abc`) is an InvalidInputError: no retry, no breaker failure."""
+    fake, backend = flaky_backend
+    repo = ResilientTodoRepository(
+        backend, timeout_seconds=2.0, read_retries=2, sleep=lambda seconds: None,
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30)
+    )
+    for _ in range(5):
+        with pytest.raises(InvalidInputError):
+            repo.get_page(10, 'abc')
+    assert fake.request_count == 5                # One request each: not retried
+    assert repo.stats()['failures'] == 0 and repo.breaker.state == CircuitBreaker.CLOSED
+    assert len(repo.get_page(10)) == 2
+
+def test_resilient_repository_times_out_and_hedges_slow_reads(flaky_backend):
+    """Test that a hung call times out, and that a hedged read overtakes a slow first attempt."""
+    fake, backend = flaky_backend
+    repo = ResilientTodoRepository(backend, timeout_seconds=0.2, read_retries=0)
+    fake.delay_next(0.5)
+    with pytest.raises(BackendUnavailableError):
+        repo.get_page(10)
+    assert repo.stats()['timeouts'] == 1
+
+    # The slow first request is overtaken by its hedge
+    hedged = ResilientTodoRepository(backend, timeout_seconds=2.0, read_retries=0, hedge_after_seconds=0.05)
+    fake.delay_next(1.0)
+    started = time.perf_counter()
+    assert len(hedged.get_page(10)) == 2
+    assert time.perf_counter() - started < 0.5
+    assert hedged.stats()['hedges'] == 1 and hedged.stats()['hedge_wins'] == 1